@@ -53,7 +53,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "reusable.middleware.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "reusable.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -97,6 +99,20 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# The report buffer and the category registry version need a cache shared
+# by every process. Without REDIS_URL each process gets its own local cache.
+
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -162,6 +178,18 @@ if not DEBUG:
         "rest_framework.renderers.JSONRenderer",
     )
 
+# Render and parse JSON with orjson instead of the stdlib json module
+FAST_JSON = env.bool("FAST_JSON", default=False)
+if FAST_JSON:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "reusable.renderers.ORJSONRenderer",
+    ) + (("rest_framework.renderers.BrowsableAPIRenderer",) if DEBUG else ())
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "reusable.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
 # LOG
 if DEBUG:
     log_path = "/var/log/app/"
@@ -190,6 +218,32 @@ if DEBUG:
             },
         },
     }
+else:
+    # Keep the request timing lines of `RequestTimingMiddleware` in
+    # production, where the rest of the logging stays at Django's defaults.
+    LOGGING = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "standard": {
+                "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+            },
+        },
+        "handlers": {
+            "console": {
+                "level": "INFO",
+                "class": "logging.StreamHandler",
+                "formatter": "standard",
+            },
+        },
+        "loggers": {
+            "reusable.middleware": {
+                "handlers": ["console"],
+                "level": env("REQUEST_TIMING_LOG_LEVEL", default="INFO"),
+                "propagate": False,
+            },
+        },
+    }
 
 # JWT SETTINGS
 SIMPLE_JWT = {
@@ -234,6 +288,45 @@ ENVIRONMENT_NAME = env.str("ENVIRONMENT_NAME", default="Vachaar")
 SHOW_SWAGGER = env.bool("SHOW_SWAGGER", default=False)
 IMAGE_MAX_SIZE_MB = env("IMAGE_MAX_SIZE_MB", default=10)
 ALLOWED_IMAGE_TYPES = env("ALLOWED_IMAGE_TYPES", default="jpeg, png, gif")
+IMAGE_GC_GRACE_HOURS = env.int("IMAGE_GC_GRACE_HOURS", default=24)
+IMAGE_GC_BATCH_SIZE = env.int("IMAGE_GC_BATCH_SIZE", default=500)
+# Buffered counters must be visible to the flush command, so write-behind
+# is only enabled with a shared cache. Counters below REPORT_FLUSH_THRESHOLD
+# are only written by a periodic flush, which must run alongside the app,
+# e.g. `python manage.py flush_report_counters --interval 10` (the
+# vachaar_report_flusher service in docker-compose.yml).
+REPORT_WRITE_BEHIND = bool(REDIS_URL) and env.bool(
+    "REPORT_WRITE_BEHIND", default=False
+)
+REPORT_FLUSH_THRESHOLD = env.int("REPORT_FLUSH_THRESHOLD", default=20)
+REPORT_FLUSH_BATCH_SIZE = env.int("REPORT_FLUSH_BATCH_SIZE", default=500)
+REPORT_REASON_WEIGHTS = {
+    "spam": 1,
+    "amoral": 3,
+    "fraud": 3,
+    "illegal": 5,
+    "contact_issue": 1,
+    "price_issue": 1,
+    "category_issue": 1,
+    "responsiveness_issue": 1,
+    "other": 1,
+}
+REPORT_REVIEW_SCORE = env.int("REPORT_REVIEW_SCORE", default=5)
+REPORT_AUTO_HIDE_SCORE = env.int("REPORT_AUTO_HIDE_SCORE", default=15)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "text/",
+    "image/svg+xml",
+    "image/bmp",
+)
+COMPRESSION_BROTLI = env.bool("COMPRESSION_BROTLI", default=True)
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", default=5)
+COMPRESSION_CACHE_TIMEOUT = env.int("COMPRESSION_CACHE_TIMEOUT", default=3600)
+CATEGORY_REGISTRY_LOCAL_TTL = env.int("CATEGORY_REGISTRY_LOCAL_TTL", default=30)
+REQUEST_TIMING_HEADER = env.bool("REQUEST_TIMING_HEADER", default=DEBUG)
+REQUEST_QUERY_BUDGET = env.int("REQUEST_QUERY_BUDGET", default=20)
 
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = env("EMAIL_HOST")
@@ -0,0 +1,53 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from product.models.item import Item
+from product.tests.factories.category_factory import CategoryFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class CompressionBenchmark(TestCase):
+    """
+    Compare the bytes on the wire of an item list page without compression,
+    with gzip and with Brotli (when installed).
+    """
+
+    PAGE_SIZE = 100
+
+    def setUp(self):
+        seller_user = UserFactory()
+        category = CategoryFactory()
+        Item.objects.bulk_create(
+            Item(
+                title=f"کالای شماره {index}",
+                seller_user=seller_user,
+                category=category,
+                price=index + 1,
+                description="توضیحات کامل کالا و شرایط فروش " * 10,
+            )
+            for index in range(self.PAGE_SIZE)
+        )
+        self.url = reverse("item-list-all")
+
+    def fetch(self, accept_encoding):
+        response = self.client.get(
+            self.url,
+            {"page_size": self.PAGE_SIZE},
+            secure=True,
+            HTTP_ACCEPT_ENCODING=accept_encoding,
+        )
+        return response.get("Content-Encoding", "identity"), len(
+            response.content
+        )
+
+    def test_bytes_on_wire(self):
+        _, identity_size = self.fetch("identity")
+        print(f"\n{self.PAGE_SIZE} items: identity {identity_size} bytes")
+
+        for accept_encoding in ("gzip", "br, gzip"):
+            encoding, size = self.fetch(accept_encoding)
+            print(
+                f"{self.PAGE_SIZE} items: {encoding} {size} bytes "
+                f"({size / identity_size:.1%} of identity)"
+            )
+            self.assertLess(size, identity_size)
@@ -0,0 +1,84 @@
+from timeit import timeit
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from product.models.banner import Banner
+from product.models.image import Image
+from product.models.item import Item
+from product.serializers.item_list_serializer import FastItemListSerializer
+from product.serializers.item_serializer import ItemWithImagesSerializer
+from product.tests.factories.category_factory import CategoryFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class ItemListSerializerBenchmark(TestCase):
+    """
+    Serialize one item list page with `ItemWithImagesSerializer` (batched
+    queryset) and with `FastItemListSerializer`, and compare their time.
+    """
+
+    PAGE_SIZE = 100
+    IMAGES_PER_ITEM = 3
+    ROUNDS = 20
+
+    def setUp(self):
+        seller_user = UserFactory()
+        category = CategoryFactory()
+        items = Item.objects.bulk_create(
+            Item(
+                title=f"Item {index}",
+                seller_user=seller_user,
+                category=category,
+                price=index + 1,
+                description="Description " * 20,
+            )
+            for index in range(self.PAGE_SIZE)
+        )
+        images = Image.objects.bulk_create(
+            Image(content_type="image/png", image_data=bytes([index % 256]))
+            for index in range(self.PAGE_SIZE * self.IMAGES_PER_ITEM)
+        )
+        Banner.objects.bulk_create(
+            Banner(
+                item=item,
+                image=images[index * self.IMAGES_PER_ITEM + order],
+                order=order,
+            )
+            for index, item in enumerate(items)
+            for order in range(self.IMAGES_PER_ITEM)
+        )
+        self.request = APIView().initialize_request(
+            APIRequestFactory().get("/items")
+        )
+        self.queryset = Item.objects.order_by("-id")
+
+    def model_serializer(self):
+        queryset = ItemWithImagesSerializer.prepare_queryset(self.queryset)
+        return ItemWithImagesSerializer(
+            list(queryset), many=True, context={"request": self.request}
+        ).data
+
+    def fast_serializer(self):
+        serializer = FastItemListSerializer(self.request)
+        return serializer.serialize(
+            list(serializer.prepare_queryset(self.queryset))
+        )
+
+    def test_compare_serializers(self):
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(self.fast_serializer()),
+            renderer.render(self.model_serializer()),
+        )
+
+        model_time = timeit(self.model_serializer, number=self.ROUNDS)
+        fast_time = timeit(self.fast_serializer, number=self.ROUNDS)
+        print(
+            f"\n{self.PAGE_SIZE} items: "
+            f"ItemWithImagesSerializer {model_time / self.ROUNDS * 1000:.2f} ms, "
+            f"FastItemListSerializer {fast_time / self.ROUNDS * 1000:.2f} ms "
+            f"({model_time / fast_time:.1f}x)"
+        )
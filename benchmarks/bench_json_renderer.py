@@ -0,0 +1,72 @@
+from timeit import timeit
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from product.models.item import Item
+from product.serializers.item_list_serializer import FastItemListSerializer
+from product.tests.factories.category_factory import CategoryFactory
+from reusable.renderers import ORJSONRenderer
+from user.tests.factories.user_factory import UserFactory
+
+
+class JSONRendererBenchmark(TestCase):
+    """
+    Render an item list payload with DRF's `JSONRenderer` and with
+    `ORJSONRenderer`, and compare their time.
+    """
+
+    PAGE_SIZE = 100
+    ROUNDS = 200
+
+    def setUp(self):
+        seller_user = UserFactory()
+        category = CategoryFactory()
+        Item.objects.bulk_create(
+            Item(
+                title=f"کالای شماره {index}",
+                seller_user=seller_user,
+                category=category,
+                price=index + 1,
+                description="توضیحات کالا " * 20,
+            )
+            for index in range(self.PAGE_SIZE)
+        )
+        request = APIView().initialize_request(
+            APIRequestFactory().get("/items")
+        )
+        serializer = FastItemListSerializer(request)
+        self.payload = {
+            "count": self.PAGE_SIZE,
+            "next": None,
+            "previous": None,
+            "results": {
+                "items": serializer.serialize(
+                    list(serializer.prepare_queryset(Item.objects.all()))
+                ),
+                "max_price": self.PAGE_SIZE,
+            },
+        }
+
+    def test_compare_renderers(self):
+        json_renderer = JSONRenderer()
+        orjson_renderer = ORJSONRenderer()
+        self.assertEqual(
+            orjson_renderer.render(self.payload),
+            json_renderer.render(self.payload),
+        )
+
+        json_time = timeit(
+            lambda: json_renderer.render(self.payload), number=self.ROUNDS
+        )
+        orjson_time = timeit(
+            lambda: orjson_renderer.render(self.payload), number=self.ROUNDS
+        )
+        print(
+            f"\n{self.PAGE_SIZE} items: "
+            f"JSONRenderer {json_time / self.ROUNDS * 1000:.3f} ms, "
+            f"ORJSONRenderer {orjson_time / self.ROUNDS * 1000:.3f} ms "
+            f"({json_time / orjson_time:.1f}x)"
+        )
@@ -0,0 +1,93 @@
+from time import perf_counter
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from product.models.item import Item
+from product.tests.factories.category_factory import CategoryFactory
+from report.models.base_report import ReportStatus
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from report.services.ban_service import unban_users
+from user.tests.factories.user_factory import UserFactory
+
+
+class UserReportUnbanBenchmark(TestCase):
+    """
+    Ban and unban sellers holding many items, comparing the set-based
+    `NOT EXISTS` unban with the previous `IN` list of reported item ids.
+    """
+
+    ITEMS_PER_SELLER = 10_000
+    REPORTED_ITEMS_PER_SELLER = 1_000
+    SELLERS = 3
+
+    def setUp(self):
+        category = CategoryFactory()
+        self.sellers = [UserFactory() for _ in range(self.SELLERS)]
+        for seller in self.sellers:
+            items = Item.objects.bulk_create(
+                Item(
+                    title=f"Item {index}",
+                    seller_user=seller,
+                    category=category,
+                    price=index + 1,
+                )
+                for index in range(self.ITEMS_PER_SELLER)
+            )
+            ItemReport.objects.bulk_create(
+                ItemReport(item=item, spam=1)
+                for item in items[: self.REPORTED_ITEMS_PER_SELLER]
+            )
+        self.reports = [
+            UserReport.objects.create(user=seller, fraud=1)
+            for seller in self.sellers
+        ]
+
+    def measure(self, label, func):
+        with CaptureQueriesContext(connection) as context:
+            start = perf_counter()
+            func()
+            elapsed = perf_counter() - start
+        print(
+            f"\n{label}: {elapsed * 1000:.1f} ms, "
+            f"{len(context.captured_queries)} queries"
+        )
+        return context
+
+    def legacy_unban(self, report):
+        already_reported_item_ids = (
+            ItemReport.objects.filter(item__seller_user=report.user)
+            .exclude(status=ReportStatus.REJECTED)
+            .values_list("item_id", flat=True)
+        )
+        report.user.sold_items.exclude(
+            id__in=list(already_reported_item_ids)
+        ).update(is_banned=False)
+
+    def test_single_user_unban(self):
+        report = self.reports[0]
+        report.ban()
+        self.measure("legacy IN-list unban", lambda: self.legacy_unban(report))
+
+        report.ban()
+        self.measure("set-based unban", report.unban)
+
+        self.assertEqual(
+            Item.objects.filter(
+                seller_user=report.user_id, is_banned=True
+            ).count(),
+            self.REPORTED_ITEMS_PER_SELLER,
+        )
+
+    def test_batched_unban(self):
+        for report in self.reports:
+            report.ban()
+
+        context = self.measure(
+            f"batched unban of {self.SELLERS} sellers",
+            lambda: unban_users([seller.pk for seller in self.sellers]),
+        )
+
+        self.assertLess(len(context.captured_queries), 10)
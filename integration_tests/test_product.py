@@ -324,5 +324,5 @@ class ProductTests(TestCase):
 
     def assert_item_in_response(self, response, item_id):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], item_id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], item_id)
@@ -10,24 +10,50 @@ from .models.purchase_request import PurchaseRequest
 
 @admin.register(Item)
 class ItemAdmin(BaseAdmin):
-    pass
+    list_display = (
+        "id",
+        "title",
+        "seller_user",
+        "category",
+        "price",
+        "state",
+        "is_banned",
+    )
+    list_filter = ("state", "is_banned")
+    list_select_related = ("seller_user", "category")
+    search_fields = ("title",)
+    autocomplete_fields = ("seller_user", "buyer_user", "category")
+    show_full_result_count = False
 
 
 @admin.register(Category)
 class CategoryAdmin(BaseAdmin):
-    pass
+    list_display = ("id", "title", "parent", "item_count")
+    list_select_related = ("parent",)
+    search_fields = ("title",)
+    readonly_fields = ("path", "item_count")
 
 
 @admin.register(Banner)
 class BannerAdmin(BaseAdmin):
-    pass
+    list_display = ("id", "__str__", "image_id")
+    list_select_related = ("item",)
+    autocomplete_fields = ("item",)
+    raw_id_fields = ("image",)
+    show_full_result_count = False
 
 
 @admin.register(Image)
 class ImageAdmin(BaseAdmin):
-    pass
+    list_display = ("id", "content_type", "size", "upload_count", "created_at")
+    readonly_fields = ("content_type", "content_hash", "size", "upload_count")
+    show_full_result_count = False
 
 
 @admin.register(PurchaseRequest)
 class PurchaseRequestAdmin(BaseAdmin):
-    pass
+    list_display = ("id", "__str__", "state", "created_at")
+    list_filter = ("state",)
+    list_select_related = ("item", "buyer_user")
+    autocomplete_fields = ("item", "buyer_user")
+    show_full_result_count = False
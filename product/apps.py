@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ProductConfig(AppConfig):
+    name = "product"
+
+    def ready(self):
+        # Connect the signals invalidating the category registry.
+        from product.services import category_registry  # noqa: F401
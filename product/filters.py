@@ -0,0 +1,27 @@
+from django_filters import rest_framework as filters
+
+from product.models.listing import Listing
+from product.services.category_registry import category_registry
+
+
+class ItemFilter(filters.FilterSet):
+    """
+    Filters of the item list, applied to the `Listing` table.
+
+    `category__in_tree` matches items of a category or any of its
+    descendants, using the cached descendant ids of the category registry.
+    """
+
+    category__in_tree = filters.NumberFilter(method="filter_category_in_tree")
+
+    class Meta:
+        model = Listing
+        fields = {
+            "category": ["exact"],
+            "price": ["gte", "lte"],
+        }
+
+    def filter_category_in_tree(self, queryset, name, value):
+        return queryset.filter(
+            category_id__in=category_registry.get_descendant_ids(int(value))
+        )
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from product.services.image_repository import collect_orphaned_images_batch
+
+
+class Command(BaseCommand):
+    help = "Delete uploaded images that no banner references."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=settings.IMAGE_GC_GRACE_HOURS,
+            help="Keep orphaned images touched within this many hours.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.IMAGE_GC_BATCH_SIZE,
+            help="Number of images deleted per transaction.",
+        )
+        parser.add_argument(
+            "--start-id",
+            type=int,
+            default=0,
+            help="Resume after this image id.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without deleting it.",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+        dry_run = options["dry_run"]
+        last_id = options["start_id"]
+        total_images = 0
+        total_bytes = 0
+
+        while True:
+            (
+                batch_last_id,
+                images,
+                reclaimed_bytes,
+            ) = collect_orphaned_images_batch(
+                cutoff=cutoff,
+                after_id=last_id,
+                batch_size=options["batch_size"],
+                dry_run=dry_run,
+            )
+            if batch_last_id is None:
+                break
+
+            last_id = batch_last_id
+            total_images += images
+            total_bytes += reclaimed_bytes
+            self.stdout.write(
+                f"Collected {images} images up to id {last_id} "
+                f"({reclaimed_bytes} bytes)"
+            )
+
+        prefix = "[dry run] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Collected {total_images} orphaned images, "
+                f"reclaimed {total_bytes} bytes."
+            )
+        )
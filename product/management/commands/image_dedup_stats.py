@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from product.services.image_repository import get_dedup_stats
+
+
+class Command(BaseCommand):
+    help = "Report how much storage image deduplication saves."
+
+    def handle(self, *args, **options):
+        stats = get_dedup_stats()
+        self.stdout.write(f"Stored images: {stats['images']}")
+        self.stdout.write(f"Uploads: {stats['uploads']}")
+        self.stdout.write(f"Dedup ratio: {stats['dedup_ratio']:.2f}")
+        self.stdout.write(f"Stored bytes: {stats['stored_bytes']}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Saved bytes: {stats['saved_bytes']}")
+        )
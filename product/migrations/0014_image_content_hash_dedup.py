@@ -0,0 +1,47 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:07
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_content_hash(apps, schema_editor):
+    Image = apps.get_model("product", "Image")
+    for image in Image.objects.filter(content_hash="").iterator(chunk_size=100):
+        data = bytes(image.image_data)
+        Image.objects.filter(id=image.id).update(
+            content_hash=hashlib.sha256(data).hexdigest(),
+            size=len(data),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0013_alter_item_buyer_user_alter_purchaserequest_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 hex digest of the image data.', max_length=64, verbose_name='Content Hash'),
+        ),
+        migrations.AddField(
+            model_name='image',
+            name='size',
+            field=models.PositiveIntegerField(default=0, help_text='Size of the image data in bytes.', verbose_name='Size'),
+        ),
+        migrations.AddField(
+            model_name='image',
+            name='upload_count',
+            field=models.PositiveIntegerField(default=1, help_text='Number of uploads that resolved to this image.', verbose_name='Upload Count'),
+        ),
+        migrations.AlterField(
+            model_name='banner',
+            name='image',
+            field=models.ForeignKey(default=None, help_text='The image associated with this banner. Identical uploads share one image.', on_delete=django.db.models.deletion.CASCADE, to='product.image', verbose_name='Banner Image'),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
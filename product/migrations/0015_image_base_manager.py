@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:11
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0014_image_content_hash_dedup'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='image',
+            options={'base_manager_name': 'objects'},
+        ),
+    ]
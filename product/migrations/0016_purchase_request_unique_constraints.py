@@ -0,0 +1,79 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:29
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Count, Max, Value, When
+
+
+def remove_duplicate_purchase_requests(apps, schema_editor):
+    PurchaseRequest = apps.get_model("product", "PurchaseRequest")
+    Item = apps.get_model("product", "Item")
+
+    # Keep one request of every buyer per item: the accepted one if any,
+    # otherwise the latest.
+    duplicates = (
+        PurchaseRequest.objects.values("item_id", "buyer_user_id")
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        requests = PurchaseRequest.objects.filter(
+            item_id=duplicate["item_id"],
+            buyer_user_id=duplicate["buyer_user_id"],
+        )
+        kept = (
+            requests.annotate(
+                is_accepted=Case(
+                    When(state="accepted", then=Value(1)), default=Value(0)
+                )
+            )
+            .order_by("-is_accepted", "-id")
+            .first()
+        )
+        requests.exclude(id=kept.id).delete()
+
+    # Keep one accepted request per item: the one of the item's buyer if
+    # any, otherwise the latest.
+    accepted = (
+        PurchaseRequest.objects.filter(state="accepted")
+        .values("item_id")
+        .annotate(count=Count("id"), last_id=Max("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in accepted.iterator():
+        requests = PurchaseRequest.objects.filter(
+            item_id=duplicate["item_id"], state="accepted"
+        )
+        buyer_user_id = (
+            Item.objects.filter(id=duplicate["item_id"])
+            .values_list("buyer_user_id", flat=True)
+            .first()
+        )
+        kept_id = (
+            requests.filter(buyer_user_id=buyer_user_id)
+            .values_list("id", flat=True)
+            .first()
+        ) or duplicate["last_id"]
+        requests.exclude(id=kept_id).update(state="pending")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0015_image_base_manager'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_purchase_requests, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='purchaserequest',
+            constraint=models.UniqueConstraint(fields=('item', 'buyer_user'), name='purchaserequest_item_buyer_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='purchaserequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('state', 'accepted')), fields=('item',), name='purchaserequest_one_accepted_per_item'),
+        ),
+    ]
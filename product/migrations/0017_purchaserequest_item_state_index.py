@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0016_purchase_request_unique_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='purchaserequest',
+            index=models.Index(fields=['item', 'state', 'created_at'], name='purchaserequest_item_state_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0017_purchaserequest_item_state_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['seller_user', 'state'], name='item_seller_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['buyer_user', 'state'], name='item_buyer_state_idx'),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Items shown in the item list: not banned and neither sold nor inactive.
+LISTED_ITEM = "NOT {row}.is_banned AND {row}.state IN ('active', 'reserved')"
+
+CREATE_ITEM_COUNT_TRIGGER = f"""
+CREATE OR REPLACE FUNCTION product_item_category_count() RETURNS trigger AS $$
+DECLARE
+    old_listed boolean := TG_OP <> 'INSERT' AND {LISTED_ITEM.format(row="OLD")};
+    new_listed boolean := TG_OP <> 'DELETE' AND {LISTED_ITEM.format(row="NEW")};
+BEGIN
+    IF TG_OP = 'UPDATE' AND old_listed = new_listed
+            AND OLD.category_id = NEW.category_id THEN
+        RETURN NULL;
+    END IF;
+    IF old_listed THEN
+        UPDATE product_category SET item_count = item_count - 1
+        WHERE id = OLD.category_id;
+    END IF;
+    IF new_listed THEN
+        UPDATE product_category SET item_count = item_count + 1
+        WHERE id = NEW.category_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_item_category_count
+AFTER INSERT OR DELETE OR UPDATE OF category_id, state, is_banned
+ON product_item FOR EACH ROW EXECUTE FUNCTION product_item_category_count();
+"""
+
+DROP_ITEM_COUNT_TRIGGER = """
+DROP TRIGGER IF EXISTS product_item_category_count ON product_item;
+DROP FUNCTION IF EXISTS product_item_category_count();
+"""
+
+BACKFILL_CATEGORY_TREE = f"""
+UPDATE product_category SET path = '/' || id || '/';
+UPDATE product_category SET item_count = (
+    SELECT count(*) FROM product_item
+    WHERE product_item.category_id = product_category.id
+    AND {LISTED_ITEM.format(row="product_item")}
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0018_item_profile_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of listed items directly in this category.', verbose_name='Item Count'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='parent',
+            field=models.ForeignKey(blank=True, help_text='The category this category belongs to, if any.', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='children', to='product.category', verbose_name='Parent Category'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(blank=True, editable=False, help_text='Ids of the category and its ancestors, from the root.', max_length=255, verbose_name='Path'),
+        ),
+        migrations.RunSQL(BACKFILL_CATEGORY_TREE, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_ITEM_COUNT_TRIGGER, DROP_ITEM_COUNT_TRIGGER),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Items shown in the item list: not banned and neither sold nor inactive.
+LISTED_ITEM = "NOT {row}.is_banned AND {row}.state IN ('active', 'reserved')"
+
+FIRST_IMAGE = """(
+    SELECT image_id FROM product_banner WHERE item_id = {item_id}
+    ORDER BY "order", id LIMIT 1
+)"""
+
+CREATE_LISTING_TRIGGERS = f"""
+CREATE OR REPLACE FUNCTION product_item_listing() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'DELETE' AND {LISTED_ITEM.format(row="NEW")} THEN
+        INSERT INTO product_listing (
+            item_id, title, seller_user_id, category_id, price,
+            first_image_id, created_at
+        ) VALUES (
+            NEW.id, NEW.title, NEW.seller_user_id, NEW.category_id, NEW.price,
+            {FIRST_IMAGE.format(item_id="NEW.id")}, NEW.created_at
+        )
+        ON CONFLICT (item_id) DO UPDATE SET
+            title = EXCLUDED.title,
+            seller_user_id = EXCLUDED.seller_user_id,
+            category_id = EXCLUDED.category_id,
+            price = EXCLUDED.price,
+            created_at = EXCLUDED.created_at;
+    ELSIF TG_OP <> 'INSERT' THEN
+        DELETE FROM product_listing WHERE item_id = OLD.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_item_listing
+AFTER INSERT OR DELETE OR UPDATE OF
+    title, seller_user_id, category_id, price, created_at, state, is_banned
+ON product_item FOR EACH ROW EXECUTE FUNCTION product_item_listing();
+
+CREATE OR REPLACE FUNCTION product_banner_listing() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE product_listing
+        SET first_image_id = {FIRST_IMAGE.format(item_id="OLD.item_id")}
+        WHERE item_id = OLD.item_id;
+    END IF;
+    IF TG_OP <> 'DELETE' AND (TG_OP = 'INSERT' OR NEW.item_id <> OLD.item_id) THEN
+        UPDATE product_listing
+        SET first_image_id = {FIRST_IMAGE.format(item_id="NEW.item_id")}
+        WHERE item_id = NEW.item_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_banner_listing
+AFTER INSERT OR DELETE OR UPDATE OF item_id, image_id, "order"
+ON product_banner FOR EACH ROW EXECUTE FUNCTION product_banner_listing();
+"""
+
+DROP_LISTING_TRIGGERS = """
+DROP TRIGGER IF EXISTS product_banner_listing ON product_banner;
+DROP FUNCTION IF EXISTS product_banner_listing();
+DROP TRIGGER IF EXISTS product_item_listing ON product_item;
+DROP FUNCTION IF EXISTS product_item_listing();
+"""
+
+BACKFILL_LISTING = f"""
+INSERT INTO product_listing (
+    item_id, title, seller_user_id, category_id, price, first_image_id,
+    created_at
+)
+SELECT
+    id, title, seller_user_id, category_id, price,
+    {FIRST_IMAGE.format(item_id="product_item.id")}, created_at
+FROM product_item
+WHERE {LISTED_ITEM.format(row="product_item")};
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0019_category_tree'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Listing',
+            fields=[
+                ('item', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='listing', serialize=False, to='product.item', verbose_name='Item')),
+                ('title', models.CharField(max_length=255, verbose_name='Item Title')),
+                ('price', models.IntegerField(verbose_name='Price')),
+                ('created_at', models.DateTimeField(verbose_name='Created At')),
+                ('category', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='product.category', verbose_name='Category')),
+                ('first_image', models.ForeignKey(db_constraint=False, db_index=False, help_text='The image of the first banner of the item, if any.', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='product.image', verbose_name='First Image')),
+                ('seller_user', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Seller')),
+            ],
+            options={
+                'verbose_name': 'Listing',
+                'verbose_name_plural': 'Listings',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='listing_created_idx'), models.Index(fields=['price'], name='listing_price_idx'), models.Index(fields=['category', '-created_at'], name='listing_category_created_idx')],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_LISTING, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_LISTING_TRIGGERS, DROP_LISTING_TRIGGERS),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:39
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_images(apps, schema_editor):
+    Image = apps.get_model("product", "Image")
+    Banner = apps.get_model("product", "Banner")
+
+    # Keep the oldest image of every hash and move the banners to it.
+    duplicates = (
+        Image.objects.exclude(content_hash="")
+        .values("content_hash")
+        .annotate(
+            count=Count("id"), first_id=Min("id"), uploads=Sum("upload_count")
+        )
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        duplicate_images = Image.objects.filter(
+            content_hash=duplicate["content_hash"],
+            id__gt=duplicate["first_id"],
+        )
+        Banner.objects.filter(image__in=duplicate_images).update(
+            image_id=duplicate["first_id"]
+        )
+        duplicate_images.delete()
+        Image.objects.filter(id=duplicate["first_id"]).update(
+            upload_count=duplicate["uploads"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0020_listing'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_images, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='image',
+            constraint=models.UniqueConstraint(condition=models.Q(('content_hash', ''), _negated=True), fields=('content_hash',), name='image_content_hash_uniq'),
+        ),
+    ]
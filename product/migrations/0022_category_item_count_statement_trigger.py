@@ -0,0 +1,85 @@
+# Generated by Django 5.1.4 on 2026-10-19 14:50
+
+from importlib import import_module
+
+from django.db import migrations
+
+category_tree = import_module("product.migrations.0019_category_tree")
+
+LISTED_ITEM = category_tree.LISTED_ITEM
+
+# Apply the net count change of every category touched by a statement with
+# one update per category. The category rows are locked in id order first,
+# so concurrent bulk updates can't lock them in opposite orders.
+APPLY_DELTAS = """
+        WITH changes AS ({changes}),
+        deltas AS (
+            SELECT category_id, sum(delta) AS delta FROM changes
+            GROUP BY category_id HAVING sum(delta) <> 0
+        ),
+        locked AS (
+            SELECT product_category.id FROM product_category
+            JOIN deltas ON deltas.category_id = product_category.id
+            ORDER BY product_category.id
+            FOR UPDATE OF product_category
+        )
+        UPDATE product_category
+        SET item_count = item_count + deltas.delta
+        FROM deltas, locked
+        WHERE product_category.id = deltas.category_id
+        AND locked.id = product_category.id;"""
+
+OLD_CHANGES = (
+    f"SELECT category_id, -1 AS delta FROM old_items "
+    f"WHERE {LISTED_ITEM.format(row='old_items')}"
+)
+NEW_CHANGES = (
+    f"SELECT category_id, 1 AS delta FROM new_items "
+    f"WHERE {LISTED_ITEM.format(row='new_items')}"
+)
+
+CREATE_ITEM_COUNT_TRIGGERS = f"""
+DROP TRIGGER IF EXISTS product_item_category_count ON product_item;
+DROP FUNCTION IF EXISTS product_item_category_count();
+
+CREATE OR REPLACE FUNCTION product_item_category_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN{APPLY_DELTAS.format(changes=NEW_CHANGES)}
+    ELSIF TG_OP = 'DELETE' THEN{APPLY_DELTAS.format(changes=OLD_CHANGES)}
+    ELSE{APPLY_DELTAS.format(changes=f"{OLD_CHANGES} UNION ALL {NEW_CHANGES}")}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER product_item_category_counts_insert
+AFTER INSERT ON product_item REFERENCING NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION product_item_category_counts();
+
+CREATE TRIGGER product_item_category_counts_update
+AFTER UPDATE ON product_item
+REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION product_item_category_counts();
+
+CREATE TRIGGER product_item_category_counts_delete
+AFTER DELETE ON product_item REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION product_item_category_counts();
+"""
+
+DROP_ITEM_COUNT_TRIGGERS = """
+DROP TRIGGER IF EXISTS product_item_category_counts_insert ON product_item;
+DROP TRIGGER IF EXISTS product_item_category_counts_update ON product_item;
+DROP TRIGGER IF EXISTS product_item_category_counts_delete ON product_item;
+DROP FUNCTION IF EXISTS product_item_category_counts();
+""" + category_tree.CREATE_ITEM_COUNT_TRIGGER
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0021_image_content_hash_unique'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_ITEM_COUNT_TRIGGERS, DROP_ITEM_COUNT_TRIGGERS),
+    ]
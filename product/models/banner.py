@@ -27,14 +27,14 @@ class Banner(BaseModel):
         help_text="Determines the order in which banners are displayed. Lower values are shown first.",
     )
 
-    image: Image = models.OneToOneField(
+    image: Image = models.ForeignKey(
         Image,
         null=False,
         blank=False,
         default=None,
         on_delete=models.CASCADE,
         verbose_name="Banner Image",
-        help_text="The image associated with this banner.",
+        help_text="The image associated with this banner. Identical uploads share one image.",
     )
 
     class Meta:
@@ -1,13 +1,23 @@
+from typing import List, Optional
+
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Concat, Substr
 
 from reusable.models import BaseModel
 
+PATH_SEPARATOR = "/"
+
 
 class Category(BaseModel):
     """
     Represents a category that can be used to group related items.
 
-    This model includes a title field to specify the category name.
+    Categories form a tree through `parent`. Every category stores its
+    materialised `path` of ancestor ids, e.g. `/1/5/` for category 5 under
+    category 1, so the descendants of a category are the categories whose
+    path starts with its own. `item_count` is the number of listed items
+    directly in the category, maintained by a database trigger on items.
     """
 
     title: str = models.CharField(
@@ -17,6 +27,31 @@ class Category(BaseModel):
         help_text="The name of the category.",
     )
 
+    parent: Optional["Category"] = models.ForeignKey(
+        "self",
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="children",
+        verbose_name="Parent Category",
+        help_text="The category this category belongs to, if any.",
+    )
+
+    path: str = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="Path",
+        help_text="Ids of the category and its ancestors, from the root.",
+    )
+
+    item_count: int = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="Item Count",
+        help_text="Number of listed items directly in this category.",
+    )
+
     class Meta:
         """
         Metadata options for the Category model.
@@ -34,3 +69,46 @@ class Category(BaseModel):
             str: The title of the category.
         """
         return self.title
+
+    @staticmethod
+    def parse_path(path: str) -> List[int]:
+        """
+        Ids of the categories on a path, from the root to the category itself.
+        """
+        return [int(part) for part in path.split(PATH_SEPARATOR) if part]
+
+    def clean(self):
+        self.validate_parent()
+
+    def validate_parent(self):
+        if (
+            self.parent_id
+            and self.path
+            and self.parent.path.startswith(self.path)
+        ):
+            raise ValidationError(
+                {"parent": "A category can't be moved under itself."}
+            )
+
+    def save(self, *args, **kwargs):
+        self.validate_parent()
+        super().save(*args, **kwargs)
+
+        parent_path = self.parent.path if self.parent_id else PATH_SEPARATOR
+
+        path = f"{parent_path}{self.id}{PATH_SEPARATOR}"
+        if path != self.path:
+            old_path = self.path
+            Category.objects.filter(id=self.id).update(path=path)
+            if old_path:
+                # Move the descendants along with the category.
+                Category.objects.filter(path__startswith=old_path).exclude(
+                    id=self.id
+                ).update(
+                    path=Concat(
+                        models.Value(path),
+                        Substr("path", len(old_path) + 1),
+                        output_field=models.CharField(),
+                    )
+                )
+            self.path = path
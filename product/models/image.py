@@ -1,3 +1,4 @@
+import hashlib
 from typing import Any
 
 from django.db import models
@@ -5,9 +6,32 @@ from django.db import models
 from reusable.models import BaseModel
 
 
+class ImageQuerySet(models.QuerySet):
+    def with_data(self) -> "ImageQuerySet":
+        """
+        Include the binary image data, which is deferred by default.
+        """
+        return self.defer(None)
+
+
+class ImageManager(models.Manager.from_queryset(ImageQuerySet)):
+    """
+    Default manager for images that defers `image_data`, so listing or
+    validating images never pulls the binary data from the database.
+    """
+
+    def get_queryset(self) -> ImageQuerySet:
+        return super().get_queryset().defer("image_data")
+
+
 class Image(BaseModel):
     """
     Model to store image files directly in the database.
+
+    Images are deduplicated by the SHA-256 hash of their bytes, so the same
+    upload is stored once and may be referenced by several banners.
+    The binary data is deferred by default; use `Image.objects.with_data()`
+    when the bytes are actually needed.
     """
 
     content_type: str = models.CharField(
@@ -21,5 +45,56 @@ class Image(BaseModel):
         help_text="The binary data of the image file.",
     )
 
+    content_hash: str = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        verbose_name="Content Hash",
+        help_text="SHA-256 hex digest of the image data.",
+    )
+
+    size: int = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Size",
+        help_text="Size of the image data in bytes.",
+    )
+
+    upload_count: int = models.PositiveIntegerField(
+        default=1,
+        verbose_name="Upload Count",
+        help_text="Number of uploads that resolved to this image.",
+    )
+
+    objects = ImageManager()
+
+    class Meta:
+        """
+        Metadata options for the Image model.
+        """
+
+        base_manager_name = "objects"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_hash"],
+                condition=~models.Q(content_hash=""),
+                name="image_content_hash_uniq",
+            ),
+        ]
+
     def __str__(self):
         return f"Image ID: {self.id}"
+
+    @staticmethod
+    def compute_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def save(self, *args, **kwargs):
+        if (
+            not self.content_hash
+            and "image_data" not in self.get_deferred_fields()
+            and self.image_data is not None
+        ):
+            data = bytes(self.image_data)
+            self.content_hash = self.compute_hash(data)
+            self.size = len(data)
+        super().save(*args, **kwargs)
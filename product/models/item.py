@@ -85,6 +85,14 @@ class Item(BaseModel):
         verbose_name = "Item"
         verbose_name_plural = "Items"
         ordering = ["-id"]
+        indexes = [
+            models.Index(
+                fields=["seller_user", "state"], name="item_seller_state_idx"
+            ),
+            models.Index(
+                fields=["buyer_user", "state"], name="item_buyer_state_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,91 @@
+from typing import Optional
+
+from django.db import models
+
+from product.models.category import Category
+from product.models.image import Image
+from product.models.item import Item
+from user.models.user import User
+
+
+class Listing(models.Model):
+    """
+    Denormalized copy of the items shown in the item list.
+
+    Holds one row per listed item, that is not banned and neither sold nor
+    inactive, with the columns the list filters, orders and renders by,
+    including the image of the first banner. Rows are maintained by
+    database triggers on the item and banner tables (see migration
+    `0020_listing`), so every write path, including bulk updates and raw
+    SQL, keeps the table in sync. Never write to it directly.
+    """
+
+    item: Item = models.OneToOneField(
+        Item,
+        primary_key=True,
+        on_delete=models.DO_NOTHING,
+        related_name="listing",
+        verbose_name="Item",
+    )
+
+    title: str = models.CharField(
+        max_length=255,
+        verbose_name="Item Title",
+    )
+
+    seller_user: User = models.ForeignKey(
+        User,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        verbose_name="Seller",
+    )
+
+    category: Category = models.ForeignKey(
+        Category,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        verbose_name="Category",
+    )
+
+    price: Optional[int] = models.IntegerField(
+        verbose_name="Price",
+    )
+
+    first_image: Optional[Image] = models.ForeignKey(
+        Image,
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        verbose_name="First Image",
+        help_text="The image of the first banner of the item, if any.",
+    )
+
+    created_at = models.DateTimeField(
+        verbose_name="Created At",
+    )
+
+    class Meta:
+        """
+        Metadata options for the Listing model.
+        """
+
+        verbose_name = "Listing"
+        verbose_name_plural = "Listings"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="listing_created_idx"),
+            models.Index(fields=["price"], name="listing_price_idx"),
+            models.Index(
+                fields=["category", "-created_at"],
+                name="listing_category_created_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.title
@@ -9,6 +9,9 @@ from user.models.user import User
 class PurchaseRequest(BaseModel):
     """
     Represents a request made by a user to purchase an item.
+
+    A buyer has at most one request per item, and at most one request of an
+    item can be accepted; both rules are enforced by unique constraints.
     """
 
     item: Item = models.ForeignKey(
@@ -65,6 +68,23 @@ class PurchaseRequest(BaseModel):
         verbose_name = "Purchase Request"
         verbose_name_plural = "Purchase Requests"
         ordering = ["-id"]
+        indexes = [
+            models.Index(
+                fields=["item", "state", "created_at"],
+                name="purchaserequest_item_state_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["item", "buyer_user"],
+                name="purchaserequest_item_buyer_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["item"],
+                condition=models.Q(state="accepted"),
+                name="purchaserequest_one_accepted_per_item",
+            ),
+        ]
 
     def __str__(self) -> str:
         """
@@ -6,4 +6,4 @@ from product.models.category import Category
 class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = "__all__"
+        exclude = ["path", "item_count"]
@@ -6,7 +6,7 @@ from product.exceptions import (
     InvalidPriceException,
     InvalidBannerException,
 )
-from product.models.category import Category
+from product.services.category_registry import category_registry
 from product.serializers.banner_data_serializer import BannerDataSerializer
 
 
@@ -33,9 +33,8 @@ class ItemDataSerializer(serializers.Serializer):
         """
         Validate the category_id field.
         """
-        try:
-            category = Category.objects.get(id=value)
-        except Category.DoesNotExist:
+        category = category_registry.get(value)
+        if category is None:
             raise CategoryDoesNotExistException()
         return category
 
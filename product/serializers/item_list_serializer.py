@@ -0,0 +1,180 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from rest_framework import serializers
+
+from product.models.banner import Banner
+from product.models.item import Item
+from product.models.listing import Listing
+from product.models.purchase_request import PurchaseRequest
+from product.serializers.item_serializer import ItemWithImagesSerializer
+from reusable.middleware import record_serializer_time
+
+
+class FastItemListSerializer:
+    """
+    Hand-written serializer for item list pages.
+
+    Produces the same representation as `ItemWithImagesSerializer`,
+    including sparse fieldsets, but builds every item dict directly from
+    `values()` rows and two batched lookups for banners and purchase
+    requests, skipping the per-instance field machinery of DRF.
+
+    Accepts either item or `Listing` querysets. Listing rows already hold
+    the first image id, and fields without a listing column are loaded
+    from the item table in one batched query. Items deleted between the
+    two reads are left out.
+
+    Usage:
+        serializer = FastItemListSerializer(request)
+        page = paginator.paginate_queryset(
+            serializer.prepare_queryset(queryset), request
+        )
+        data = serializer.serialize(page)
+    """
+
+    # Columns loaded for every output field backed by a model column.
+    COLUMNS = {
+        "id": "id",
+        "created_at": "created_at",
+        "title": "title",
+        "category": "category_id",
+        "price": "price",
+        "description": "description",
+        "is_banned": "is_banned",
+        "is_owner": "seller_user_id",
+    }
+
+    LISTING_COLUMNS = {
+        "id": "item_id",
+        "created_at": "created_at",
+        "title": "title",
+        "category": "category_id",
+        "price": "price",
+        "is_owner": "seller_user_id",
+        "first_image_id": "first_image_id",
+    }
+
+    _datetime_field = serializers.DateTimeField()
+
+    def __init__(self, request=None, fields: Optional[Set[str]] = None):
+        if fields is None:
+            fields = ItemWithImagesSerializer.get_request_fields(request)
+        all_fields = ItemWithImagesSerializer.Meta.fields
+        if fields and fields & set(all_fields):
+            self.fields = [name for name in all_fields if name in fields]
+        else:
+            self.fields = list(all_fields)
+
+        self.request = request
+        user = getattr(request, "user", None)
+        self.user_id = getattr(user, "pk", None)
+        self.columns = self.COLUMNS
+
+    def prepare_queryset(self, queryset):
+        """
+        Turn an item or listing queryset into a `values()` queryset of the
+        needed columns.
+        """
+        if queryset.model is Listing:
+            self.columns = self.LISTING_COLUMNS
+        columns = {self.columns["id"]} | {
+            self.columns[name] for name in self.fields if name in self.columns
+        }
+        return queryset.values(*columns)
+
+    def serialize(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Build the representation of the given `values()` rows.
+        """
+        with record_serializer_time(self.request):
+            return self._serialize(rows)
+
+    def _serialize(self, rows: List[Dict]) -> List[Dict]:
+        columns = self.columns
+        item_ids = [row[columns["id"]] for row in rows]
+        fields = self.fields
+
+        image_ids = {}
+        if "image_ids" in fields or (
+            "first_image_id" in fields and "first_image_id" not in columns
+        ):
+            image_ids = self.get_image_ids(item_ids)
+        item_rows = {}
+        item_fields = [
+            name
+            for name in fields
+            if name in self.COLUMNS and name not in columns
+        ]
+        if item_fields:
+            item_rows = self.get_item_rows(item_ids, item_fields)
+        requested_item_ids = set()
+        if "has_purchase_request" in fields:
+            requested_item_ids = self.get_requested_item_ids(item_ids)
+
+        to_datetime = self._datetime_field.to_representation
+        data = []
+        for row in rows:
+            item_id = row[columns["id"]]
+            if item_fields and item_id not in item_rows:
+                # The item was deleted after its listing row was read.
+                continue
+            item = {}
+            for name in fields:
+                if name == "id":
+                    item[name] = item_id
+                elif name == "created_at":
+                    item[name] = to_datetime(row["created_at"])
+                elif name == "category":
+                    item[name] = row["category_id"]
+                elif name == "image_ids":
+                    item[name] = image_ids.get(item_id, [])
+                elif name == "first_image_id":
+                    if name in columns:
+                        item[name] = row[name]
+                    else:
+                        item_image_ids = image_ids.get(item_id)
+                        item[name] = (
+                            item_image_ids[0] if item_image_ids else None
+                        )
+                elif name == "is_owner":
+                    item[name] = row["seller_user_id"] == self.user_id
+                elif name == "has_purchase_request":
+                    item[name] = item_id in requested_item_ids
+                elif name in columns:
+                    item[name] = row[name]
+                else:
+                    item[name] = item_rows[item_id][name]
+            data.append(item)
+        return data
+
+    @classmethod
+    def get_item_rows(
+        cls, item_ids: List[int], fields: List[str]
+    ) -> Dict[int, Dict]:
+        columns = {cls.COLUMNS[name] for name in fields}
+        return {
+            row["id"]: row
+            for row in Item.objects.filter(id__in=item_ids).values(
+                "id", *columns
+            )
+        }
+
+    @staticmethod
+    def get_image_ids(item_ids: List[int]) -> Dict[int, List[int]]:
+        image_ids = defaultdict(list)
+        for item_id, image_id in (
+            Banner.objects.filter(item_id__in=item_ids)
+            .order_by("order", "id")
+            .values_list("item_id", "image_id")
+        ):
+            image_ids[item_id].append(image_id)
+        return image_ids
+
+    @staticmethod
+    def get_requested_item_ids(item_ids: List[int]) -> Set[int]:
+        return set(
+            PurchaseRequest.objects.filter(item_id__in=item_ids)
+            .values_list("item_id", flat=True)
+            .distinct()
+        )
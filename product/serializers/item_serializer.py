@@ -1,12 +1,17 @@
+from django.db.models import Exists, OuterRef, Prefetch
 from rest_framework import serializers
 
 from product.models.banner import Banner
 from product.models.item import Item
 from product.models.purchase_request import PurchaseRequest
+from reusable.serializers import SparseFieldsetMixin, TimedListSerializer
 
 
-class ItemWithImagesSerializer(serializers.ModelSerializer):
+class ItemWithImagesSerializer(
+    SparseFieldsetMixin, serializers.ModelSerializer
+):
     image_ids = serializers.SerializerMethodField()
+    first_image_id = serializers.SerializerMethodField()
     is_owner = serializers.SerializerMethodField(read_only=True)
     has_purchase_request = serializers.SerializerMethodField(read_only=True)
 
@@ -21,24 +26,88 @@ class ItemWithImagesSerializer(serializers.ModelSerializer):
             "description",
             "is_banned",
             "image_ids",
+            "first_image_id",
             "is_owner",
             "has_purchase_request",
         ]
+        list_serializer_class = TimedListSerializer
+
+    views = {"card": {"id", "title", "price", "first_image_id"}}
+
+    # Model fields loaded for serializer fields that are not model fields.
+    SOURCE_MODEL_FIELDS = {"is_owner": {"seller_user"}}
+
+    @classmethod
+    def prepare_queryset(cls, queryset, fields=None):
+        """
+        Load the banners and purchase request flags of all items in batch,
+        instead of querying them per serialized item.
+
+        Args:
+            queryset: The items to serialize.
+            fields: The requested sparse fieldset, if any. Only the columns
+                of requested fields are selected, and lookups of fields that
+                are not requested are skipped.
+        """
+        if fields and fields & set(cls.Meta.fields):
+            model_fields = {field.name for field in Item._meta.concrete_fields}
+            columns = {"id"} | (fields & model_fields)
+            for name in fields:
+                columns |= cls.SOURCE_MODEL_FIELDS.get(name, set())
+            queryset = queryset.only(*columns)
+        else:
+            fields = set(cls.Meta.fields)
+
+        if "has_purchase_request" in fields:
+            queryset = queryset.annotate(
+                purchase_request_exists=Exists(
+                    PurchaseRequest.objects.filter(item=OuterRef("pk"))
+                )
+            )
+        if fields & {"image_ids", "first_image_id"}:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "banner_set",
+                    queryset=Banner.objects.order_by("order", "id").only(
+                        "id", "item_id", "image_id"
+                    ),
+                    to_attr="ordered_banners",
+                )
+            )
+        return queryset
+
+    def get_first_image_id(self, obj):
+        if hasattr(obj, "ordered_banners"):
+            banners = obj.ordered_banners
+            return banners[0].image_id if banners else None
+
+        return (
+            Banner.objects.filter(item_id=obj)
+            .order_by("order", "id")
+            .values_list("image_id", flat=True)
+            .first()
+        )
 
     def get_image_ids(self, obj):
+        if hasattr(obj, "ordered_banners"):
+            return [banner.image_id for banner in obj.ordered_banners]
+
         # Get all banners related to this item and extract their image IDs
         return (
             Banner.objects.filter(item_id=obj)
-            .order_by("order")
+            .order_by("order", "id")
             .values_list("image_id", flat=True)
         )
 
     def get_is_owner(self, obj):
         request = self.context.get("request")
         user = getattr(request, "user", None)
-        return obj.seller_user == user
+        return obj.seller_user_id == getattr(user, "pk", None)
 
     def get_has_purchase_request(self, obj):
+        if hasattr(obj, "purchase_request_exists"):
+            return obj.purchase_request_exists
+
         return (
             True if PurchaseRequest.objects.filter(item=obj).exists() else False
         )
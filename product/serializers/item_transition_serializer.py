@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from product.services.item_state_machine import ItemTransition
+
+
+class ItemTransitionSerializer(serializers.Serializer):
+    """
+    Serializer for applying one state transition to many items.
+    """
+
+    MAX_ITEMS = 100
+
+    item_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_ITEMS,
+    )
+    transition = serializers.ChoiceField(choices=ItemTransition.choices)
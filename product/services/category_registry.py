@@ -0,0 +1,168 @@
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from product.models.category import Category
+from product.serializers.category_serializer import CategorySerializer
+
+VERSION_KEY = "category_registry_version"
+
+
+class CategorySnapshot(NamedTuple):
+    version: str
+    loaded_at: float
+    categories: List[Category]
+    by_id: Dict[int, Category]
+    descendant_ids: Dict[int, FrozenSet[int]]
+    data: List[dict]
+
+
+class CategoryRegistry:
+    """
+    Process-local cache of all categories and of the descendant ids of every
+    category, so filtering by a category subtree needs no recursive query.
+
+    Every process keeps its own snapshot of the categories and checks it
+    against a version stamp in the shared cache, which is replaced whenever
+    a category is saved or deleted. In steady state reading categories costs
+    one cache lookup and no database queries.
+
+    Without a cache shared between processes (see `REDIS_URL`), other
+    processes never see a new version, so snapshots are then reloaded at
+    least every `CATEGORY_REGISTRY_LOCAL_TTL` seconds.
+
+    Cached instances are shared between requests and must not be modified.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[CategorySnapshot] = None
+
+    def get_all(self) -> List[Category]:
+        return self._get_snapshot().categories
+
+    def get(self, category_id: int) -> Optional[Category]:
+        return self._get_snapshot().by_id.get(category_id)
+
+    def get_descendant_ids(self, category_id: int) -> FrozenSet[int]:
+        """
+        Ids of the category and all of its descendants, or an empty set for
+        an unknown category.
+        """
+        return self._get_snapshot().descendant_ids.get(category_id, frozenset())
+
+    def get_tree(self, item_counts: Dict[int, int]) -> List[dict]:
+        """
+        Build the category tree for the navigation menu.
+
+        Args:
+            item_counts: The number of items directly in each category.
+
+        Returns:
+            list[dict]: The root categories, each with its `children` and the
+            `item_count` of its whole subtree.
+        """
+        snapshot = self._get_snapshot()
+        nodes = {
+            category.id: {
+                "id": category.id,
+                "title": category.title,
+                "item_count": sum(
+                    item_counts.get(descendant_id, 0)
+                    for descendant_id in snapshot.descendant_ids[category.id]
+                ),
+                "children": [],
+            }
+            for category in snapshot.categories
+        }
+
+        roots = []
+        for category in snapshot.categories:
+            if category.parent_id in nodes:
+                nodes[category.parent_id]["children"].append(nodes[category.id])
+            else:
+                roots.append(nodes[category.id])
+        return roots
+
+    def get_data(self) -> List[dict]:
+        """
+        The serialized category list, as returned by the category endpoint.
+        """
+        return self._get_snapshot().data
+
+    def _get_snapshot(self) -> CategorySnapshot:
+        version = get_category_version()
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or snapshot.version != version
+            or self._is_expired(snapshot)
+        ):
+            snapshot = self._snapshot = self._load(version)
+        return snapshot
+
+    @staticmethod
+    def _is_expired(snapshot: CategorySnapshot) -> bool:
+        if not isinstance(caches["default"], (LocMemCache, DummyCache)):
+            return False
+        age = time.monotonic() - snapshot.loaded_at
+        return age >= settings.CATEGORY_REGISTRY_LOCAL_TTL
+
+    @staticmethod
+    def _load(version: str) -> CategorySnapshot:
+        categories = list(Category.objects.all())
+
+        descendant_ids = defaultdict(set)
+        for category in categories:
+            for ancestor_id in Category.parse_path(category.path):
+                descendant_ids[ancestor_id].add(category.id)
+            descendant_ids[category.id].add(category.id)
+
+        return CategorySnapshot(
+            version=version,
+            loaded_at=time.monotonic(),
+            categories=categories,
+            by_id={category.id: category for category in categories},
+            descendant_ids={
+                category_id: frozenset(ids)
+                for category_id, ids in descendant_ids.items()
+            },
+            data=CategorySerializer(categories, many=True).data,
+        )
+
+
+def get_category_version() -> str:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_category_version() -> None:
+    """
+    Invalidate the category snapshots of all processes.
+
+    The version is replaced right away and again once the transaction
+    commits, so no process keeps a snapshot loaded before the commit.
+    """
+    cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    transaction.on_commit(
+        lambda: cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    )
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_registry(**kwargs) -> None:
+    bump_category_version()
+
+
+category_registry = CategoryRegistry()
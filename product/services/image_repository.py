@@ -0,0 +1,150 @@
+import hashlib
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from product.models.image import Image
+
+
+def store_image(file):
+    """
+    Service to store an uploaded image, reusing an existing image with the same content.
+
+    Args:
+        file: The uploaded file to store.
+
+    Returns:
+        tuple[int, bool]: The id of the stored image and whether a new row was created.
+
+    Note:
+        Images are matched by the SHA-256 hash of their bytes. When a match is
+        found its `upload_count` is incremented instead of storing the bytes again.
+        The hash is unique, so concurrent uploads of the same bytes resolve to
+        a single image.
+    """
+    hasher = hashlib.sha256()
+    chunks = []
+    for chunk in file.chunks():
+        hasher.update(chunk)
+        chunks.append(chunk)
+    content_hash = hasher.hexdigest()
+
+    with transaction.atomic():
+        existing_image_id = reuse_image(content_hash)
+        if existing_image_id is not None:
+            return existing_image_id, False
+
+        data = b"".join(chunks)
+        try:
+            with transaction.atomic():
+                image = Image.objects.create(
+                    content_type=file.content_type,
+                    image_data=data,
+                    content_hash=content_hash,
+                    size=len(data),
+                )
+        except IntegrityError:
+            # A concurrent upload of the same bytes was stored first.
+            return reuse_image(content_hash), False
+        return image.id, True
+
+
+def reuse_image(content_hash: str) -> Optional[int]:
+    """
+    Count one more upload of the image with the given hash, if it exists.
+
+    Returns:
+        int | None: The id of the image, or None when no image has the hash.
+    """
+    existing_image_id = (
+        Image.objects.filter(content_hash=content_hash)
+        .values_list("id", flat=True)
+        .first()
+    )
+    if existing_image_id is not None:
+        Image.objects.filter(id=existing_image_id).update(
+            upload_count=F("upload_count") + 1,
+            updated_at=timezone.now(),
+        )
+    return existing_image_id
+
+
+def delete_unreferenced_images(image_ids):
+    """
+    Delete the given images unless another banner still references them.
+
+    Args:
+        image_ids: Ids of the images to delete.
+    """
+    Image.objects.filter(id__in=image_ids, banner__isnull=True).only(
+        "id"
+    ).delete()
+
+
+def collect_orphaned_images_batch(
+    cutoff, after_id=0, batch_size=500, dry_run=False
+):
+    """
+    Delete one batch of images that no banner references.
+
+    Args:
+        cutoff (datetime): Only images last touched before this moment are collected.
+        after_id (int): Only images with a greater id are considered, so a run can resume.
+        batch_size (int): Maximum number of images to delete in this batch.
+        dry_run (bool): When True, report the batch without deleting it.
+
+    Returns:
+        tuple[int | None, int, int]: The last image id seen (None when nothing is
+        left), the number of images collected and the bytes reclaimed.
+
+    Note:
+        Each batch runs in its own short transaction and skips rows locked by
+        concurrent requests, so long locks on the image table are avoided.
+    """
+    with transaction.atomic():
+        candidates = (
+            Image.objects.filter(
+                id__gt=after_id,
+                banner__isnull=True,
+                updated_at__lt=cutoff,
+            )
+            .order_by("id")
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("id", "size")[:batch_size]
+        )
+        rows = list(candidates)
+        if not rows:
+            return None, 0, 0
+
+        image_ids = [image_id for image_id, _ in rows]
+        reclaimed_bytes = sum(size for _, size in rows)
+        if not dry_run:
+            delete_unreferenced_images(image_ids)
+
+        return image_ids[-1], len(image_ids), reclaimed_bytes
+
+
+def get_dedup_stats():
+    """
+    Report how much storage image deduplication saves.
+
+    Returns:
+        dict: Stored image count, total upload count, dedup ratio and bytes saved.
+    """
+    stats = Image.objects.aggregate(
+        images=Count("id"),
+        uploads=Sum("upload_count"),
+        stored_bytes=Sum("size"),
+        saved_bytes=Sum((F("upload_count") - 1) * F("size")),
+    )
+    images = stats["images"] or 0
+    uploads = stats["uploads"] or 0
+    return {
+        "images": images,
+        "uploads": uploads,
+        "dedup_ratio": uploads / images if images else 1.0,
+        "stored_bytes": stats["stored_bytes"] or 0,
+        "saved_bytes": stats["saved_bytes"] or 0,
+    }
@@ -0,0 +1,103 @@
+import hashlib
+import json
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from django.core.cache import cache
+from django.db.models import Count, F, Value
+from django.db.models.functions import Least
+
+from product.models.category import Category
+from product.services.category_registry import (
+    category_registry,
+    get_category_version,
+)
+
+CACHE_KEY_PREFIX = "item_facets"
+CACHE_TIMEOUT = 60
+PRICE_BUCKETS = 10
+
+
+def get_item_facets(
+    queryset, search_terms: List[str], max_price: Optional[int]
+) -> Dict:
+    """
+    Category counts and a price histogram of the items matching a search.
+
+    Both facets come from one query grouped by category and price bucket.
+    The result is cached for `CACHE_TIMEOUT` seconds per normalized search
+    and category tree version.
+
+    Args:
+        queryset: The listings, filtered by the search only.
+        search_terms: The search terms `queryset` is filtered by.
+        max_price: Maximum price of all listed items, which bounds the
+            price buckets.
+
+    Returns:
+        dict: `categories`, the item count of every category subtree with
+        matching items, and `price_histogram`, the item count per price
+        bucket.
+    """
+    cache_key = get_cache_key(search_terms, max_price)
+    facets = cache.get(cache_key)
+    if facets is None:
+        facets = compute_item_facets(queryset, max_price)
+        cache.set(cache_key, facets, timeout=CACHE_TIMEOUT)
+    return facets
+
+
+def compute_item_facets(queryset, max_price: Optional[int]) -> Dict:
+    if not max_price or max_price < 0:
+        max_price = 0
+    bucket_size = max_price // PRICE_BUCKETS + 1
+
+    rows = (
+        queryset.order_by()
+        .values(
+            "category_id",
+            bucket=Least(F("price") / bucket_size, Value(PRICE_BUCKETS - 1)),
+        )
+        .annotate(count=Count("pk"))
+    )
+
+    category_counts = defaultdict(int)
+    bucket_counts = defaultdict(int)
+    for row in rows:
+        bucket_counts[max(row["bucket"], 0)] += row["count"]
+        category = category_registry.get(row["category_id"])
+        ancestor_ids = (
+            Category.parse_path(category.path)
+            if category
+            else [row["category_id"]]
+        )
+        for category_id in ancestor_ids:
+            category_counts[category_id] += row["count"]
+
+    return {
+        "categories": [
+            {"id": category_id, "count": count}
+            for category_id, count in sorted(category_counts.items())
+        ],
+        "price_histogram": [
+            {
+                "min": bucket * bucket_size,
+                "max": (bucket + 1) * bucket_size - 1,
+                "count": bucket_counts[bucket],
+            }
+            for bucket in range(PRICE_BUCKETS)
+        ],
+    }
+
+
+def get_cache_key(search_terms: List[str], max_price: Optional[int]) -> str:
+    # Search is case-insensitive, so terms are normalized to lower case.
+    normalized = json.dumps(
+        {
+            "search": sorted(term.lower() for term in search_terms),
+            "max_price": max_price,
+            "category_version": get_category_version(),
+        }
+    )
+    digest = hashlib.md5(normalized.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}_{digest}"
@@ -7,6 +7,7 @@ from product.exceptions import (
 from product.models.banner import Banner
 from product.models.image import Image
 from product.models.item import Item
+from product.services.image_repository import delete_unreferenced_images
 
 
 def delete_item_with_banners(item_id):
@@ -22,16 +23,16 @@ def delete_item_with_banners(item_id):
     Note:
         Uses database transaction to ensure atomicity. If any operation fails,
         all changes will be rolled back. This includes removing item
-        before removing the banners.
+        before removing the banners. Images still used by other banners
+        are kept, since identical uploads share one image.
     """
     with transaction.atomic():
         item = Item.objects.get(id=item_id)
         banners = Banner.objects.filter(item=item)
-        images = [banner.image for banner in banners]
+        image_ids = list(banners.values_list("image_id", flat=True))
 
         banners.delete()
-        for image in images:
-            image.delete()
+        delete_unreferenced_images(image_ids)
         item.delete()
 
 
@@ -109,17 +110,26 @@ def remove_banners(item):
 
 def create_banners(data, item):
     banners_data = data.get("banners", [])
-    for banner_data in banners_data:
-        try:
-            image = Image.objects.get(id=banner_data["image_id"])
-        except Image.DoesNotExist:
-            raise ImageNotFoundException()
-
-        Banner.objects.create(
-            item=item,
-            order=banner_data["order"],
-            image=image,
-        )
+    if not banners_data:
+        return
+
+    image_ids = {banner_data["image_id"] for banner_data in banners_data}
+    existing_image_ids = set(
+        Image.objects.filter(id__in=image_ids).values_list("id", flat=True)
+    )
+    if existing_image_ids != image_ids:
+        raise ImageNotFoundException()
+
+    Banner.objects.bulk_create(
+        [
+            Banner(
+                item=item,
+                order=banner_data["order"],
+                image_id=banner_data["image_id"],
+            )
+            for banner_data in banners_data
+        ]
+    )
 
 
 def create_item_data(data, seller_user):
@@ -0,0 +1,143 @@
+from typing import Dict, Iterable, List
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from product.exceptions import (
+    BannedItemException,
+    ItemNotFoundException,
+    ItemWasNotReservedRequest,
+    UnauthorizedPurchaseActionRequest,
+)
+from product.models.item import Item
+from product.models.purchase_request import PurchaseRequest
+
+TRANSITION_SUCCESS = "ok"
+
+# Exceptions raised for the failure outcomes of a single item transition.
+TRANSITION_ERRORS = {
+    exception.default_code: exception
+    for exception in (
+        BannedItemException,
+        ItemNotFoundException,
+        ItemWasNotReservedRequest,
+        UnauthorizedPurchaseActionRequest,
+    )
+}
+
+
+class ItemTransition(models.TextChoices):
+    SELL = "sell", "Sell"
+    REACTIVATE = "reactivate", "Reactivate"
+
+
+# Allowed transitions as (expected state, new state).
+TRANSITIONS = {
+    ItemTransition.SELL: (Item.State.RESERVED, Item.State.SOLD),
+    ItemTransition.REACTIVATE: (Item.State.RESERVED, Item.State.ACTIVE),
+}
+
+
+def transition_items(
+    item_ids: Iterable[int], transition: str, user=None
+) -> Dict[int, str]:
+    """
+    Move many items to a new state with one conditional update.
+
+    Only items that are in the expected state, not banned and, when a user is
+    given, sold by that user are updated, using a single
+    `UPDATE ... WHERE state = <expected> RETURNING id` statement. The other
+    items are classified with one more query.
+
+    Args:
+        item_ids: Ids of the items to transition.
+        transition (str): One of `ItemTransition`.
+        user: The seller acting on the items, or None for admin tooling.
+
+    Returns:
+        dict[int, str]: The outcome per item id, which is `"ok"` or the code
+        of the error that prevented the transition.
+    """
+    item_ids = sorted(set(item_ids))
+    if not item_ids:
+        return {}
+    expected_state, new_state = TRANSITIONS[transition]
+
+    with transaction.atomic():
+        updated_ids = _update_state(item_ids, expected_state, new_state, user)
+        if transition == ItemTransition.REACTIVATE:
+            reset_accepted_purchase_requests(updated_ids)
+
+    outcomes = {item_id: TRANSITION_SUCCESS for item_id in updated_ids}
+    failed_ids = [item_id for item_id in item_ids if item_id not in outcomes]
+    if failed_ids:
+        outcomes.update(_get_failure_outcomes(failed_ids, user))
+    return outcomes
+
+
+def transition_item(item_id: int, transition: str, user=None) -> None:
+    """
+    Move a single item to a new state through `transition_items`.
+
+    Raises:
+        CustomApiValidationError: The exception matching the outcome code
+            when the transition was not applied.
+    """
+    outcome = transition_items([item_id], transition, user=user)[item_id]
+    if outcome != TRANSITION_SUCCESS:
+        raise TRANSITION_ERRORS[outcome]()
+
+
+def reset_accepted_purchase_requests(item_ids: List[int]) -> None:
+    """
+    Move the accepted purchase requests of the given items back to pending.
+    """
+    if item_ids:
+        PurchaseRequest.objects.filter(
+            item__in=item_ids, state=PurchaseRequest.State.ACCEPTED
+        ).update(state=PurchaseRequest.State.PENDING, updated_at=timezone.now())
+
+
+def _update_state(
+    item_ids: List[int], expected_state: str, new_state: str, user
+) -> List[int]:
+    quote_name = connection.ops.quote_name
+    sql = (
+        f"UPDATE {quote_name(Item._meta.db_table)} "
+        f"SET {quote_name('state')} = %s, {quote_name('updated_at')} = %s "
+        f"WHERE {quote_name('id')} = ANY(%s) "
+        f"AND {quote_name('state')} = %s "
+        f"AND NOT {quote_name('is_banned')}"
+    )
+    params = [new_state, timezone.now(), item_ids, expected_state]
+    if user is not None:
+        sql += f" AND {quote_name('seller_user_id')} = %s"
+        params.append(user.pk)
+    sql += f" RETURNING {quote_name('id')}"
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [item_id for (item_id,) in cursor.fetchall()]
+
+
+def _get_failure_outcomes(item_ids: List[int], user) -> Dict[int, str]:
+    items = {
+        item_id: (seller_user_id, is_banned)
+        for item_id, seller_user_id, is_banned in Item.objects.filter(
+            id__in=item_ids
+        ).values_list("id", "seller_user_id", "is_banned")
+    }
+
+    outcomes = {}
+    for item_id in item_ids:
+        if item_id not in items:
+            outcomes[item_id] = ItemNotFoundException.default_code
+            continue
+        seller_user_id, is_banned = items[item_id]
+        if is_banned:
+            outcomes[item_id] = BannedItemException.default_code
+        elif user is not None and seller_user_id != user.pk:
+            outcomes[item_id] = UnauthorizedPurchaseActionRequest.default_code
+        else:
+            outcomes[item_id] = ItemWasNotReservedRequest.default_code
+    return outcomes
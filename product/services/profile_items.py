@@ -0,0 +1,51 @@
+from typing import Dict
+
+from django.db.models import Count, Q
+
+from product.models.item import Item
+
+PROFILE_FILTER_GROUPS = (
+    "reserved_by_user",
+    "bought_by_user",
+    "sold_by_user",
+    "created_by_user_active",
+    "created_by_user_reserved",
+    "banned",
+)
+
+
+def get_profile_filters(user) -> Dict[str, Q]:
+    """
+    Filters of the profile item groups of a user, keyed by group name.
+    """
+    return {
+        "reserved_by_user": Q(buyer_user=user, state=Item.State.RESERVED),
+        "bought_by_user": Q(buyer_user=user, state=Item.State.SOLD),
+        "sold_by_user": Q(seller_user=user, state=Item.State.SOLD),
+        "created_by_user_active": Q(seller_user=user, state=Item.State.ACTIVE),
+        "created_by_user_reserved": Q(
+            seller_user=user, state=Item.State.RESERVED
+        ),
+        "banned": Q(seller_user=user, is_banned=True),
+    }
+
+
+def get_profile_item_counts(user) -> Dict[str, int]:
+    """
+    Count the items of every profile group of a user.
+
+    Uses one conditional aggregation over the user's sold and bought items,
+    which the `(seller_user, state)` and `(buyer_user, state)` indexes serve.
+
+    Returns:
+        dict[str, int]: The number of items per group name.
+    """
+    filters = get_profile_filters(user)
+    return Item.objects.filter(
+        Q(seller_user=user) | Q(buyer_user=user)
+    ).aggregate(
+        **{
+            group: Count("id", filter=filters[group])
+            for group in PROFILE_FILTER_GROUPS
+        }
+    )
@@ -1,16 +1,44 @@
 from django.db import transaction
 
+from product.exceptions import PurchaseRequestNotFoundException
 from product.models.item import Item
 from product.models.purchase_request import PurchaseRequest
+from product.validators.validators import validate_accept_purchase_request
 
 
-def accept_purchase_request(purchase_request_id):
+def accept_purchase_request(user, purchase_request_id) -> PurchaseRequest:
+    """
+    Validate and accept a purchase request, reserving its item for the buyer.
+
+    The purchase request and its item are loaded with one locking query, so
+    concurrent accepts on the same item are serialized and only the first
+    one passes validation.
+
+    Args:
+        user: The user accepting the request, who must be the item's seller.
+        purchase_request_id: Id of the purchase request to accept.
+
+    Returns:
+        PurchaseRequest: The accepted purchase request.
+    """
     with transaction.atomic():
-        purchase_request = PurchaseRequest.objects.get(id=purchase_request_id)
+        try:
+            purchase_request = (
+                PurchaseRequest.objects.select_related("item")
+                .select_for_update(of=("self", "item"))
+                .get(id=purchase_request_id)
+            )
+        except PurchaseRequest.DoesNotExist:
+            raise PurchaseRequestNotFoundException()
+
+        validate_accept_purchase_request(user, purchase_request)
+
         purchase_request.state = PurchaseRequest.State.ACCEPTED
-        purchase_request.save()
+        purchase_request.save(update_fields=["state", "updated_at"])
 
         item = purchase_request.item
         item.state = Item.State.RESERVED
-        item.buyer_user = purchase_request.buyer_user
-        item.save()
+        item.buyer_user_id = purchase_request.buyer_user_id
+        item.save(update_fields=["state", "buyer_user", "updated_at"])
+
+    return purchase_request
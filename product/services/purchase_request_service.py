@@ -4,12 +4,20 @@ from product.models.purchase_request import PurchaseRequest
 
 
 def create_or_update_purchase_request(item_id, buyer, comment):
-    item = Item.objects.filter(id=item_id, is_banned=False).first()
-    if not item:
+    """
+    Create the buyer's purchase request for an item, or update its comment.
+
+    Runs as a single `INSERT ... ON CONFLICT (item, buyer_user) DO UPDATE`,
+    so concurrent submits of the same buyer never create duplicates.
+    """
+    if not Item.objects.filter(id=item_id, is_banned=False).exists():
         raise ItemNotFoundException()
 
-    purchase_request, created = PurchaseRequest.objects.update_or_create(
-        item=item, buyer_user=buyer, defaults={"comment": comment}
+    (purchase_request,) = PurchaseRequest.objects.bulk_create(
+        [PurchaseRequest(item_id=item_id, buyer_user=buyer, comment=comment)],
+        update_conflicts=True,
+        unique_fields=["item", "buyer_user"],
+        update_fields=["comment", "updated_at"],
     )
 
     return purchase_request
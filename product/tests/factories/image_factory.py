@@ -9,12 +9,16 @@ from product.models.image import Image
 class ImageFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Image
+        exclude = ["color"]
 
     content_type = factory.Faker("mime_type", category="image")
 
+    # Distinct colors give distinct bytes, since content hashes are unique.
+    color = factory.Sequence(lambda n: (n % 256, n // 256 % 256, 0))
+
     @factory.lazy_attribute
     def image_data(self):
-        img = PILImage.new("RGB", (100, 100), color=(255, 0, 0))
+        img = PILImage.new("RGB", (100, 100), color=self.color)
         buffer = BytesIO()
-        img.save(buffer, format="JPEG")
+        img.save(buffer, format="PNG")
         return buffer.getvalue()
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from product.tests.factories.banner_factory import BannerFactory
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.image_factory import ImageFactory
+from product.tests.factories.item_factory import ItemFactory
+from product.tests.factories.purchase_request_factory import (
+    PurchaseRequestFactory,
+)
+from user.tests.factories.user_factory import UserFactory
+
+
+class ProductAdminChangelistTests(TestCase):
+    def setUp(self):
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+        self.category = CategoryFactory()
+
+    def create_rows(self, count):
+        for _ in range(count):
+            item = ItemFactory(
+                title="Item",
+                seller_user=UserFactory(),
+                category=self.category,
+                price=1,
+            )
+            BannerFactory(item=item, image=ImageFactory(), order=1)
+            PurchaseRequestFactory(item=item)
+
+    def count_changelist_queries(self, url_name):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name), secure=True)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assert_constant_queries(self, url_name):
+        # Arrange
+        self.create_rows(2)
+        queries_for_few_rows = self.count_changelist_queries(url_name)
+        self.create_rows(8)
+
+        # Act
+        queries_for_more_rows = self.count_changelist_queries(url_name)
+
+        # Assert
+        self.assertEqual(queries_for_few_rows, queries_for_more_rows)
+
+    def test_item_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:product_item_changelist")
+
+    def test_banner_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:product_banner_changelist")
+
+    def test_image_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:product_image_changelist")
+
+    def test_purchase_request_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:product_purchaserequest_changelist")
@@ -0,0 +1,113 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from product.models.category import Category
+from product.models.item import Item
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class CategoryTreeTests(TestCase):
+    def setUp(self):
+        self.electronics = CategoryFactory(title="Electronics")
+        self.phones = CategoryFactory(title="Phones", parent=self.electronics)
+        self.smartphones = CategoryFactory(
+            title="Smartphones", parent=self.phones
+        )
+
+    def test_path_contains_ancestors(self):
+        # Assert
+        self.assertEqual(self.electronics.path, f"/{self.electronics.id}/")
+        self.assertEqual(
+            Category.parse_path(self.smartphones.path),
+            [self.electronics.id, self.phones.id, self.smartphones.id],
+        )
+
+    def test_moving_category_moves_descendants(self):
+        # Arrange
+        home = CategoryFactory(title="Home")
+
+        # Act
+        self.phones.parent = home
+        self.phones.save()
+
+        # Assert
+        self.smartphones.refresh_from_db()
+        self.assertEqual(
+            self.smartphones.path,
+            f"/{home.id}/{self.phones.id}/{self.smartphones.id}/",
+        )
+
+    def test_category_cannot_move_under_its_descendant(self):
+        # Act & Assert
+        self.electronics.parent = self.smartphones
+        with self.assertRaises(ValidationError):
+            self.electronics.save()
+
+
+class CategoryItemCountTests(TestCase):
+    def setUp(self):
+        self.category = CategoryFactory(title="Phones")
+        self.other_category = CategoryFactory(title="Laptops")
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=self.category,
+            price=1,
+        )
+
+    def assert_item_counts(self, count, other_count):
+        self.category.refresh_from_db()
+        self.other_category.refresh_from_db()
+        self.assertEqual(self.category.item_count, count)
+        self.assertEqual(self.other_category.item_count, other_count)
+
+    def test_count_listed_items(self):
+        # Act
+        ItemFactory(
+            title="Sold",
+            seller_user=UserFactory(),
+            category=self.category,
+            price=1,
+            state=Item.State.SOLD,
+        )
+
+        # Assert
+        self.assert_item_counts(1, 0)
+
+    def test_count_follows_item_changes(self):
+        # Act & Assert
+        Item.objects.filter(id=self.item.id).update(is_banned=True)
+        self.assert_item_counts(0, 0)
+
+        Item.objects.filter(id=self.item.id).update(
+            is_banned=False, category=self.other_category
+        )
+        self.assert_item_counts(0, 1)
+
+        Item.objects.filter(id=self.item.id).update(state=Item.State.RESERVED)
+        self.assert_item_counts(0, 1)
+
+        Item.objects.filter(id=self.item.id).delete()
+        self.assert_item_counts(0, 0)
+
+    def test_count_follows_bulk_updates(self):
+        # Arrange
+        for _ in range(2):
+            ItemFactory(
+                title="Other",
+                seller_user=UserFactory(),
+                category=self.other_category,
+                price=1,
+            )
+
+        # Act & Assert
+        Item.objects.update(category=self.category)
+        self.assert_item_counts(3, 0)
+
+        Item.objects.filter(id=self.item.id).update(
+            category=self.other_category
+        )
+        Item.objects.exclude(id=self.item.id).update(state=Item.State.SOLD)
+        self.assert_item_counts(0, 1)
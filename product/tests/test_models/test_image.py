@@ -0,0 +1,59 @@
+from django.test import TestCase
+
+from product.models.image import Image
+from product.tests.factories.banner_factory import BannerFactory
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.image_factory import ImageFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class ImageManagerTests(TestCase):
+    def setUp(self):
+        self.image = ImageFactory()
+
+    def test_image_data_is_deferred_by_default(self):
+        # Act
+        image = Image.objects.get(id=self.image.id)
+
+        # Assert
+        self.assertIn("image_data", image.get_deferred_fields())
+
+    def test_with_data_loads_image_data(self):
+        # Act
+        with self.assertNumQueries(1):
+            image = Image.objects.with_data().get(id=self.image.id)
+            data = bytes(image.image_data)
+
+        # Assert
+        self.assertEqual(data, bytes(self.image.image_data))
+
+    def test_related_access_defers_image_data(self):
+        # Arrange
+        item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=CategoryFactory(),
+            price=1,
+        )
+        banner = BannerFactory(item=item, image=self.image, order=1)
+        banner.refresh_from_db()
+
+        # Act
+        image = banner.image
+
+        # Assert
+        self.assertIn("image_data", image.get_deferred_fields())
+
+    def test_save_deferred_image_keeps_hash(self):
+        # Arrange
+        image = Image.objects.get(id=self.image.id)
+
+        # Act
+        image.content_type = "image/png"
+        image.save()
+
+        # Assert
+        image.refresh_from_db()
+        self.assertEqual(image.content_hash, self.image.content_hash)
+        self.assertEqual(image.content_type, "image/png")
@@ -0,0 +1,97 @@
+from django.test import TestCase
+
+from product.models.banner import Banner
+from product.models.item import Item
+from product.models.listing import Listing
+from product.tests.factories.banner_factory import BannerFactory
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.image_factory import ImageFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class ListingSyncTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.category = CategoryFactory()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=self.user,
+            category=self.category,
+            price=10,
+        )
+
+    def test_created_item_is_listed(self):
+        # Act
+        listing = Listing.objects.get(item=self.item)
+
+        # Assert
+        self.assertEqual(listing.title, "Item")
+        self.assertEqual(listing.price, 10)
+        self.assertEqual(listing.category_id, self.category.id)
+        self.assertEqual(listing.seller_user_id, self.user.pk)
+        self.assertEqual(listing.created_at, self.item.created_at)
+        self.assertIsNone(listing.first_image_id)
+
+    def test_edit_updates_listing(self):
+        # Arrange
+        other_category = CategoryFactory()
+
+        # Act
+        self.item.title = "Edited"
+        self.item.price = 20
+        self.item.category = other_category
+        self.item.save()
+
+        # Assert
+        listing = Listing.objects.get(item=self.item)
+        self.assertEqual(listing.title, "Edited")
+        self.assertEqual(listing.price, 20)
+        self.assertEqual(listing.category_id, other_category.id)
+
+    def test_state_changes_unlist_and_relist(self):
+        # Act & Assert
+        Item.objects.filter(id=self.item.id).update(state=Item.State.SOLD)
+        self.assertFalse(Listing.objects.filter(item=self.item).exists())
+
+        Item.objects.filter(id=self.item.id).update(state=Item.State.RESERVED)
+        self.assertTrue(Listing.objects.filter(item=self.item).exists())
+
+    def test_ban_unlists_item(self):
+        # Act
+        Item.objects.filter(id=self.item.id).update(is_banned=True)
+
+        # Assert
+        self.assertFalse(Listing.objects.filter(item=self.item).exists())
+
+    def test_delete_unlists_item(self):
+        # Arrange
+        BannerFactory(item=self.item, image=ImageFactory(), order=1)
+
+        # Act
+        self.item.delete()
+
+        # Assert
+        self.assertFalse(Listing.objects.exists())
+
+    def test_banners_update_first_image(self):
+        # Arrange
+        first_image = ImageFactory()
+        second_image = ImageFactory()
+
+        # Act & Assert
+        BannerFactory(item=self.item, image=second_image, order=2)
+        first_banner = BannerFactory(item=self.item, image=first_image, order=1)
+        self.assertEqual(
+            Listing.objects.get(item=self.item).first_image_id,
+            first_image.id,
+        )
+
+        Banner.objects.filter(id=first_banner.id).delete()
+        self.assertEqual(
+            Listing.objects.get(item=self.item).first_image_id,
+            second_image.id,
+        )
+
+        Banner.objects.filter(item=self.item).delete()
+        self.assertIsNone(Listing.objects.get(item=self.item).first_image_id)
@@ -0,0 +1,136 @@
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from product.models.item import Item
+from product.models.listing import Listing
+from product.serializers.item_list_serializer import FastItemListSerializer
+from product.serializers.item_serializer import ItemWithImagesSerializer
+from product.tests.factories.banner_factory import BannerFactory
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.image_factory import ImageFactory
+from product.tests.factories.item_factory import ItemFactory
+from product.tests.factories.purchase_request_factory import (
+    PurchaseRequestFactory,
+)
+from user.tests.factories.user_factory import UserFactory
+
+
+class FastItemListSerializerTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        category = CategoryFactory()
+        self.items = [
+            ItemFactory(
+                title=f"Item {index}",
+                seller_user=self.user if index % 2 else UserFactory(),
+                category=category,
+                price=100 + index,
+                description="توضیحات",
+            )
+            for index in range(4)
+        ]
+        for order in (2, 1):
+            BannerFactory(item=self.items[0], image=ImageFactory(), order=order)
+        PurchaseRequestFactory(item=self.items[1])
+
+    def make_request(self, params=None):
+        request = APIRequestFactory().get("/items", params or {})
+        force_authenticate(request, user=self.user)
+        return APIView().initialize_request(request)
+
+    def render_both(self, params=None, source=Item):
+        request = self.make_request(params)
+        queryset = source.objects.order_by("-created_at")
+
+        expected = ItemWithImagesSerializer(
+            Item.objects.order_by("-created_at"),
+            many=True,
+            context={"request": request},
+        ).data
+        serializer = FastItemListSerializer(request)
+        actual = serializer.serialize(
+            list(serializer.prepare_queryset(queryset))
+        )
+        return JSONRenderer().render(expected), JSONRenderer().render(actual)
+
+    def test_same_json_as_model_serializer(self):
+        # Act
+        expected, actual = self.render_both()
+
+        # Assert
+        self.assertEqual(actual, expected)
+
+    def test_same_json_with_sparse_fieldset(self):
+        # Act
+        expected, actual = self.render_both({"view": "card"})
+
+        # Assert
+        self.assertEqual(actual, expected)
+
+    def test_serializes_page_with_batched_lookups(self):
+        # Arrange
+        serializer = FastItemListSerializer(self.make_request())
+        rows = list(serializer.prepare_queryset(Item.objects.all()))
+
+        # Act & Assert
+        with self.assertNumQueries(2):
+            serializer.serialize(rows)
+
+    def test_same_json_from_listings(self):
+        # Act
+        expected, actual = self.render_both(source=Listing)
+
+        # Assert
+        self.assertEqual(actual, expected)
+
+    def test_card_view_from_listings_needs_no_lookups(self):
+        # Arrange
+        serializer = FastItemListSerializer(self.make_request({"view": "card"}))
+        rows = list(serializer.prepare_queryset(Listing.objects.all()))
+
+        # Act & Assert
+        with self.assertNumQueries(0):
+            data = serializer.serialize(rows)
+        self.assertEqual(len(data), 4)
+
+    def test_skips_listings_of_items_deleted_meanwhile(self):
+        # Arrange
+        serializer = FastItemListSerializer(self.make_request())
+        rows = list(serializer.prepare_queryset(Listing.objects.all()))
+        Item.objects.filter(id=self.items[0].id).delete()
+
+        # Act
+        data = serializer.serialize(rows)
+
+        # Assert
+        self.assertEqual(
+            {item["id"] for item in data},
+            {item.id for item in self.items[1:]},
+        )
+
+    def test_banners_with_equal_order_follow_listing_first_image(self):
+        # Arrange
+        banners = [
+            BannerFactory(item=self.items[1], image=ImageFactory(), order=1)
+            for _ in range(2)
+        ]
+
+        # Act
+        expected, actual = self.render_both(source=Listing)
+        serializer = FastItemListSerializer(self.make_request())
+        data = serializer.serialize(
+            list(
+                serializer.prepare_queryset(
+                    Listing.objects.filter(item=self.items[1])
+                )
+            )
+        )
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            data[0]["image_ids"], [banner.image_id for banner in banners]
+        )
+        self.assertEqual(data[0]["first_image_id"], banners[0].image_id)
@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from product.models.category import Category
+from product.services.category_registry import (
+    VERSION_KEY,
+    category_registry,
+)
+from product.tests.factories.category_factory import CategoryFactory
+
+
+class CategoryRegistryTests(TestCase):
+    def setUp(self):
+        cache.delete(VERSION_KEY)
+        self.category = CategoryFactory(title="Category 1")
+
+    def test_steady_state_reads_without_queries(self):
+        # Arrange
+        category_registry.get_all()
+        category_count = Category.objects.count()
+
+        # Act & Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                category_registry.get(self.category.id).title, "Category 1"
+            )
+            self.assertEqual(len(category_registry.get_data()), category_count)
+
+    def test_save_invalidates_registry(self):
+        # Arrange
+        category_registry.get_all()
+
+        # Act
+        new_category = CategoryFactory(title="Category 2")
+        self.category.title = "Renamed"
+        self.category.save()
+
+        # Assert
+        self.assertEqual(
+            category_registry.get(self.category.id).title, "Renamed"
+        )
+        self.assertIsNotNone(category_registry.get(new_category.id))
+
+    def test_queryset_delete_invalidates_registry(self):
+        # Arrange
+        category_registry.get_all()
+
+        # Act
+        Category.objects.all().delete()
+
+        # Assert
+        self.assertIsNone(category_registry.get(self.category.id))
+        self.assertEqual(category_registry.get_all(), [])
+
+    def test_lost_version_reloads_registry(self):
+        # Arrange
+        category_registry.get_all()
+        cache.delete(VERSION_KEY)
+        Category.objects.filter(id=self.category.id).update(title="Updated")
+
+        # Act
+        category = category_registry.get(self.category.id)
+
+        # Assert
+        self.assertEqual(category.title, "Updated")
+
+    @override_settings(CATEGORY_REGISTRY_LOCAL_TTL=0)
+    def test_process_local_cache_reloads_after_ttl(self):
+        # Arrange
+        category_registry.get_all()
+        # An update from another process leaves this process's version as is.
+        Category.objects.filter(id=self.category.id).update(title="Updated")
+
+        # Act
+        category = category_registry.get(self.category.id)
+
+        # Assert
+        self.assertEqual(category.title, "Updated")
@@ -0,0 +1,189 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+
+from product.models.banner import Banner
+from product.models.image import Image
+from product.services import image_repository
+from product.services.image_repository import (
+    collect_orphaned_images_batch,
+    delete_unreferenced_images,
+    get_dedup_stats,
+    store_image,
+)
+from product.tests.factories.banner_factory import BannerFactory
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.image_factory import ImageFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class StoreImageTests(TestCase):
+    @staticmethod
+    def make_file(content):
+        return SimpleUploadedFile(
+            name="image.png", content=content, content_type="image/png"
+        )
+
+    def test_store_new_image(self):
+        # Act
+        image_id, created = store_image(self.make_file(b"first"))
+
+        # Assert
+        self.assertTrue(created)
+        image = Image.objects.get(id=image_id)
+        self.assertEqual(image.content_hash, Image.compute_hash(b"first"))
+        self.assertEqual(image.size, 5)
+        self.assertEqual(image.upload_count, 1)
+
+    def test_store_identical_image_is_deduplicated(self):
+        # Arrange
+        first_id, _ = store_image(self.make_file(b"same bytes"))
+
+        # Act
+        second_id, created = store_image(self.make_file(b"same bytes"))
+
+        # Assert
+        self.assertFalse(created)
+        self.assertEqual(first_id, second_id)
+        self.assertEqual(Image.objects.count(), 1)
+        self.assertEqual(Image.objects.get(id=first_id).upload_count, 2)
+
+    def test_store_different_images(self):
+        # Act
+        first_id, _ = store_image(self.make_file(b"first"))
+        second_id, created = store_image(self.make_file(b"second"))
+
+        # Assert
+        self.assertTrue(created)
+        self.assertNotEqual(first_id, second_id)
+
+    def test_concurrently_stored_image_is_reused(self):
+        # Arrange
+        first_id, _ = store_image(self.make_file(b"same bytes"))
+        reuse_image = image_repository.reuse_image
+        # The first lookup misses, as if the other upload hadn't committed.
+        lookups = iter([lambda content_hash: None, reuse_image])
+
+        # Act
+        with patch.object(
+            image_repository,
+            "reuse_image",
+            side_effect=lambda content_hash: next(lookups)(content_hash),
+        ):
+            second_id, created = store_image(self.make_file(b"same bytes"))
+
+        # Assert
+        self.assertFalse(created)
+        self.assertEqual(first_id, second_id)
+        self.assertEqual(Image.objects.count(), 1)
+        self.assertEqual(Image.objects.get(id=first_id).upload_count, 2)
+
+    def test_content_hash_is_unique(self):
+        # Arrange
+        ImageFactory(content_hash="a" * 64)
+
+        # Act & Assert
+        with self.assertRaises(IntegrityError):
+            ImageFactory(content_hash="a" * 64)
+
+    def test_dedup_stats(self):
+        # Arrange
+        store_image(self.make_file(b"1234"))
+        store_image(self.make_file(b"1234"))
+        store_image(self.make_file(b"1234"))
+        store_image(self.make_file(b"56"))
+
+        # Act
+        stats = get_dedup_stats()
+
+        # Assert
+        self.assertEqual(stats["images"], 2)
+        self.assertEqual(stats["uploads"], 4)
+        self.assertEqual(stats["dedup_ratio"], 2.0)
+        self.assertEqual(stats["stored_bytes"], 6)
+        self.assertEqual(stats["saved_bytes"], 8)
+
+
+class DeleteUnreferencedImagesTests(TestCase):
+    def setUp(self):
+        seller_user = UserFactory()
+        category = CategoryFactory()
+        self.item = ItemFactory(
+            title="Item", seller_user=seller_user, category=category, price=1
+        )
+        self.other_item = ItemFactory(
+            title="Other", seller_user=seller_user, category=category, price=1
+        )
+        self.shared_image = ImageFactory()
+        self.own_image = ImageFactory()
+        BannerFactory(item=self.item, image=self.shared_image, order=1)
+        BannerFactory(item=self.item, image=self.own_image, order=2)
+        BannerFactory(item=self.other_item, image=self.shared_image, order=1)
+
+    def test_keeps_images_used_by_other_banners(self):
+        # Arrange
+        Banner.objects.filter(item=self.item).delete()
+
+        # Act
+        delete_unreferenced_images([self.shared_image.id, self.own_image.id])
+
+        # Assert
+        self.assertTrue(Image.objects.filter(id=self.shared_image.id).exists())
+        self.assertFalse(Image.objects.filter(id=self.own_image.id).exists())
+
+
+class CollectOrphanedImagesBatchTests(TestCase):
+    def setUp(self):
+        item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=CategoryFactory(),
+            price=1,
+        )
+        self.used_image = ImageFactory()
+        BannerFactory(item=item, image=self.used_image, order=1)
+        self.old_orphan = ImageFactory()
+        self.recent_orphan = ImageFactory()
+        Image.objects.filter(
+            id__in=[self.used_image.id, self.old_orphan.id]
+        ).update(updated_at=timezone.now() - timedelta(days=2))
+        self.cutoff = timezone.now() - timedelta(days=1)
+
+    def test_collects_only_old_orphans(self):
+        # Act
+        last_id, images, reclaimed_bytes = collect_orphaned_images_batch(
+            cutoff=self.cutoff
+        )
+
+        # Assert
+        self.assertEqual(last_id, self.old_orphan.id)
+        self.assertEqual(images, 1)
+        self.assertEqual(reclaimed_bytes, self.old_orphan.size)
+        self.assertFalse(Image.objects.filter(id=self.old_orphan.id).exists())
+        self.assertTrue(Image.objects.filter(id=self.used_image.id).exists())
+        self.assertTrue(Image.objects.filter(id=self.recent_orphan.id).exists())
+
+    def test_dry_run_keeps_images(self):
+        # Act
+        _, images, _ = collect_orphaned_images_batch(
+            cutoff=self.cutoff, dry_run=True
+        )
+
+        # Assert
+        self.assertEqual(images, 1)
+        self.assertTrue(Image.objects.filter(id=self.old_orphan.id).exists())
+
+    def test_resumes_after_given_id(self):
+        # Act
+        last_id, images, _ = collect_orphaned_images_batch(
+            cutoff=self.cutoff, after_id=self.old_orphan.id
+        )
+
+        # Assert
+        self.assertIsNone(last_id)
+        self.assertEqual(images, 0)
@@ -0,0 +1,85 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from product.models.item import Item
+from product.services.item_facets import (
+    PRICE_BUCKETS,
+    get_cache_key,
+    get_item_facets,
+)
+from product.services.category_registry import category_registry
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+
+class GetItemFacetsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = UserFactory()
+        self.parent = CategoryFactory()
+        self.child = CategoryFactory(parent=self.parent)
+        self.other = CategoryFactory()
+        ItemFactory(title="A", seller_user=user, category=self.parent, price=5)
+        ItemFactory(title="B", seller_user=user, category=self.child, price=50)
+        ItemFactory(title="C", seller_user=user, category=self.child, price=99)
+        ItemFactory(title="D", seller_user=user, category=self.other, price=99)
+
+    def test_counts_categories_and_prices_in_one_query(self):
+        # Arrange
+        category_registry.get_all()
+
+        # Act
+        with self.assertNumQueries(1):
+            facets = get_item_facets(
+                Item.objects.all(), search_terms=[], max_price=99
+            )
+
+        # Assert
+        self.assertEqual(
+            facets["categories"],
+            [
+                {"id": self.parent.id, "count": 3},
+                {"id": self.child.id, "count": 2},
+                {"id": self.other.id, "count": 1},
+            ],
+        )
+        histogram = facets["price_histogram"]
+        self.assertEqual(len(histogram), PRICE_BUCKETS)
+        self.assertEqual(histogram[0], {"min": 0, "max": 9, "count": 1})
+        self.assertEqual(histogram[5], {"min": 50, "max": 59, "count": 1})
+        self.assertEqual(histogram[-1], {"min": 90, "max": 99, "count": 2})
+        self.assertEqual(sum(bucket["count"] for bucket in histogram), 4)
+
+    def test_cached_per_normalized_search(self):
+        # Arrange
+        get_item_facets(
+            Item.objects.filter(title="A"), search_terms=["A"], max_price=99
+        )
+
+        # Act & Assert
+        with self.assertNumQueries(0):
+            facets = get_item_facets(
+                Item.objects.filter(title="A"),
+                search_terms=["a"],
+                max_price=99,
+            )
+        self.assertEqual(
+            facets["categories"], [{"id": self.parent.id, "count": 1}]
+        )
+        self.assertNotEqual(
+            get_cache_key(["a"], max_price=99),
+            get_cache_key(["b"], max_price=99),
+        )
+
+    def test_empty_queryset(self):
+        # Act
+        facets = get_item_facets(
+            Item.objects.none(), search_terms=[], max_price=None
+        )
+
+        # Assert
+        self.assertEqual(facets["categories"], [])
+        self.assertEqual(
+            sum(bucket["count"] for bucket in facets["price_histogram"]), 0
+        )
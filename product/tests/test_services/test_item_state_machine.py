@@ -0,0 +1,113 @@
+from django.test import TestCase
+
+from product.models.item import Item
+from product.models.purchase_request import PurchaseRequest
+from product.services.item_state_machine import (
+    ItemTransition,
+    transition_items,
+)
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from product.tests.factories.purchase_request_factory import (
+    PurchaseRequestFactory,
+)
+from user.tests.factories.user_factory import UserFactory
+
+
+class TransitionItemsTests(TestCase):
+    def setUp(self):
+        self.seller_user = UserFactory()
+        self.category = CategoryFactory()
+        self.reserved_items = [
+            self.create_item(state=Item.State.RESERVED) for _ in range(3)
+        ]
+        self.active_item = self.create_item(state=Item.State.ACTIVE)
+        self.banned_item = self.create_item(
+            state=Item.State.RESERVED, is_banned=True
+        )
+        self.other_seller_item = self.create_item(
+            state=Item.State.RESERVED, seller_user=UserFactory()
+        )
+
+    def create_item(self, **kwargs):
+        kwargs.setdefault("seller_user", self.seller_user)
+        return ItemFactory(
+            title="Item", category=self.category, price=1, **kwargs
+        )
+
+    def test_sell_many_items(self):
+        # Arrange
+        item_ids = [item.id for item in self.reserved_items]
+
+        # Act
+        with self.assertNumQueries(3):
+            # savepoint, update, release
+            outcomes = transition_items(
+                item_ids, ItemTransition.SELL, user=self.seller_user
+            )
+
+        # Assert
+        self.assertEqual(outcomes, {item_id: "ok" for item_id in item_ids})
+        self.assertEqual(
+            Item.objects.filter(id__in=item_ids, state=Item.State.SOLD).count(),
+            3,
+        )
+
+    def test_reactivate_resets_accepted_purchase_requests(self):
+        # Arrange
+        item = self.reserved_items[0]
+        purchase_request = PurchaseRequestFactory(
+            item=item, state=PurchaseRequest.State.ACCEPTED
+        )
+
+        # Act
+        outcomes = transition_items(
+            [item.id], ItemTransition.REACTIVATE, user=self.seller_user
+        )
+
+        # Assert
+        self.assertEqual(outcomes, {item.id: "ok"})
+        item.refresh_from_db()
+        purchase_request.refresh_from_db()
+        self.assertEqual(item.state, Item.State.ACTIVE)
+        self.assertEqual(purchase_request.state, PurchaseRequest.State.PENDING)
+
+    def test_reports_outcome_per_item(self):
+        # Arrange
+        missing_id = self.other_seller_item.id + 1000
+
+        # Act
+        outcomes = transition_items(
+            [
+                self.reserved_items[0].id,
+                self.active_item.id,
+                self.banned_item.id,
+                self.other_seller_item.id,
+                missing_id,
+            ],
+            ItemTransition.SELL,
+            user=self.seller_user,
+        )
+
+        # Assert
+        self.assertEqual(
+            outcomes,
+            {
+                self.reserved_items[0].id: "ok",
+                self.active_item.id: "item was not reserved.",
+                self.banned_item.id: "banned item.",
+                self.other_seller_item.id: "unauthorized request.",
+                missing_id: "item not found.",
+            },
+        )
+        self.active_item.refresh_from_db()
+        self.assertEqual(self.active_item.state, Item.State.ACTIVE)
+
+    def test_admin_transition_ignores_seller(self):
+        # Act
+        outcomes = transition_items(
+            [self.other_seller_item.id], ItemTransition.SELL
+        )
+
+        # Assert
+        self.assertEqual(outcomes, {self.other_seller_item.id: "ok"})
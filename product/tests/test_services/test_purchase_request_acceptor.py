@@ -0,0 +1,110 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase
+
+from product.exceptions import PurchaseRequestAlreadyAcceptedException
+from product.models.item import Item
+from product.models.purchase_request import PurchaseRequest
+from product.services.purchase_request_acceptor import accept_purchase_request
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from product.tests.factories.purchase_request_factory import (
+    PurchaseRequestFactory,
+)
+from user.tests.factories.user_factory import UserFactory
+
+
+class AcceptPurchaseRequestTests(TestCase):
+    def setUp(self):
+        self.seller_user = UserFactory()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=self.seller_user,
+            category=CategoryFactory(),
+            price=1,
+        )
+        self.purchase_request = PurchaseRequestFactory(item=self.item)
+
+    def test_accept_reserves_item_for_buyer(self):
+        # Act
+        with self.assertNumQueries(6):
+            # savepoint, locking select, exists, two updates, release
+            accept_purchase_request(self.seller_user, self.purchase_request.id)
+
+        # Assert
+        self.purchase_request.refresh_from_db()
+        self.item.refresh_from_db()
+        self.assertEqual(
+            self.purchase_request.state, PurchaseRequest.State.ACCEPTED
+        )
+        self.assertEqual(self.item.state, Item.State.RESERVED)
+        self.assertEqual(
+            self.item.buyer_user_id, self.purchase_request.buyer_user_id
+        )
+
+    def test_accept_second_request_of_item(self):
+        # Arrange
+        other_request = PurchaseRequestFactory(item=self.item)
+        accept_purchase_request(self.seller_user, self.purchase_request.id)
+
+        # Act & Assert
+        with self.assertRaises(PurchaseRequestAlreadyAcceptedException):
+            accept_purchase_request(self.seller_user, other_request.id)
+
+
+class ConcurrentAcceptPurchaseRequestTests(TransactionTestCase):
+    REQUEST_COUNT = 5
+
+    def test_parallel_accepts_on_one_item(self):
+        # Arrange
+        seller_user = UserFactory()
+        item = ItemFactory(
+            title="Item",
+            seller_user=seller_user,
+            category=CategoryFactory(),
+            price=1,
+        )
+        purchase_requests = [
+            PurchaseRequestFactory(item=item) for _ in range(self.REQUEST_COUNT)
+        ]
+
+        def accept(purchase_request):
+            try:
+                accept_purchase_request(seller_user, purchase_request.id)
+                return True
+            except PurchaseRequestAlreadyAcceptedException:
+                return False
+            finally:
+                connection.close()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=self.REQUEST_COUNT) as executor:
+            results = list(executor.map(accept, purchase_requests))
+
+        # Assert
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(
+            PurchaseRequest.objects.filter(
+                item=item, state=PurchaseRequest.State.ACCEPTED
+            ).count(),
+            1,
+        )
+
+
+class PurchaseRequestConstraintTests(TestCase):
+    def test_only_one_accepted_request_per_item(self):
+        # Arrange
+        item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=CategoryFactory(),
+            price=1,
+        )
+        PurchaseRequestFactory(item=item, state=PurchaseRequest.State.ACCEPTED)
+
+        # Act & Assert
+        with self.assertRaises(IntegrityError):
+            PurchaseRequestFactory(
+                item=item, state=PurchaseRequest.State.ACCEPTED
+            )
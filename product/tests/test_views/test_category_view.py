@@ -5,7 +5,9 @@ from rest_framework.test import APIRequestFactory
 
 from product.models.category import Category
 from product.tests.factories.category_factory import CategoryFactory
-from product.views.category_view import CategoryListView
+from product.tests.factories.item_factory import ItemFactory
+from product.views.category_view import CategoryListView, CategoryTreeView
+from user.tests.factories.user_factory import UserFactory
 
 
 class CategoryListViewTests(TestCase):
@@ -55,3 +57,61 @@ class CategoryListViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_category_list_without_queries_when_cached(self):
+        # Arrange
+        CategoryFactory(title="Category 1")
+        self.view(self.factory.get(self.url))
+        request = self.factory.get(self.url)
+
+        # Act
+        with self.assertNumQueries(0):
+            response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["title"], "Category 1")
+
+
+class CategoryTreeViewTests(TestCase):
+    def setUp(self):
+        self.view = CategoryTreeView.as_view()
+        self.url = reverse("category-tree")
+        self.factory = APIRequestFactory()
+
+        Category.objects.all().delete()
+        self.electronics = CategoryFactory(title="Electronics")
+        self.phones = CategoryFactory(title="Phones", parent=self.electronics)
+        seller_user = UserFactory()
+        for category in (self.electronics, self.phones, self.phones):
+            ItemFactory(
+                title="Item",
+                seller_user=seller_user,
+                category=category,
+                price=1,
+            )
+
+    def test_get_category_tree_with_subtree_counts(self):
+        # Act
+        response = self.view(self.factory.get(self.url))
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    "id": self.electronics.id,
+                    "title": "Electronics",
+                    "item_count": 3,
+                    "children": [
+                        {
+                            "id": self.phones.id,
+                            "title": "Phones",
+                            "item_count": 2,
+                            "children": [],
+                        }
+                    ],
+                }
+            ],
+        )
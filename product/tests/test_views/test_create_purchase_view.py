@@ -61,3 +61,31 @@ class CreatePurchaseRequestTests(TestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["code"], "item not found.")
+
+    def test_create_purchase_twice_updates_existing_request(self):
+        # Arrange
+        first_request = self.factory.post(
+            self.create_url,
+            {"item_id": self.item.id, "comment": "First comment"},
+            format="json",
+        )
+        force_authenticate(first_request, user=self.buyer_user)
+        first_response = self.create_view(first_request)
+
+        second_request = self.factory.post(
+            self.create_url,
+            {"item_id": self.item.id, "comment": "Second comment"},
+            format="json",
+        )
+        force_authenticate(second_request, user=self.buyer_user)
+
+        # Act
+        second_response = self.create_view(second_request)
+
+        # Assert
+        self.assertEqual(
+            first_response.data["request_id"],
+            second_response.data["request_id"],
+        )
+        purchase_request = PurchaseRequest.objects.get(item=self.item)
+        self.assertEqual(purchase_request.comment, "Second comment")
@@ -3,6 +3,7 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, force_authenticate
 
+from product.models.purchase_request import PurchaseRequest
 from product.tests.factories.category_factory import CategoryFactory
 from product.tests.factories.item_factory import ItemFactory
 from product.tests.factories.purchase_request_factory import (
@@ -95,8 +96,10 @@ class GetPurchaseRequestViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.purchase_request.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["results"][0]["id"], self.purchase_request.id
+        )
 
     def test_get_purchase_requests_for_item_view_with_another_user_user(self):
         # Arrange
@@ -113,3 +116,53 @@ class GetPurchaseRequestViewTests(TestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["code"], "item not found.")
+
+    def test_get_purchase_requests_for_item_view_is_paginated(self):
+        # Arrange
+        for _ in range(4):
+            PurchaseRequestFactory(item=self.item)
+        url = reverse(
+            "get-purchase-requests-for-item", kwargs={"item_id": self.item.id}
+        )
+        request = self.factory.get(url, {"page_size": 3})
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        with self.assertNumQueries(2):
+            response = self.get_purchase_for_seller_view(
+                request, item_id=self.item.id
+            )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNotNone(response.data["next"])
+        self.assertTrue(
+            all(
+                result["buyer_user_phone"]
+                for result in response.data["results"]
+            )
+        )
+
+    def test_get_purchase_requests_for_item_view_filters_by_state(self):
+        # Arrange
+        PurchaseRequestFactory(
+            item=self.item, state=PurchaseRequest.State.ACCEPTED
+        )
+        url = reverse(
+            "get-purchase-requests-for-item", kwargs={"item_id": self.item.id}
+        )
+        request = self.factory.get(url, {"state": "accepted"})
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        response = self.get_purchase_for_seller_view(
+            request, item_id=self.item.id
+        )
+
+        # Assert
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["results"][0]["state"],
+            PurchaseRequest.State.ACCEPTED,
+        )
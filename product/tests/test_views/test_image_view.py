@@ -58,6 +58,31 @@ class ImageUploadViewTests(TestCase):
         self.assertIn("id", response.data)
         self.assertTrue(Image.objects.filter(id=response.data["id"]).exists())
 
+    def test_upload_same_image_twice_returns_same_id(self):
+        # Arrange
+        first_request = self.factory.post(
+            self.url, {"file": self.valid_image_file}, format="multipart"
+        )
+        force_authenticate(first_request, user=self.user)
+        first_response = self.view(first_request)
+        duplicate_file = SimpleUploadedFile(
+            name="copy.jpeg",
+            content=b"valid_image_content",
+            content_type="image/jpeg",
+        )
+        request = self.factory.post(
+            self.url, {"file": duplicate_file}, format="multipart"
+        )
+        force_authenticate(request, user=self.user)
+
+        # Act
+        response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["id"], first_response.data["id"])
+        self.assertEqual(Image.objects.count(), 1)
+
     def test_upload_invalid_file_type(self):
         # Arrange
         data = {"file": self.invalid_file_type}
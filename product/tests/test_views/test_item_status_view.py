@@ -11,6 +11,7 @@ from product.tests.factories.purchase_request_factory import (
     PurchaseRequestFactory,
 )
 from product.views.item_status_view import (
+    BulkItemTransitionAPIView,
     MarkItemAsSoldAPIView,
     ReactivateItemAPIView,
 )
@@ -115,6 +116,26 @@ class MarkItemAsSoldViewTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["code"], "item not found.")
 
+    def test_mark_banned_item_as_sold(self):
+        # Arrange
+        self.reserved_item.is_banned = True
+        self.reserved_item.save(update_fields=["is_banned"])
+        force_authenticate(
+            self.mark_reserved_item_as_sold_request, user=self.seller_user
+        )
+
+        # Act
+        response = self.mark_as_sold_view(
+            self.mark_reserved_item_as_sold_request,
+            item_id=self.reserved_item.id,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["code"], "banned item.")
+        self.reserved_item.refresh_from_db()
+        self.assertEqual(self.reserved_item.state, Item.State.RESERVED)
+
 
 class ReactivateItemViewTests(TestCase):
     def setUp(self):
@@ -231,3 +252,68 @@ class ReactivateItemViewTests(TestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["code"], "item not found.")
+
+
+class BulkItemTransitionViewTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.bulk_transition_view = BulkItemTransitionAPIView.as_view()
+        self.seller_user = UserFactory()
+        category = CategoryFactory()
+        self.reserved_item = ItemFactory(
+            title="Reserved Item",
+            seller_user=self.seller_user,
+            category=category,
+            price=101,
+            state=Item.State.RESERVED,
+        )
+        self.active_item = ItemFactory(
+            title="Active Item",
+            seller_user=self.seller_user,
+            category=category,
+            price=101,
+            state=Item.State.ACTIVE,
+        )
+        self.url = reverse("bulk_item_transition")
+
+    def test_bulk_sell_items(self):
+        # Arrange
+        request = self.factory.post(
+            self.url,
+            {
+                "item_ids": [self.reserved_item.id, self.active_item.id],
+                "transition": "sell",
+            },
+            format="json",
+        )
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        response = self.bulk_transition_view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            {
+                self.reserved_item.id: "ok",
+                self.active_item.id: "item was not reserved.",
+            },
+        )
+        self.reserved_item.refresh_from_db()
+        self.assertEqual(self.reserved_item.state, Item.State.SOLD)
+
+    def test_bulk_transition_with_invalid_transition(self):
+        # Arrange
+        request = self.factory.post(
+            self.url,
+            {"item_ids": [self.reserved_item.id], "transition": "delete"},
+            format="json",
+        )
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        response = self.bulk_transition_view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
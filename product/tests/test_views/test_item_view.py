@@ -1,4 +1,7 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, force_authenticate
@@ -76,6 +79,30 @@ class ItemListAllViewTests(TestCase):
             response.data["results"]["items"][0]["title"], self.item1.title
         )
 
+    def test_list_items_card_view(self):
+        # Arrange
+        image = ImageFactory()
+        BannerFactory(item=self.item1, image=image, order=1)
+        request = self.factory.get(self.list_url, {"view": "card"})
+        force_authenticate(request, user=self.user)
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        items = response.data["results"]["items"]
+        self.assertEqual(
+            set(items[0]), {"id", "title", "price", "first_image_id"}
+        )
+        self.assertEqual(items[1]["first_image_id"], image.id)
+        selected_sql = "\n".join(
+            query["sql"] for query in context.captured_queries
+        )
+        self.assertNotIn('"description"', selected_sql)
+        self.assertNotIn("product_purchaserequest", selected_sql)
+
     def test_filter_items_by_category(self):
         # Arrange
         request = self.factory.get(
@@ -90,6 +117,35 @@ class ItemListAllViewTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 2)
 
+    def test_filter_items_by_category_tree(self):
+        # Arrange
+        child_category = CategoryFactory(parent=self.category)
+        child_item = ItemFactory(
+            title="Child Item",
+            seller_user=self.user,
+            category=child_category,
+            price=50,
+        )
+        ItemFactory(
+            title="Other Item",
+            seller_user=self.user,
+            category=CategoryFactory(),
+            price=50,
+        )
+        request = self.factory.get(
+            self.list_url, {"category__in_tree": self.category.id}
+        )
+
+        # Act
+        response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {item["id"] for item in response.data["results"]["items"]},
+            {self.item1.id, self.item2.id, child_item.id},
+        )
+
     def test_filter_items_by_price_range(self):
         # Arrange
         request = self.factory.get(
@@ -107,6 +163,38 @@ class ItemListAllViewTests(TestCase):
             response.data["results"]["items"][0]["title"], self.item1.title
         )
 
+    def test_list_items_with_facets(self):
+        # Arrange
+        cache.clear()
+        request = self.factory.get(
+            self.list_url,
+            {"include_facets": "true", "price__gte": 1000, "search": "Item"},
+        )
+
+        # Act
+        response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"]["items"], [])
+        facets = response.data["results"]["facets"]
+        self.assertEqual(
+            facets["categories"], [{"id": self.category.id, "count": 2}]
+        )
+        self.assertEqual(
+            sum(bucket["count"] for bucket in facets["price_histogram"]), 2
+        )
+
+    def test_list_items_without_facets(self):
+        # Arrange
+        request = self.factory.get(self.list_url)
+
+        # Act
+        response = self.view(request)
+
+        # Assert
+        self.assertNotIn("facets", response.data["results"])
+
     def test_order_items_by_price(self):
         # Arrange
         request = self.factory.get(f"{self.list_url}?ordering=price")
@@ -375,6 +463,24 @@ class ItemDetailViewTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["id"], self.valid_item_id)
 
+    def test_retrieve_item_with_sparse_fieldset(self):
+        # Arrange
+        request = self.factory.get(
+            reverse("item-detail", kwargs={"item_id": self.valid_item_id}),
+            {"fields": "id,title,is_owner"},
+        )
+        force_authenticate(request, user=self.user)
+
+        # Act
+        with self.assertNumQueries(1):
+            response = self.view(request, item_id=self.valid_item_id)
+
+        # Assert
+        self.assertEqual(
+            response.data,
+            {"id": self.valid_item_id, "title": "Test Item", "is_owner": True},
+        )
+
     def test_get_item_not_found(self):
         # Arrange
         request = self.factory.get(
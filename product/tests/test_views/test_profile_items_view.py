@@ -6,7 +6,10 @@ from rest_framework.test import APIRequestFactory, force_authenticate
 from product.models.item import Item
 from product.tests.factories.category_factory import CategoryFactory
 from product.tests.factories.item_factory import ItemFactory
-from product.views.profile_items_view import ProfileItemsAPIView
+from product.views.profile_items_view import (
+    ProfileDashboardAPIView,
+    ProfileItemsAPIView,
+)
 from user.tests.factories.user_factory import UserFactory
 
 
@@ -67,8 +70,10 @@ class ProfileItemsAPIViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.reserved_item.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["results"][0]["id"], self.reserved_item.id
+        )
 
     def test_filter_bought_by_user(self):
         # Arrange
@@ -83,8 +88,8 @@ class ProfileItemsAPIViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.sold_item.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], self.sold_item.id)
 
     def test_filter_sold_by_user(self):
         # Arrange
@@ -99,8 +104,8 @@ class ProfileItemsAPIViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.sold_item.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], self.sold_item.id)
 
     def test_filter_created_by_user_active(self):
         # Arrange
@@ -116,8 +121,8 @@ class ProfileItemsAPIViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.active_item.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["id"], self.active_item.id)
 
     def test_filter_created_by_user_reserved(self):
         # Arrange
@@ -133,8 +138,10 @@ class ProfileItemsAPIViewTests(TestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["id"], self.reserved_item.id)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            response.data["results"][0]["id"], self.reserved_item.id
+        )
 
     def test_invalid_filter_group(self):
         # Arrange
@@ -150,3 +157,129 @@ class ProfileItemsAPIViewTests(TestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data["code"], "invalid filter group.")
+
+    def test_filter_is_paginated_by_cursor(self):
+        # Arrange
+        for _ in range(3):
+            ItemFactory(
+                title="Active Item",
+                seller_user=self.seller_user,
+                category=self.category,
+                price=150,
+                state=Item.State.ACTIVE,
+            )
+        url = reverse(
+            "profile-item-list",
+            kwargs={"filter_group": "created_by_user_active"},
+        )
+        request = self.factory.get(url, {"page_size": 3})
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        response = self.view(request, filter_group="created_by_user_active")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNotNone(response.data["next"])
+        self.assertNotIn(
+            self.active_item.id,
+            [item["id"] for item in response.data["results"]],
+        )
+
+    def test_filter_with_sparse_fieldset(self):
+        # Arrange
+        url = reverse(
+            "profile-item-list",
+            kwargs={"filter_group": "created_by_user_active"},
+        )
+        request = self.factory.get(url, {"fields": "id,title,first_image_id"})
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        with self.assertNumQueries(2):
+            # items, banners
+            response = self.view(request, filter_group="created_by_user_active")
+
+        # Assert
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "id": self.active_item.id,
+                "title": "Active Item",
+                "first_image_id": None,
+            },
+        )
+
+
+class ProfileDashboardAPIViewTests(TestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = ProfileDashboardAPIView.as_view()
+        self.url = reverse("profile-dashboard")
+
+        self.seller_user = UserFactory()
+        self.buyer_user = UserFactory()
+        category = CategoryFactory()
+
+        for state in [Item.State.ACTIVE] * 3 + [Item.State.SOLD]:
+            ItemFactory(
+                title="Item",
+                seller_user=self.seller_user,
+                buyer_user=(
+                    self.buyer_user if state == Item.State.SOLD else None
+                ),
+                category=category,
+                price=100,
+                state=state,
+            )
+        ItemFactory(
+            title="Banned Item",
+            seller_user=self.seller_user,
+            category=category,
+            price=100,
+            is_banned=True,
+            state=Item.State.INACTIVE,
+        )
+
+    def test_dashboard_counts_and_first_pages(self):
+        # Arrange
+        request = self.factory.get(self.url, {"page_size": 2})
+        force_authenticate(request, user=self.seller_user)
+
+        # Act
+        with self.assertNumQueries(7):
+            # counts, then items and banners for each of 3 non-empty groups
+            response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {group: data["count"] for group, data in response.data.items()},
+            {
+                "reserved_by_user": 0,
+                "bought_by_user": 0,
+                "sold_by_user": 1,
+                "created_by_user_active": 3,
+                "created_by_user_reserved": 0,
+                "banned": 1,
+            },
+        )
+        active = response.data["created_by_user_active"]
+        self.assertEqual(len(active["results"]), 2)
+        self.assertTrue(active["has_more"])
+        self.assertTrue(active["results"][0]["is_owner"])
+        self.assertEqual(response.data["reserved_by_user"]["results"], [])
+
+    def test_dashboard_for_buyer(self):
+        # Arrange
+        request = self.factory.get(self.url)
+        force_authenticate(request, user=self.buyer_user)
+
+        # Act
+        response = self.view(request)
+
+        # Assert
+        self.assertEqual(response.data["bought_by_user"]["count"], 1)
+        self.assertFalse(response.data["bought_by_user"]["has_more"])
+        self.assertEqual(response.data["sold_by_user"]["count"], 0)
@@ -1,8 +1,9 @@
 from django.urls import path
 
-from product.views.category_view import CategoryListView
+from product.views.category_view import CategoryListView, CategoryTreeView
 from product.views.image_view import ImageUploadView, ImageRawView
 from product.views.item_status_view import (
+    BulkItemTransitionAPIView,
     MarkItemAsSoldAPIView,
     ReactivateItemAPIView,
 )
@@ -14,7 +15,10 @@ from product.views.item_view import (
     ItemEditView,
     ItemDeleteView,
 )
-from product.views.profile_items_view import ProfileItemsAPIView
+from product.views.profile_items_view import (
+    ProfileDashboardAPIView,
+    ProfileItemsAPIView,
+)
 from product.views.purchase_request_view import (
     GetBuyerUserPurchaseRequestView,
     GetPurchaseRequestsForItemView,
@@ -24,6 +28,7 @@ from product.views.purchase_request_view import (
 
 urlpatterns = [
     path("categories", CategoryListView.as_view(), name="category-list"),
+    path("categories/tree", CategoryTreeView.as_view(), name="category-tree"),
     path("images/upload", ImageUploadView.as_view(), name="image-upload"),
     path("images/<int:image_id>", ImageRawView.as_view(), name="image-raw"),
     path(
@@ -40,6 +45,11 @@ urlpatterns = [
     ),
     path("items/<int:item_id>", ItemDetailView.as_view(), name="item-detail"),
     path("items", ItemListAllView.as_view(), name="item-list-all"),
+    path(
+        "items/profile",
+        ProfileDashboardAPIView.as_view(),
+        name="profile-dashboard",
+    ),
     path(
         "items/profile/<str:filter_group>",
         ProfileItemsAPIView.as_view(),
@@ -55,6 +65,11 @@ urlpatterns = [
         MarkItemAsSoldAPIView.as_view(),
         name="mark_item_as_sold",
     ),
+    path(
+        "items/transition",
+        BulkItemTransitionAPIView.as_view(),
+        name="bulk_item_transition",
+    ),
     path(
         "purchase-requests/create",
         CreatePurchaseRequestAPIView.as_view(),
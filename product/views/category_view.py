@@ -1,13 +1,42 @@
+from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from product.models.category import Category
 from product.serializers.category_serializer import CategorySerializer
+from product.services.category_registry import category_registry
 from product.throttling import CategoryThrottle
 
 
 class CategoryListView(ListAPIView):
-    queryset = Category.objects.all()
+    """
+    Lists all categories from the process-local category registry.
+    """
+
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
     throttle_classes = [CategoryThrottle]
+
+    def get_queryset(self):
+        return category_registry.get_all()
+
+    def list(self, request, *args, **kwargs):
+        return Response(category_registry.get_data(), status=status.HTTP_200_OK)
+
+
+class CategoryTreeView(APIView):
+    """
+    Returns the category tree for the navigation menu, with the number of
+    listed items in every category subtree.
+    """
+
+    permission_classes = [AllowAny]
+    throttle_classes = [CategoryThrottle]
+
+    def get(self, request):
+        item_counts = dict(Category.objects.values_list("id", "item_count"))
+        return Response(
+            category_registry.get_tree(item_counts), status=status.HTTP_200_OK
+        )
@@ -8,6 +8,7 @@ from rest_framework.views import APIView
 
 from product.exceptions import NoFileProvidedException, ImageNotFoundException
 from product.models.image import Image
+from product.services.image_repository import store_image
 from product.services.upload_file_validator import (
     validate_file_size,
     validate_file_type,
@@ -46,11 +47,8 @@ class ImageUploadView(APIView):
             ],
         )
 
-        image = Image.objects.create(
-            content_type=file.content_type,
-            image_data=file.read(),
-        )
-        return Response({"id": image.id}, status=status.HTTP_201_CREATED)
+        image_id, _ = store_image(file)
+        return Response({"id": image_id}, status=status.HTTP_201_CREATED)
 
 
 class ImageRawView(APIView):
@@ -63,7 +61,12 @@ class ImageRawView(APIView):
 
     def get(self, request, image_id):
         try:
-            image = Image.objects.get(id=image_id)
+            image = Image.objects.with_data().get(id=image_id)
         except Image.DoesNotExist:
             raise ImageNotFoundException()
-        return HttpResponse(image.image_data, content_type=image.content_type)
+        response = HttpResponse(
+            image.image_data, content_type=image.content_type
+        )
+        # Identical images share a hash, so their compressed body is cached.
+        response.compression_cache_key = f"image_{image.content_hash}"
+        return response
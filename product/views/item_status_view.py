@@ -1,15 +1,15 @@
-from django.db import transaction
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from product.exceptions import ItemNotFoundException
-from product.models.item import Item
-from product.models.purchase_request import PurchaseRequest
-from product.validators.validators import (
-    validate_sell_item_request,
-    validate_reactivate_item_request,
+from product.serializers.item_transition_serializer import (
+    ItemTransitionSerializer,
+)
+from product.services.item_state_machine import (
+    ItemTransition,
+    transition_item,
+    transition_items,
 )
 from user.services.permission import IsNotBannedUser
 
@@ -23,26 +23,12 @@ class MarkItemAsSoldAPIView(APIView):
         """
         Marks an item as sold if it's in reserved status.
         """
-        user = request.user
-
-        try:
-            item = Item.objects.get(id=item_id)
-        except Item.DoesNotExist:
-            raise ItemNotFoundException()
-
-        validate_sell_item_request(user, item)
-
-        self.set_item_state_to_sold(item)
+        transition_item(item_id, ItemTransition.SELL, user=request.user)
 
         return Response(
             self.MARK_ITEM_AS_SOLD_SUCCESS_MSG, status=status.HTTP_200_OK
         )
 
-    @staticmethod
-    def set_item_state_to_sold(item):
-        item.state = Item.State.SOLD
-        item.save()
-
 
 class ReactivateItemAPIView(APIView):
     permission_classes = [IsAuthenticated, IsNotBannedUser]
@@ -53,27 +39,28 @@ class ReactivateItemAPIView(APIView):
         """
         Reactivates an item from reserved status to active status.
         """
-        user = request.user
+        transition_item(item_id, ItemTransition.REACTIVATE, user=request.user)
+
+        return Response(
+            self.REACTIVATE_ITEM_SUCCESS_MSG, status=status.HTTP_200_OK
+        )
 
-        try:
-            item = Item.objects.get(id=item_id)
-        except Item.DoesNotExist:
-            raise ItemNotFoundException()
 
-        validate_reactivate_item_request(user, item)
+class BulkItemTransitionAPIView(APIView):
+    permission_classes = [IsAuthenticated, IsNotBannedUser]
 
-        self.reactivate_item(item)
+    def post(self, request):
+        """
+        Applies a state transition to many of the user's items at once and
+        returns the outcome per item.
+        """
+        serializer = ItemTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        return Response(
-            self.REACTIVATE_ITEM_SUCCESS_MSG, status=status.HTTP_200_OK
+        outcomes = transition_items(
+            item_ids=serializer.validated_data["item_ids"],
+            transition=serializer.validated_data["transition"],
+            user=request.user,
         )
 
-    @staticmethod
-    def reactivate_item(item):
-        with transaction.atomic():
-            item.state = Item.State.ACTIVE
-            item.save()
-            purchase_requests = PurchaseRequest.objects.filter(
-                item=item, state=PurchaseRequest.State.ACCEPTED
-            )
-            purchase_requests.update(state=PurchaseRequest.State.PENDING)
+        return Response({"results": outcomes}, status=status.HTTP_200_OK)
@@ -4,7 +4,7 @@ from rest_framework import generics
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -13,9 +13,13 @@ from product.exceptions import (
     ItemNotFoundException,
     UnauthorizedEditItemRequest,
 )
+from product.filters import ItemFilter
 from product.models.item import Item
+from product.models.listing import Listing
 from product.serializers.item_data_serializer import ItemDataSerializer
+from product.serializers.item_list_serializer import FastItemListSerializer
 from product.serializers.item_serializer import ItemWithImagesSerializer
+from product.services.item_facets import get_item_facets
 from product.services.item_repository import (
     create_item_with_banners,
     edit_item_with_banners,
@@ -32,10 +36,28 @@ class ItemPagination(PageNumberPagination):
     max_page_size = 100
 
 
+class ItemCursorPagination(CursorPagination):
+    """
+    Keyset pagination over item ids, newest first, with the same page sizes
+    as `ItemPagination`.
+    """
+
+    page_size = ItemPagination.page_size
+    page_size_query_param = ItemPagination.page_size_query_param
+    max_page_size = ItemPagination.max_page_size
+    ordering = "-id"
+
+
 class ItemListAllView(generics.ListAPIView):
     """
     View to list all items with search, filters, and ordering.
     Additionally, provides the maximum price of the filtered items.
+    Supports the `fields` and `view=card` sparse fieldset parameters, and
+    `include_facets=true` to add category counts and a price histogram.
+
+    Items are read from the denormalized `Listing` table and rendered by
+    `FastItemListSerializer`, which produces the `ItemWithImagesSerializer`
+    representation without its per-row overhead.
     """
 
     serializer_class = ItemWithImagesSerializer
@@ -43,19 +65,15 @@ class ItemListAllView(generics.ListAPIView):
     permission_classes = [AllowAny]
     throttle_classes = [ItemThrottle]
 
-    queryset = Item.objects.filter(is_banned=False).exclude(
-        state__in=[Item.State.SOLD, Item.State.INACTIVE]
-    )
+    # Only listed items, kept in sync with the item table by triggers.
+    queryset = Listing.objects.all()
 
     # Add filters, search, and ordering
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
 
     search_fields = ["title"]
 
-    filterset_fields = {
-        "category": ["exact"],
-        "price": ["gte", "lte"],
-    }
+    filterset_class = ItemFilter
 
     ordering_fields = ["created_at", "price"]
     ordering = ["-created_at"]  # Default ordering (newest first)
@@ -67,20 +85,41 @@ class ItemListAllView(generics.ListAPIView):
         # Compute max price from the unfiltered queryset
         max_price = base_queryset.aggregate(max_price=Max("price"))["max_price"]
 
-        # Fetch the filtered queryset
-        filtered_queryset = self.filter_queryset(self.get_queryset())
+        # Fetch the filtered queryset as rows of the requested columns
+        serializer = FastItemListSerializer(request)
+        filtered_queryset = serializer.prepare_queryset(
+            self.filter_queryset(self.get_queryset())
+        )
+
+        extra_data = {"max_price": max_price}
+        if request.query_params.get("include_facets") == "true":
+            extra_data["facets"] = self.get_facets(
+                request, base_queryset, max_price
+            )
 
         # Serialize the data
         page = self.paginate_queryset(filtered_queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            data = serializer.data
             return self.get_paginated_response(
-                {"items": data, "max_price": max_price}
+                {"items": serializer.serialize(page), **extra_data}
             )
         else:
-            serializer = self.get_serializer(filtered_queryset, many=True)
-            return Response({"items": serializer.data, "max_price": max_price})
+            return Response(
+                {
+                    "items": serializer.serialize(list(filtered_queryset)),
+                    **extra_data,
+                }
+            )
+
+    def get_facets(self, request, base_queryset, max_price):
+        # Facets follow the search but ignore the category and price
+        # filters, so the sidebar keeps showing the other options.
+        search_filter = SearchFilter()
+        return get_item_facets(
+            search_filter.filter_queryset(request, base_queryset, self),
+            search_terms=search_filter.get_search_terms(request),
+            max_price=max_price,
+        )
 
 
 class ItemCreateView(APIView):
@@ -124,6 +163,7 @@ class ItemCreateView(APIView):
 class ItemDetailView(APIView):
     """
     View to retrieve a single item by ID.
+    Supports the `fields` and `view=card` sparse fieldset parameters.
     """
 
     permission_classes = [AllowAny]
@@ -135,7 +175,10 @@ class ItemDetailView(APIView):
 
     def get(self, request, item_id):
         try:
-            item = Item.objects.prefetch_related("banner_set").get(id=item_id)
+            item = self.serializer_class.prepare_queryset(
+                Item.objects.all(),
+                fields=self.serializer_class.get_request_fields(request),
+            ).get(id=item_id)
         except Item.DoesNotExist:
             raise ItemNotFoundException()
 
@@ -1,5 +1,4 @@
-from django.db.models import Q
-from rest_framework import status
+from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -7,40 +6,87 @@ from rest_framework.views import APIView
 from product.exceptions import InvalidProfileItemsFilterGroup
 from product.models.item import Item
 from product.serializers.item_serializer import ItemWithImagesSerializer
+from product.services.profile_items import (
+    PROFILE_FILTER_GROUPS,
+    get_profile_filters,
+    get_profile_item_counts,
+)
+from product.views.item_view import ItemCursorPagination
 from reusable.jwt import CookieJWTAuthentication
 
 
-class ProfileItemsAPIView(APIView):
+class ProfileItemsAPIView(generics.ListAPIView):
+    """
+    Lists the logged-in user's items of one profile group with keyset
+    pagination. The optional `fields` and `view` parameters select a sparse
+    fieldset, e.g. `fields=id,title,first_image_id` or `view=card`.
+    """
+
     authentication_classes = [CookieJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    serializer_class = ItemWithImagesSerializer
+    pagination_class = ItemCursorPagination
 
-    def get(self, request, filter_group):
-        """
-        Handles GET requests to filter items by specific conditions for the logged-in user.
-        """
-        user = request.user
+    def get_queryset(self):
+        filter_group = self.kwargs.get("filter_group")
 
         if not filter_group:
             raise InvalidProfileItemsFilterGroup()
 
-        filter_map = {
-            "reserved_by_user": Q(buyer_user=user, state=Item.State.RESERVED),
-            "bought_by_user": Q(buyer_user=user, state=Item.State.SOLD),
-            "sold_by_user": Q(seller_user=user, state=Item.State.SOLD),
-            "created_by_user_active": Q(
-                seller_user=user, state=Item.State.ACTIVE
-            ),
-            "created_by_user_reserved": Q(
-                seller_user=user, state=Item.State.RESERVED
-            ),
-            "banned": Q(seller_user=user, is_banned=True),
-        }
-
-        query_filter = filter_map.get(filter_group)
+        query_filter = get_profile_filters(self.request.user).get(filter_group)
 
         if not query_filter:
             raise InvalidProfileItemsFilterGroup()
 
-        items = Item.objects.filter(query_filter)
-        serializer = ItemWithImagesSerializer(items, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return ItemWithImagesSerializer.prepare_queryset(
+            Item.objects.filter(query_filter),
+            fields=ItemWithImagesSerializer.get_request_fields(self.request),
+        )
+
+
+class ProfileDashboardAPIView(APIView):
+    """
+    Returns the item counts of all profile groups of the logged-in user and
+    the first page of items of every non-empty group, replacing one
+    `ProfileItemsAPIView` call per tab.
+    """
+
+    authentication_classes = [CookieJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    PAGE_SIZE = 12
+    MAX_PAGE_SIZE = 50
+
+    def get(self, request):
+        user = request.user
+        page_size = self.get_page_size(request)
+
+        counts = get_profile_item_counts(user)
+        filters = get_profile_filters(user)
+        fields = ItemWithImagesSerializer.get_request_fields(request)
+
+        groups = {}
+        for group in PROFILE_FILTER_GROUPS:
+            items = []
+            if counts[group]:
+                items = ItemWithImagesSerializer.prepare_queryset(
+                    Item.objects.filter(filters[group]), fields=fields
+                )[:page_size]
+            groups[group] = {
+                "count": counts[group],
+                "has_more": counts[group] > page_size,
+                "results": ItemWithImagesSerializer(
+                    items, many=True, context={"request": request}
+                ).data,
+            }
+
+        return Response(groups, status=status.HTTP_200_OK)
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params.get("page_size", 0))
+        except ValueError:
+            page_size = 0
+        if page_size <= 0:
+            return self.PAGE_SIZE
+        return min(page_size, self.MAX_PAGE_SIZE)
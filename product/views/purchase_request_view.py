@@ -1,4 +1,5 @@
-from rest_framework import status
+from rest_framework import generics, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,7 +19,6 @@ from product.services.purchase_request_service import (
     create_or_update_purchase_request,
     get_user_purchase_request_for_item,
 )
-from product.validators.validators import validate_accept_purchase_request
 from reusable.jwt import CookieJWTAuthentication
 from user.services.permission import IsNotBannedUser
 
@@ -60,35 +60,53 @@ class AcceptPurchaseRequestAPIView(APIView):
         """
         Accepts a purchase request and reserves the item.
         """
-        user = request.user
-        validate_accept_purchase_request(user, purchase_request_id)
-        accept_purchase_request(purchase_request_id)
+        accept_purchase_request(request.user, purchase_request_id)
         return Response(
             self.ACCEPT_PURCHASE_SUCCESS_MSG, status=status.HTTP_200_OK
         )
 
 
-class GetPurchaseRequestsForItemView(APIView):
+class PurchaseRequestPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+
+
+class GetPurchaseRequestsForItemView(generics.ListAPIView):
+    """
+    Lists the purchase requests of one of the user's items, newest first,
+    with cursor pagination and an optional `state` filter.
+    """
+
     authentication_classes = [CookieJWTAuthentication]
     permission_classes = [IsAuthenticated, IsNotBannedUser]
+    serializer_class = PurchaseRequestSerializer
+    pagination_class = PurchaseRequestPagination
+    filterset_fields = ["state"]
 
-    def get(self, request, item_id):
-        """
-        Handles GET requests to retrieve all purchase requests for a specific item.
-        """
-        user = request.user
-
+    def get_queryset(self):
         try:
-            item = Item.objects.get(id=item_id, seller_user=user)
+            item = Item.objects.only("id", "is_banned").get(
+                id=self.kwargs["item_id"], seller_user=self.request.user
+            )
         except Item.DoesNotExist:
             raise ItemNotFoundException()
 
         check_item_banned(item)
 
-        purchase_requests = PurchaseRequest.objects.filter(item=item)
-        serializer = PurchaseRequestSerializer(purchase_requests, many=True)
-
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return (
+            PurchaseRequest.objects.filter(item=item)
+            .select_related("buyer_user")
+            .only(
+                "id",
+                "comment",
+                "state",
+                "created_at",
+                "buyer_user__sso_user_id",
+                "buyer_user__phone",
+            )
+        )
 
 
 class GetBuyerUserPurchaseRequestView(APIView):
@@ -1,13 +1,16 @@
 from django.conf import settings
 from django.contrib import admin
-from django.db import transaction
-from django.db.models import F
 from django.urls import reverse
 from django.utils.html import escape
 from django.utils.html import format_html
 
 from report.models.item_report import ItemReport
 from report.models.user_report import UserReport
+from report.services.ban_service import (
+    bulk_ban,
+    bulk_ban_sellers,
+    bulk_unban,
+)
 from reusable.admin import BaseAdmin
 
 
@@ -20,9 +23,12 @@ class BaseReportAdmin(BaseAdmin):
         "id",
         "status",
         "total_reports",
+        "is_flagged",
         "admin_note",
     )
-    list_filter = ("status",)
+    list_filter = ("status", "is_flagged")
+    ordering = ("-total_reports",)
+    show_full_result_count = False
     readonly_fields = (
         "spam",
         "amoral",
@@ -32,72 +38,31 @@ class BaseReportAdmin(BaseAdmin):
         "other",
     )
 
-    def get_queryset(self, request):
-        """
-        Annotate the queryset with the total_reports field for ordering.
-        """
-        qs = (
-            super()
-            .get_queryset(request)
-            .annotate(
-                total_reports=(
-                    F("spam")
-                    + F("amoral")
-                    + F("fraud")
-                    + F("illegal")
-                    + F("contact_issue")
-                    + F("other")
-                )
-            )
-        )
-        return qs.order_by("-total_reports")
+    def ban(self, request, queryset):
+        success_count, errors = bulk_ban(queryset)
+        self._report_result(request, success_count, errors, "ban", "banned")
 
-    def total_reports(self, obj):
+    def unban(self, request, queryset):
+        success_count, errors = bulk_unban(queryset)
+        self._report_result(request, success_count, errors, "unban", "unbanned")
+
+    def _report_result(
+        self, request, success_count, errors, action, action_done
+    ):
         """
-        Retrieve the total number of reports for this object from the annotated field.
+        Report per-row failures and the number of successfully handled reports.
         """
-        return obj.total_reports
-
-    total_reports.short_description = "Total Reports"
-
-    def ban(self, request, queryset):
-        success_count = 0
-        for report in queryset:
-            try:
-                with transaction.atomic():
-                    report.ban()
-                    success_count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Failed to ban report {report.id}: {str(e)}",
-                    level="ERROR",
-                )
-
-        if success_count:
+        for report_id, error in errors.items():
             self.message_user(
                 request,
-                f"{success_count} reports have been banned successfully.",
+                f"Failed to {action} report {report_id}: {error}",
+                level="ERROR",
             )
 
-    def unban(self, request, queryset):
-        success_count = 0
-        for report in queryset:
-            try:
-                with transaction.atomic():
-                    report.unban()
-                    success_count += 1
-            except Exception as e:
-                self.message_user(
-                    request,
-                    f"Failed to unban report {report.id}: {str(e)}",
-                    level="ERROR",
-                )
-
         if success_count:
             self.message_user(
                 request,
-                f"{success_count} reports have been unbanned successfully.",
+                f"{success_count} reports have been {action_done} successfully.",
             )
 
     actions = ["ban", "unban"]
@@ -110,7 +75,9 @@ class UserReportAdmin(BaseReportAdmin):
     """
 
     list_display = BaseReportAdmin.list_display + ("user",)
+    list_select_related = ("user",)
     search_fields = ("user__email", "user__phone")
+    raw_id_fields = ("user",)
     actions = ["ban", "unban"]
 
 
@@ -124,7 +91,9 @@ class ItemReportAdmin(BaseReportAdmin):
         "link_to_item",
         "item",
     )
+    list_select_related = ("item",)
     search_fields = ("item__title",)
+    raw_id_fields = ("item",)
 
     # Extend the readonly fields specific to ItemReport
     readonly_fields = BaseReportAdmin.readonly_fields + (
@@ -134,35 +103,12 @@ class ItemReportAdmin(BaseReportAdmin):
         "link_to_item",
     )
 
-    def get_queryset(self, request):
-        """
-        Override queryset to include additional fields specific to ItemReport.
-        """
-        qs = (
-            super()
-            .get_queryset(request)
-            .annotate(
-                total_reports=(
-                    F("spam")
-                    + F("amoral")
-                    + F("fraud")
-                    + F("illegal")
-                    + F("contact_issue")
-                    + F("price_issue")
-                    + F("category_issue")
-                    + F("responsiveness_issue")
-                    + F("other")
-                )
-            )
-        )
-        return qs.order_by("-total_reports")
-
     def link_to_item(self, obj):
         """
         Provides a link to view the item on the website.
         """
         item_url = (
-            escape(settings.BASE_URL.rstrip("/")) + "/item/" + str(obj.item.id)
+            escape(settings.BASE_URL.rstrip("/")) + "/item/" + str(obj.item_id)
         )
         return format_html(
             '<a href="{}" target="_blank">View Item</a>', item_url
@@ -174,16 +120,13 @@ class ItemReportAdmin(BaseReportAdmin):
         """
         Ban the seller of the reported item.
         """
-        for report in queryset:
-            with transaction.atomic():
-                report.ban()
-
-                seller = report.item.seller_user
-                if seller:
-                    seller.is_banned = True
-                    seller.save()
-                    seller.sold_items.update(is_banned=True)
-
-        self.message_user(request, "Selected users have been banned.")
+        success_count, errors = bulk_ban_sellers(queryset)
+        self._report_result(
+            request,
+            success_count,
+            errors,
+            "ban the seller of",
+            "banned with their sellers",
+        )
 
     actions = BaseReportAdmin.actions + ["ban_user"]
@@ -0,0 +1,33 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from report.services.report_buffer import flush_report_buffer
+
+
+class Command(BaseCommand):
+    help = "Fold report counters buffered in the cache into the report tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.REPORT_FLUSH_BATCH_SIZE,
+            help="Number of buffered counters folded per transaction.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep flushing every this many seconds instead of once.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            folded = flush_report_buffer(batch_size=options["batch_size"])
+            self.stdout.write(f"Folded {folded} buffered report counters.")
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
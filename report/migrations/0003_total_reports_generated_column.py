@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:19
+
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0015_image_base_manager'),
+        ('report', '0002_alter_itemreport_admin_note_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemreport',
+            name='total_reports',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('spam'), '+', models.F('amoral')), '+', models.F('fraud')), '+', models.F('illegal')), '+', models.F('contact_issue')), '+', models.F('price_issue')), '+', models.F('category_issue')), '+', models.F('responsiveness_issue')), '+', models.F('other')), output_field=models.IntegerField(), verbose_name='Total Reports'),
+        ),
+        migrations.AddField(
+            model_name='userreport',
+            name='total_reports',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('spam'), '+', models.F('amoral')), '+', models.F('fraud')), '+', models.F('illegal')), '+', models.F('contact_issue')), '+', models.F('other')), output_field=models.IntegerField(), verbose_name='Total Reports'),
+        ),
+        migrations.AddIndex(
+            model_name='itemreport',
+            index=models.Index(fields=['-total_reports'], name='itemreport_total_reports_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userreport',
+            index=models.Index(fields=['-total_reports'], name='userreport_total_reports_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-19 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('report', '0003_total_reports_generated_column'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemreport',
+            name='is_flagged',
+            field=models.BooleanField(db_index=True, default=False, help_text='Flagged for review by the automatic moderation rules.', verbose_name='Is Flagged'),
+        ),
+        migrations.AddField(
+            model_name='userreport',
+            name='is_flagged',
+            field=models.BooleanField(db_index=True, default=False, help_text='Flagged for review by the automatic moderation rules.', verbose_name='Is Flagged'),
+        ),
+    ]
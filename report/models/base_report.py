@@ -1,6 +1,12 @@
+import operator
 from abc import abstractmethod
+from functools import reduce
+from typing import Dict, Iterable, List, Tuple
 
-from django.db import models, transaction
+from django.db import connection, models, transaction
+from django.db.models import F
+from django.db.models.expressions import CombinedExpression
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from reusable.models import BaseModel
@@ -37,7 +43,24 @@ REASON_FIELD_MAP = {
 }
 
 
+def sum_of_fields(*field_names: str) -> CombinedExpression:
+    """
+    Build the expression adding up the given counter fields.
+    """
+    return reduce(operator.add, (F(field_name) for field_name in field_names))
+
+
 class BaseReport(BaseModel):
+    # Name of the one-to-one field pointing at the reported instance.
+    reported_field: str = ""
+
+    # Relations needed by `notify_ban` and `get_ban_recipient`, selected when
+    # notifying in bulk.
+    notify_related: Tuple[str, ...] = ()
+
+    # Whether the moderation rules may ban the reported instance on their own.
+    auto_hide: bool = False
+
     spam: int = models.PositiveIntegerField(default=0)
 
     amoral: int = models.PositiveIntegerField(default=0)
@@ -57,6 +80,13 @@ class BaseReport(BaseModel):
         verbose_name=_("Status"),
     )
 
+    is_flagged: bool = models.BooleanField(
+        default=False,
+        db_index=True,
+        verbose_name=_("Is Flagged"),
+        help_text=_("Flagged for review by the automatic moderation rules."),
+    )
+
     admin_note: str = models.CharField(
         max_length=128,
         choices=ReportReason.choices,  # type: ignore
@@ -82,6 +112,144 @@ class BaseReport(BaseModel):
     def notify_ban(self):
         raise NotImplementedError("Should be implemented in the child class.")
 
+    @abstractmethod
+    def get_ban_recipient(self):
+        """
+        The user notified when the reported instance is banned.
+        """
+        raise NotImplementedError("Should be implemented in the child class.")
+
+    @classmethod
+    @abstractmethod
+    def notify_bans(cls, reports: Iterable["BaseReport"]) -> None:
+        """
+        Send the ban notifications of the given reports together.
+        """
+        raise NotImplementedError("Should be implemented in the child class.")
+
+    @classmethod
+    def get_reported_model(cls):
+        """
+        The model of the reported instances.
+        """
+        return cls._meta.get_field(cls.reported_field).related_model
+
+    @classmethod
+    def get_counter_fields(cls) -> List[str]:
+        """
+        Names of the reason counter fields defined on this report model.
+        """
+        field_names = {field.name for field in cls._meta.concrete_fields}
+        return [
+            field_name
+            for field_name in REASON_FIELD_MAP.values()
+            if field_name in field_names
+        ]
+
+    @classmethod
+    def increment_reason(
+        cls, reported_id: int, field_name: str
+    ) -> "BaseReport":
+        """
+        Increment a reason counter of the report for the given reported id,
+        creating the report when it doesn't exist yet.
+
+        Returns:
+            BaseReport: The report as stored after the increment.
+        """
+        return cls.add_reason_counts({reported_id: {field_name: 1}})[0]
+
+    @classmethod
+    def add_reason_counts(
+        cls, counts: Dict[int, Dict[str, int]]
+    ) -> List["BaseReport"]:
+        """
+        Add reason counts to the reports of many reported instances at once,
+        creating the reports that don't exist yet.
+
+        Uses a single `INSERT ... ON CONFLICT DO UPDATE` statement, so
+        concurrent first reports neither race on the unique constraint nor
+        need a separate read.
+
+        Args:
+            counts: Counts to add per counter field, keyed by reported id.
+
+        Returns:
+            list[BaseReport]: The reports as stored after the update.
+        """
+        if not counts:
+            return []
+
+        meta = cls._meta
+        quote_name = connection.ops.quote_name
+        table = quote_name(meta.db_table)
+        reported_column = quote_name(meta.get_field(cls.reported_field).column)
+        counter_fields = cls.get_counter_fields()
+        now = timezone.now()
+
+        fields = [
+            field
+            for field in meta.concrete_fields
+            if not field.primary_key and not field.generated
+        ]
+        rows_sql, params = [], []
+        # Sorted so concurrent batches lock the rows in the same order.
+        for reported_id in sorted(counts):
+            reported_counts = counts[reported_id]
+            for field in fields:
+                if field.name == cls.reported_field:
+                    value = reported_id
+                elif field.name in ("created_at", "updated_at"):
+                    value = now
+                elif field.name in counter_fields:
+                    value = reported_counts.get(field.name, 0)
+                else:
+                    value = field.get_default()
+                params.append(field.get_db_prep_save(value, connection))
+            rows_sql.append(f"({', '.join(['%s'] * len(fields))})")
+
+        updates = [
+            f"{column} = {table}.{column} + EXCLUDED.{column}"
+            for column in (
+                quote_name(meta.get_field(field_name).column)
+                for field_name in counter_fields
+            )
+        ]
+        updates.append(
+            f"{quote_name('updated_at')} = EXCLUDED.{quote_name('updated_at')}"
+        )
+
+        returned_fields = [field.attname for field in meta.concrete_fields]
+        returned_columns = ", ".join(
+            quote_name(field.column) for field in meta.concrete_fields
+        )
+        sql = (
+            f"INSERT INTO {table} "
+            f"({', '.join(quote_name(field.column) for field in fields)}) "
+            f"VALUES {', '.join(rows_sql)} "
+            f"ON CONFLICT ({reported_column}) DO UPDATE SET {', '.join(updates)} "
+            f"RETURNING {returned_columns}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        return [
+            cls.from_db(connection.alias, returned_fields, row) for row in rows
+        ]
+
+    @classmethod
+    def ban_related(cls, reported_ids: Iterable[int]) -> None:
+        """
+        Hook to ban objects that depend on the given reported instances.
+        """
+
+    @classmethod
+    def unban_related(cls, reported_ids: Iterable[int]) -> None:
+        """
+        Hook to unban objects that depend on the given reported instances.
+        """
+
     def _validate_reported_instance(self):
         """
         Validate that the reported instance exists and has the required attribute.
@@ -2,11 +2,16 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from product.models.item import Item
-from report.models.base_report import BaseReport
+from report.models.base_report import BaseReport, sum_of_fields
 from report.services import notifier_service
+from user.models.user import User
 
 
 class ItemReport(BaseReport):
+    reported_field = "item"
+    notify_related = ("item__seller_user",)
+    auto_hide = True
+
     item: Item = models.OneToOneField(
         Item,
         on_delete=models.CASCADE,
@@ -21,12 +26,37 @@ class ItemReport(BaseReport):
 
     responsiveness_issue: int = models.PositiveIntegerField(default=0)
 
+    # Kept up to date by the database on every write, so the admin can
+    # order reports by it through an index.
+    total_reports: int = models.GeneratedField(
+        expression=sum_of_fields(
+            "spam",
+            "amoral",
+            "fraud",
+            "illegal",
+            "contact_issue",
+            "price_issue",
+            "category_issue",
+            "responsiveness_issue",
+            "other",
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        verbose_name=_("Total Reports"),
+    )
+
     class Meta:
         verbose_name = _("Item Aggregated Report")
         verbose_name_plural = _("Item Aggregated Reports")
+        indexes = [
+            models.Index(
+                fields=["-total_reports"],
+                name="itemreport_total_reports_idx",
+            ),
+        ]
 
     def __str__(self):
-        return f"[Item={self.item.id}] Status={self.get_status_display()}"
+        return f"[Item={self.item_id}] Status={self.get_status_display()}"
 
     @property
     def get_reported_instance(self) -> Item:
@@ -37,3 +67,15 @@ class ItemReport(BaseReport):
             user=self.item.seller_user,
             reason=self.admin_note,
         )
+
+    def get_ban_recipient(self) -> User:
+        return self.item.seller_user
+
+    @classmethod
+    def notify_bans(cls, reports) -> None:
+        notifier_service.send_ban_item_emails(
+            [
+                (report.get_ban_recipient(), report.admin_note)
+                for report in reports
+            ]
+        )
@@ -1,13 +1,24 @@
+from typing import Iterable
+
 from django.db import models, transaction
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
-from report.models.base_report import BaseReport, ReportStatus
+from product.models.item import Item
+from report.models.base_report import (
+    BaseReport,
+    ReportStatus,
+    sum_of_fields,
+)
 from report.models.item_report import ItemReport
 from report.services import notifier_service
 from user.models.user import User
 
 
 class UserReport(BaseReport):
+    reported_field = "user"
+    notify_related = ("user",)
+
     user: User = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
@@ -16,9 +27,31 @@ class UserReport(BaseReport):
         db_index=True,
     )
 
+    # Kept up to date by the database on every write, so the admin can
+    # order reports by it through an index.
+    total_reports: int = models.GeneratedField(
+        expression=sum_of_fields(
+            "spam",
+            "amoral",
+            "fraud",
+            "illegal",
+            "contact_issue",
+            "other",
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        verbose_name=_("Total Reports"),
+    )
+
     class Meta:
         verbose_name = _("User Aggregated Report")
         verbose_name_plural = _("User Aggregated Reports")
+        indexes = [
+            models.Index(
+                fields=["-total_reports"],
+                name="userreport_total_reports_idx",
+            ),
+        ]
 
     def __str__(self):
         return (
@@ -35,13 +68,48 @@ class UserReport(BaseReport):
             reason=self.admin_note,
         )
 
+    def get_ban_recipient(self) -> User:
+        return self.user
+
+    @classmethod
+    def notify_bans(cls, reports) -> None:
+        notifier_service.send_ban_user_emails(
+            [
+                (report.get_ban_recipient(), report.admin_note)
+                for report in reports
+            ]
+        )
+
+    @classmethod
+    def ban_related(cls, reported_ids: Iterable[int]) -> None:
+        """
+        Ban all items sold by the given users in a single statement.
+        """
+        Item.objects.filter(
+            seller_user__in=reported_ids, is_banned=False
+        ).update(is_banned=True)
+
+    @classmethod
+    def unban_related(cls, reported_ids: Iterable[int]) -> None:
+        """
+        Unban items of the given users that don't have active reports.
+
+        Runs as a single `UPDATE ... WHERE NOT EXISTS (...)` against
+        `ItemReport`, so item ids are never materialised in Python.
+        """
+        active_item_reports = ItemReport.objects.filter(
+            item=OuterRef("pk")
+        ).exclude(status=ReportStatus.REJECTED)
+        Item.objects.filter(
+            seller_user__in=reported_ids, is_banned=True
+        ).exclude(Exists(active_item_reports)).update(is_banned=False)
+
     def ban(self) -> None:
         """
         Ban the user and all items where the user is the seller.
         """
         with transaction.atomic():
-            # Ban all items of the user
-            self.user.sold_items.update(is_banned=True)
+            self.ban_related([self.user_id])
 
             super().ban()
 
@@ -50,19 +118,6 @@ class UserReport(BaseReport):
         Unban the user and unban their items that don't have active reports.
         """
         with transaction.atomic():
-            # Get the IDs of items that have active (non-REJECTED) reports
-            already_reported_item_ids = (
-                ItemReport.objects.filter(item__seller_user=self.user)
-                .exclude(status=ReportStatus.REJECTED)
-                .values_list(
-                    "item_id",
-                    flat=True,
-                )
-            )
-
-            # Unban items of the user that are NOT in the reported item list
-            self.user.sold_items.exclude(
-                id__in=already_reported_item_ids
-            ).update(is_banned=False)
+            self.unban_related([self.user_id])
 
             super().unban()
@@ -1,8 +1,10 @@
-from django.db.models import F
+from django.conf import settings
 from rest_framework import serializers
 
 from report.exceptions import ReasonIsNotValid
 from report.models.base_report import ReportReason, REASON_FIELD_MAP
+from report.services.moderation_engine import apply_reason_counts
+from report.services.report_buffer import buffer_reason
 
 REASON_MAPPING = {
     1: ReportReason.FRAUD,
@@ -54,11 +56,14 @@ class BaseReportSerializer(serializers.Serializer):
         if not field_name:
             raise ValueError(f"Invalid report reason: {reason}")
 
-        report, created = self.report_class.objects.get_or_create(
-            **{self.reported_field: reported_instance},
-        )
+        if settings.REPORT_WRITE_BEHIND:
+            buffer_reason(
+                report_model=self.report_class,
+                reported_id=reported_instance.pk,
+                field_name=field_name,
+            )
+            return self.report_class(**{self.reported_field: reported_instance})
 
-        setattr(report, field_name, F(field_name) + 1)
-        report.save()
-        report.refresh_from_db()
-        return report
+        return apply_reason_counts(
+            self.report_class, {reported_instance.pk: {field_name: 1}}
+        )[0]
@@ -0,0 +1,187 @@
+import logging
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from product.models.item import Item
+from report.models.base_report import ReportStatus
+from report.models.user_report import UserReport
+from user.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+def bulk_ban(queryset) -> Tuple[int, Dict[int, str]]:
+    """
+    Ban the reported instances of the given reports with set-based updates.
+
+    Args:
+        queryset: Reports of a single report model to accept.
+
+    Returns:
+        tuple[int, dict[int, str]]: The number of banned reports and an error
+        message per report id that could not be banned, such as reports that
+        are already accepted.
+
+    Note:
+        Ban notifications are sent together once the transaction commits.
+    """
+    report_model = queryset.model
+    reported_field = f"{report_model.reported_field}_id"
+    now = timezone.now()
+
+    with transaction.atomic():
+        rows = list(queryset.values_list("id", reported_field, "status"))
+
+        # Accepted reports were already banned and notified.
+        errors = {
+            report_id: "The report is already accepted."
+            for report_id, _, status in rows
+            if status == ReportStatus.ACCEPTED
+        }
+        rows = [
+            (report_id, reported_id)
+            for report_id, reported_id, status in rows
+            if status != ReportStatus.ACCEPTED
+        ]
+        if not rows:
+            return 0, errors
+
+        report_ids = [report_id for report_id, _ in rows]
+        reported_ids = [reported_id for _, reported_id in rows]
+        reported_model = report_model.get_reported_model()
+
+        report_model.ban_related(reported_ids)
+        reported_model.objects.filter(pk__in=reported_ids).update(
+            is_banned=True
+        )
+        report_model.objects.filter(id__in=report_ids).update(
+            status=ReportStatus.ACCEPTED, updated_at=now
+        )
+
+        transaction.on_commit(lambda: notify_bans(report_model, report_ids))
+
+    return len(report_ids), errors
+
+
+def bulk_unban(queryset) -> Tuple[int, Dict[int, str]]:
+    """
+    Unban the reported instances of the given reports with set-based updates.
+
+    Args:
+        queryset: Reports of a single report model to reject.
+
+    Returns:
+        tuple[int, dict[int, str]]: The number of unbanned reports and an error
+        message per report id whose reported instance is not banned.
+    """
+    report_model = queryset.model
+    reported_field = report_model.reported_field
+    now = timezone.now()
+
+    with transaction.atomic():
+        rows = list(
+            queryset.values_list(
+                "id", f"{reported_field}_id", f"{reported_field}__is_banned"
+            )
+        )
+
+        errors = {
+            report_id: f"The reported {reported_field} {reported_id} is not banned."
+            for report_id, reported_id, is_banned in rows
+            if not is_banned
+        }
+        banned_rows = [
+            (report_id, reported_id)
+            for report_id, reported_id, is_banned in rows
+            if is_banned
+        ]
+        if not banned_rows:
+            return 0, errors
+
+        report_ids = [report_id for report_id, _ in banned_rows]
+        reported_ids = [reported_id for _, reported_id in banned_rows]
+        reported_model = report_model.get_reported_model()
+
+        report_model.unban_related(reported_ids)
+        reported_model.objects.filter(pk__in=reported_ids).update(
+            is_banned=False
+        )
+        report_model.objects.filter(id__in=report_ids).update(
+            status=ReportStatus.REJECTED, updated_at=now
+        )
+
+    return len(report_ids), errors
+
+
+def bulk_ban_sellers(queryset) -> Tuple[int, Dict[int, str]]:
+    """
+    Ban the reported items and their sellers, including all of their items.
+
+    Args:
+        queryset: Item reports to accept.
+
+    Returns:
+        tuple[int, dict[int, str]]: The number of banned reports and an error
+        message per report id that could not be banned.
+    """
+    with transaction.atomic():
+        report_ids = list(queryset.values_list("id", flat=True))
+        success_count, errors = bulk_ban(
+            queryset.model.objects.filter(id__in=report_ids)
+        )
+
+        banned_report_ids = [
+            report_id for report_id in report_ids if report_id not in errors
+        ]
+        seller_ids = Item.objects.filter(
+            aggregated_report__in=banned_report_ids
+        ).values("seller_user_id")
+        User.objects.filter(pk__in=seller_ids).update(is_banned=True)
+        Item.objects.filter(seller_user__in=seller_ids).update(is_banned=True)
+
+    return success_count, errors
+
+
+def unban_users(
+    user_ids: List[int], batch_size: int = 100
+) -> Tuple[int, Dict[int, str]]:
+    """
+    Unban many reported users and their items that don't have active reports.
+
+    Args:
+        user_ids: Ids of the users to unban.
+        batch_size (int): Number of users unbanned per transaction, which
+            bounds how many item rows a single statement locks.
+
+    Returns:
+        tuple[int, dict[int, str]]: The number of unbanned reports and an error
+        message per report id whose user is not banned.
+    """
+    success_count, errors = 0, {}
+    for start in range(0, len(user_ids), batch_size):
+        batch_success_count, batch_errors = bulk_unban(
+            UserReport.objects.filter(
+                user__in=user_ids[start : start + batch_size]
+            )
+        )
+        success_count += batch_success_count
+        errors.update(batch_errors)
+    return success_count, errors
+
+
+def notify_bans(report_model, report_ids: List[int]) -> None:
+    """
+    Send the ban notifications of the given reports over one mail connection,
+    logging a failure instead of failing the ban.
+    """
+    reports = report_model.objects.filter(id__in=report_ids).select_related(
+        *report_model.notify_related
+    )
+    try:
+        report_model.notify_bans(reports)
+    except Exception as e:
+        logger.error(
+            f"Failed to send ban notifications for reports {report_ids}: {repr(e)}"
+        )
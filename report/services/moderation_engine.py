@@ -0,0 +1,101 @@
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from report.models.base_report import ReportStatus
+
+
+def apply_reason_counts(
+    report_model, counts: Dict[int, Dict[str, int]]
+) -> List:
+    """
+    Add reason counts to the reports and run the moderation rules on the result.
+
+    Args:
+        report_model: The report model the counts belong to.
+        counts: Counts to add per counter field, keyed by reported id.
+
+    Returns:
+        list[BaseReport]: The reports as stored after the update.
+    """
+    with transaction.atomic():
+        reports = report_model.add_reason_counts(counts)
+        moderate(report_model, reports, counts)
+    return reports
+
+
+def get_score(report_model, counts: Dict[str, int]) -> int:
+    """
+    Weighted sum of the given reason counts.
+    """
+    weights = settings.REPORT_REASON_WEIGHTS
+    return sum(
+        weights.get(field_name, 1) * counts.get(field_name, 0)
+        for field_name in report_model.get_counter_fields()
+    )
+
+
+def get_next_threshold(report_model, score: int) -> Optional[int]:
+    """
+    The lowest moderation threshold above the given score, if any.
+    """
+    thresholds = [settings.REPORT_REVIEW_SCORE]
+    if report_model.auto_hide:
+        thresholds.append(settings.REPORT_AUTO_HIDE_SCORE)
+    return min(
+        (threshold for threshold in thresholds if threshold > score),
+        default=None,
+    )
+
+
+def moderate(report_model, reports, counts: Dict[int, Dict[str, int]]) -> None:
+    """
+    Flag reports for review or hide their reported instance when their score
+    crosses the configured thresholds.
+
+    The score is computed from the report rows returned by the counter update,
+    so evaluating a report costs no extra queries. Decisions are applied with
+    one update per kind, and only for reports crossing a threshold with this
+    update, so reports past a threshold are not handled twice.
+
+    Args:
+        report_model: The report model of the given reports.
+        reports: The reports as stored after the counter update.
+        counts: The counts added by the update, keyed by reported id.
+    """
+    review_score = settings.REPORT_REVIEW_SCORE
+    hide_score = settings.REPORT_AUTO_HIDE_SCORE
+
+    flag_ids, hide_ids = [], []
+    for report in reports:
+        if report.status != ReportStatus.REVIEWING:
+            continue
+
+        reported_id = getattr(report, f"{report_model.reported_field}_id")
+        score = get_score(
+            report_model,
+            {
+                field_name: getattr(report, field_name)
+                for field_name in report_model.get_counter_fields()
+            },
+        )
+        previous_score = score - get_score(report_model, counts[reported_id])
+
+        crosses_hide_score = (
+            report_model.auto_hide and previous_score < hide_score <= score
+        )
+        if crosses_hide_score:
+            hide_ids.append(reported_id)
+        if not report.is_flagged and (
+            score >= review_score or crosses_hide_score
+        ):
+            report.is_flagged = True
+            flag_ids.append(report.id)
+
+    if flag_ids:
+        report_model.objects.filter(id__in=flag_ids).update(is_flagged=True)
+    if hide_ids:
+        report_model.get_reported_model().objects.filter(
+            pk__in=hide_ids
+        ).update(is_banned=True)
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 from reusable.notification import BanUserEmailSender, BanItemEmailSender
 from user.models.user import User
 
@@ -10,3 +12,13 @@ def send_ban_user_email(user: User, reason: str) -> None:
 def send_ban_item_email(user: User, reason: str) -> None:
     # Send ban item email
     BanItemEmailSender().send_email(user, reason=reason)
+
+
+def send_ban_user_emails(notifications: List[Tuple[User, str]]) -> None:
+    # Send ban user emails over one connection
+    BanUserEmailSender().send_bulk_emails(notifications)
+
+
+def send_ban_item_emails(notifications: List[Tuple[User, str]]) -> None:
+    # Send ban item emails over one connection
+    BanItemEmailSender().send_bulk_emails(notifications)
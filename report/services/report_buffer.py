@@ -0,0 +1,228 @@
+from collections import defaultdict
+from typing import Iterable, List, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from report.services.moderation_engine import (
+    apply_reason_counts,
+    get_next_threshold,
+    get_score,
+)
+
+CACHE_KEY_PREFIX = "report_buffer"
+SEQUENCE_KEY = f"{CACHE_KEY_PREFIX}_sequence"
+FLUSHED_KEY = f"{CACHE_KEY_PREFIX}_flushed"
+FLUSH_LOCK_KEY = f"{CACHE_KEY_PREFIX}_flush_lock"
+FLUSH_LOCK_TIMEOUT = 300
+FOLD_LOCK_TIMEOUT = 60
+STORED_SCORE_TIMEOUT = 3600
+
+BufferEntry = Tuple[str, int, str]
+
+
+def buffer_reason(report_model, reported_id: int, field_name: str) -> None:
+    """
+    Buffer one increment of a report reason counter in the shared cache.
+
+    The weighted score buffered for the reported instance is tracked next
+    to the counters. Its counters are folded into the report table right
+    away once the stored and buffered scores together reach the next
+    moderation threshold, or a counter reaches `REPORT_FLUSH_THRESHOLD`,
+    so moderation isn't delayed until the next periodic flush. The stored
+    score is cached after being read once and updated by every fold. The
+    cache must be shared between processes.
+
+    Args:
+        report_model: The report model the counter belongs to.
+        reported_id (int): Id of the reported instance.
+        field_name (str): Name of the reason counter field.
+    """
+    label = report_model._meta.label_lower
+    entry = (label, reported_id, field_name)
+    value = _increment(_get_counter_key(entry))
+    if value == 1:
+        _register(entry)
+
+    weight = settings.REPORT_REASON_WEIGHTS.get(field_name, 1)
+    buffered_score = _increment(_get_score_key(label, reported_id), weight)
+
+    if value >= settings.REPORT_FLUSH_THRESHOLD or _may_cross_threshold(
+        report_model, reported_id, buffered_score
+    ):
+        fold_entries(
+            (label, reported_id, counter_field)
+            for counter_field in report_model.get_counter_fields()
+        )
+
+
+def flush_report_buffer(batch_size: int = 500) -> int:
+    """
+    Fold every buffered counter into the report tables.
+
+    Args:
+        batch_size (int): Number of buffered counters folded per transaction.
+
+    Returns:
+        int: The number of counters folded, or 0 when another flush is running.
+    """
+    if not cache.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_LOCK_TIMEOUT):
+        return 0
+
+    try:
+        flushed = cache.get(FLUSHED_KEY, 0)
+        last = cache.get(SEQUENCE_KEY, 0)
+        folded = 0
+        for start in range(flushed + 1, last + 1, batch_size):
+            slot_keys = [
+                _get_slot_key(slot)
+                for slot in range(start, min(start + batch_size, last + 1))
+            ]
+            entries = cache.get_many(slot_keys).values()
+            folded += fold_entries(entries)
+            cache.delete_many(slot_keys)
+            cache.set(FLUSHED_KEY, start + len(slot_keys) - 1, timeout=None)
+        return folded
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+def fold_entries(entries: Iterable[BufferEntry]) -> int:
+    """
+    Move the buffered counts of the given counters into the report tables.
+
+    Every counter is claimed with a lock before its count is read, so a
+    count is written by one fold only. Counters claimed by a concurrent
+    fold are skipped; that fold re-registers whatever it leaves behind.
+    Counts are only removed from the cache after they are written, so a
+    failed write keeps them buffered for the next flush.
+
+    Returns:
+        int: The number of counters folded.
+    """
+    lock_keys = {}
+    for entry in set(entries):
+        lock_key = _get_lock_key(entry)
+        if cache.add(lock_key, 1, timeout=FOLD_LOCK_TIMEOUT):
+            lock_keys[entry] = lock_key
+
+    try:
+        return _fold_claimed_entries(list(lock_keys))
+    finally:
+        cache.delete_many(list(lock_keys.values()))
+
+
+def _fold_claimed_entries(entries: List[BufferEntry]) -> int:
+    counter_keys = {entry: _get_counter_key(entry) for entry in entries}
+    values = cache.get_many(list(counter_keys.values()))
+
+    counts = defaultdict(lambda: defaultdict(dict))
+    folded_entries = []
+    for entry, counter_key in counter_keys.items():
+        value = values.get(counter_key, 0)
+        if value > 0:
+            label, reported_id, field_name = entry
+            counts[label][reported_id][field_name] = value
+            folded_entries.append((entry, value))
+
+    with transaction.atomic():
+        reports = {
+            label: apply_reason_counts(apps.get_model(label), model_counts)
+            for label, model_counts in counts.items()
+        }
+
+    for entry, value in folded_entries:
+        # Increments that arrived while folding stay buffered.
+        if cache.decr(counter_keys[entry], value) > 0:
+            _register(entry)
+        label, reported_id, field_name = entry
+        weight = settings.REPORT_REASON_WEIGHTS.get(field_name, 1)
+        _decrement(_get_score_key(label, reported_id), value * weight)
+
+    for label, model_reports in reports.items():
+        _remember_stored_scores(apps.get_model(label), model_reports)
+
+    return len(folded_entries)
+
+
+def _may_cross_threshold(report_model, reported_id: int, buffered_score: int):
+    stored_score = _get_stored_score(report_model, reported_id)
+    threshold = get_next_threshold(report_model, stored_score)
+    return threshold is not None and stored_score + buffered_score >= threshold
+
+
+def _get_stored_score(report_model, reported_id: int) -> int:
+    key = _get_stored_score_key(report_model._meta.label_lower, reported_id)
+    stored_score = cache.get(key)
+    if stored_score is None:
+        counter_fields = report_model.get_counter_fields()
+        counts = (
+            report_model.objects.filter(
+                **{f"{report_model.reported_field}_id": reported_id}
+            )
+            .values(*counter_fields)
+            .first()
+        )
+        stored_score = get_score(report_model, counts or {})
+        cache.set(key, stored_score, timeout=STORED_SCORE_TIMEOUT)
+    return stored_score
+
+
+def _remember_stored_scores(report_model, reports) -> None:
+    label = report_model._meta.label_lower
+    cache.set_many(
+        {
+            _get_stored_score_key(
+                label, getattr(report, f"{report_model.reported_field}_id")
+            ): get_score(
+                report_model,
+                {
+                    field_name: getattr(report, field_name)
+                    for field_name in report_model.get_counter_fields()
+                },
+            )
+            for report in reports
+        },
+        timeout=STORED_SCORE_TIMEOUT,
+    )
+
+
+def _increment(key: str, delta: int = 1) -> int:
+    if cache.add(key, delta, timeout=None):
+        return delta
+    return cache.incr(key, delta)
+
+
+def _decrement(key: str, delta: int) -> None:
+    try:
+        cache.decr(key, delta)
+    except ValueError:
+        pass
+
+
+def _register(entry: BufferEntry) -> None:
+    slot = _increment(SEQUENCE_KEY)
+    cache.set(_get_slot_key(slot), entry, timeout=None)
+
+
+def _get_counter_key(entry: BufferEntry) -> str:
+    label, reported_id, field_name = entry
+    return f"{CACHE_KEY_PREFIX}_{label}_{reported_id}_{field_name}"
+
+
+def _get_score_key(label: str, reported_id: int) -> str:
+    return f"{CACHE_KEY_PREFIX}_{label}_{reported_id}_score"
+
+
+def _get_stored_score_key(label: str, reported_id: int) -> str:
+    return f"{CACHE_KEY_PREFIX}_{label}_{reported_id}_stored_score"
+
+
+def _get_lock_key(entry: BufferEntry) -> str:
+    return f"{_get_counter_key(entry)}_lock"
+
+
+def _get_slot_key(slot: int) -> str:
+    return f"{CACHE_KEY_PREFIX}_slot_{slot}"
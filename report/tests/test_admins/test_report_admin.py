@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from report.models.base_report import ReportStatus
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from user.tests.factories.user_factory import UserFactory
+
+
+class ReportAdminChangelistTests(TestCase):
+    def setUp(self):
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+        self.category = CategoryFactory()
+
+    def create_reports(self, count):
+        for _ in range(count):
+            seller_user = UserFactory()
+            item = ItemFactory(
+                title="Item",
+                seller_user=seller_user,
+                category=self.category,
+                price=1,
+            )
+            ItemReport.objects.create(item=item, spam=1)
+            UserReport.objects.create(user=seller_user, fraud=1)
+
+    def count_changelist_queries(self, url_name):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name), secure=True)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assert_constant_queries(self, url_name):
+        # Arrange
+        self.create_reports(2)
+        queries_for_few_rows = self.count_changelist_queries(url_name)
+        self.create_reports(8)
+
+        # Act
+        queries_for_more_rows = self.count_changelist_queries(url_name)
+
+        # Assert
+        self.assertEqual(queries_for_few_rows, queries_for_more_rows)
+
+    def test_item_report_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:report_itemreport_changelist")
+
+    def test_user_report_changelist_constant_queries(self):
+        self.assert_constant_queries("admin:report_userreport_changelist")
+
+    def test_ban_user_action_reports_result(self):
+        # Arrange
+        self.create_reports(2)
+        accepted_report = ItemReport.objects.first()
+        accepted_report.status = ReportStatus.ACCEPTED
+        accepted_report.save()
+
+        # Act
+        response = self.client.post(
+            reverse("admin:report_itemreport_changelist"),
+            {
+                "action": "ban_user",
+                "_selected_action": list(
+                    ItemReport.objects.values_list("id", flat=True)
+                ),
+            },
+            secure=True,
+            follow=True,
+        )
+
+        # Assert
+        messages = [str(message) for message in response.context["messages"]]
+        self.assertIn(
+            f"Failed to ban the seller of report {accepted_report.id}: "
+            "The report is already accepted.",
+            messages,
+        )
+        self.assertIn(
+            "1 reports have been banned with their sellers successfully.",
+            messages,
+        )
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from report.models.base_report import ReportStatus
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from user.tests.factories.user_factory import UserFactory
+
+
+class IncrementReasonTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=self.user,
+            category=CategoryFactory(),
+            price=1,
+        )
+
+    def test_first_report_creates_row(self):
+        # Act
+        with self.assertNumQueries(1):
+            report = ItemReport.increment_reason(self.item.id, "spam")
+
+        # Assert
+        self.assertEqual(report.item_id, self.item.id)
+        self.assertEqual(report.spam, 1)
+        self.assertEqual(report.fraud, 0)
+        self.assertEqual(report.status, ReportStatus.REVIEWING)
+        self.assertEqual(ItemReport.objects.count(), 1)
+
+    def test_next_reports_increment_counter(self):
+        # Arrange
+        ItemReport.increment_reason(self.item.id, "spam")
+
+        # Act
+        ItemReport.increment_reason(self.item.id, "spam")
+        report = ItemReport.increment_reason(self.item.id, "price_issue")
+
+        # Assert
+        self.assertEqual(report.spam, 2)
+        self.assertEqual(report.price_issue, 1)
+        self.assertEqual(ItemReport.objects.get().spam, 2)
+
+    def test_total_reports_follows_counters(self):
+        # Arrange
+        ItemReport.increment_reason(self.item.id, "spam")
+        ItemReport.increment_reason(self.item.id, "responsiveness_issue")
+
+        # Act
+        report = ItemReport.increment_reason(self.item.id, "other")
+
+        # Assert
+        self.assertEqual(report.total_reports, 3)
+        self.assertEqual(ItemReport.objects.get().total_reports, 3)
+
+    def test_user_report_increment(self):
+        # Act
+        report = UserReport.increment_reason(self.user.pk, "fraud")
+
+        # Assert
+        self.assertEqual(report.user_id, self.user.pk)
+        self.assertEqual(report.fraud, 1)
+
+
+class ConcurrentIncrementReasonTests(TransactionTestCase):
+    REPORT_COUNT = 20
+
+    def test_parallel_reports_on_one_item(self):
+        # Arrange
+        item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=CategoryFactory(),
+            price=1,
+        )
+
+        def report():
+            try:
+                ItemReport.increment_reason(item.id, "spam")
+            finally:
+                connection.close()
+
+        # Act
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(report) for _ in range(self.REPORT_COUNT)
+            ]
+            for future in futures:
+                future.result()
+
+        # Assert
+        self.assertEqual(ItemReport.objects.count(), 1)
+        self.assertEqual(ItemReport.objects.get().spam, self.REPORT_COUNT)
@@ -0,0 +1,205 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.test import TestCase
+
+from product.models.item import Item
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from report.models.base_report import ReportStatus
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from report.services.ban_service import (
+    bulk_ban,
+    bulk_ban_sellers,
+    bulk_unban,
+    unban_users,
+)
+from user.models.user import User
+from user.tests.factories.user_factory import UserFactory
+
+
+class BanServiceTestCase(TestCase):
+    def setUp(self):
+        self.category = CategoryFactory()
+        self.seller_user = UserFactory()
+
+    def create_item(self, seller_user=None, **kwargs):
+        return ItemFactory(
+            title="Item",
+            seller_user=seller_user or self.seller_user,
+            category=self.category,
+            price=1,
+            **kwargs,
+        )
+
+
+class BulkBanTests(BanServiceTestCase):
+    def test_ban_item_reports(self):
+        # Arrange
+        items = [self.create_item() for _ in range(3)]
+        for item in items:
+            ItemReport.objects.create(item=item, spam=1)
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            success_count, errors = bulk_ban(ItemReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 3)
+        self.assertEqual(errors, {})
+        self.assertEqual(Item.objects.filter(is_banned=True).count(), 3)
+        self.assertFalse(
+            ItemReport.objects.exclude(status=ReportStatus.ACCEPTED).exists()
+        )
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_ban_notifications_share_one_connection(self):
+        # Arrange
+        for _ in range(3):
+            ItemReport.objects.create(item=self.create_item(), spam=1)
+
+        # Act
+        with patch(
+            "reusable.notification.get_connection", wraps=get_connection
+        ) as mock_get_connection:
+            with self.captureOnCommitCallbacks(execute=True):
+                bulk_ban(ItemReport.objects.all())
+
+        # Assert
+        mock_get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_ban_survives_failed_notifications(self):
+        # Arrange
+        ItemReport.objects.create(item=self.create_item(), spam=1)
+
+        # Act
+        with patch("reusable.notification.get_connection", side_effect=OSError):
+            with self.captureOnCommitCallbacks(execute=True):
+                success_count, _ = bulk_ban(ItemReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 1)
+        self.assertEqual(Item.objects.filter(is_banned=True).count(), 1)
+
+    def test_ban_reports_errors_for_accepted_reports(self):
+        # Arrange
+        report = ItemReport.objects.create(
+            item=self.create_item(), spam=1, status=ReportStatus.ACCEPTED
+        )
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            success_count, errors = bulk_ban_sellers(ItemReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 0)
+        self.assertEqual(errors, {report.id: "The report is already accepted."})
+        self.assertFalse(User.objects.filter(is_banned=True).exists())
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_ban_queries_do_not_grow_with_reports(self):
+        # Arrange
+        for _ in range(10):
+            ItemReport.objects.create(item=self.create_item(), spam=1)
+
+        # Assert
+        with self.assertNumQueries(5):
+            # Act
+            bulk_ban(ItemReport.objects.all())
+
+    def test_ban_user_reports_bans_their_items(self):
+        # Arrange
+        self.create_item()
+        UserReport.objects.create(user=self.seller_user, fraud=1)
+
+        # Act
+        success_count, _ = bulk_ban(UserReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 1)
+        self.seller_user.refresh_from_db()
+        self.assertTrue(self.seller_user.is_banned)
+        self.assertFalse(Item.objects.filter(is_banned=False).exists())
+
+
+class BulkUnbanTests(BanServiceTestCase):
+    def test_unban_reports_errors_for_not_banned(self):
+        # Arrange
+        banned_report = ItemReport.objects.create(
+            item=self.create_item(is_banned=True), spam=1
+        )
+        not_banned_report = ItemReport.objects.create(
+            item=self.create_item(), spam=1
+        )
+
+        # Act
+        success_count, errors = bulk_unban(ItemReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 1)
+        self.assertEqual(list(errors), [not_banned_report.id])
+        banned_report.refresh_from_db()
+        self.assertEqual(banned_report.status, ReportStatus.REJECTED)
+        self.assertFalse(banned_report.item.is_banned)
+
+    def test_unban_user_keeps_items_with_active_reports(self):
+        # Arrange
+        self.seller_user.is_banned = True
+        self.seller_user.save()
+        reported_item = self.create_item(is_banned=True)
+        clean_item = self.create_item(is_banned=True)
+        ItemReport.objects.create(item=reported_item, spam=1)
+        UserReport.objects.create(user=self.seller_user, fraud=1)
+
+        # Act
+        success_count, errors = bulk_unban(UserReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 1)
+        self.assertEqual(errors, {})
+        self.assertTrue(Item.objects.get(id=reported_item.id).is_banned)
+        self.assertFalse(Item.objects.get(id=clean_item.id).is_banned)
+        self.assertFalse(User.objects.get(pk=self.seller_user.pk).is_banned)
+
+
+class UnbanUsersTests(BanServiceTestCase):
+    def test_unban_users_in_batches(self):
+        # Arrange
+        users = [UserFactory(is_banned=True) for _ in range(3)]
+        for user in users:
+            self.create_item(seller_user=user, is_banned=True)
+            UserReport.objects.create(user=user, fraud=1)
+        not_banned_report = UserReport.objects.create(
+            user=self.seller_user, fraud=1
+        )
+
+        # Act
+        success_count, errors = unban_users(
+            [user.pk for user in users] + [self.seller_user.pk],
+            batch_size=2,
+        )
+
+        # Assert
+        self.assertEqual(success_count, 3)
+        self.assertEqual(list(errors), [not_banned_report.id])
+        self.assertFalse(User.objects.filter(is_banned=True).exists())
+        self.assertFalse(Item.objects.filter(is_banned=True).exists())
+
+
+class BulkBanSellersTests(BanServiceTestCase):
+    def test_ban_sellers_bans_all_their_items(self):
+        # Arrange
+        reported_item = self.create_item()
+        other_item = self.create_item()
+        ItemReport.objects.create(item=reported_item, spam=1)
+
+        # Act
+        success_count, _ = bulk_ban_sellers(ItemReport.objects.all())
+
+        # Assert
+        self.assertEqual(success_count, 1)
+        self.assertTrue(User.objects.get(pk=self.seller_user.pk).is_banned)
+        self.assertTrue(Item.objects.get(id=other_item.id).is_banned)
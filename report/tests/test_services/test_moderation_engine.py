@@ -0,0 +1,86 @@
+from django.test import TestCase, override_settings
+
+from product.models.item import Item
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from report.models.base_report import ReportStatus
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from report.services.moderation_engine import apply_reason_counts
+from user.models.user import User
+from user.tests.factories.user_factory import UserFactory
+
+
+@override_settings(
+    REPORT_REASON_WEIGHTS={"spam": 1, "illegal": 5},
+    REPORT_REVIEW_SCORE=3,
+    REPORT_AUTO_HIDE_SCORE=10,
+)
+class ModerationEngineTests(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=self.user,
+            category=CategoryFactory(),
+            price=1,
+        )
+
+    def report_item(self, field_name, count=1):
+        return apply_reason_counts(
+            ItemReport, {self.item.id: {field_name: count}}
+        )[0]
+
+    def test_low_score_takes_no_action(self):
+        # Act
+        report = self.report_item("spam", 2)
+
+        # Assert
+        self.assertFalse(report.is_flagged)
+        self.assertFalse(Item.objects.get(id=self.item.id).is_banned)
+
+    def test_review_score_flags_report(self):
+        # Act
+        self.report_item("spam", 2)
+        self.report_item("spam")
+
+        # Assert
+        self.assertTrue(ItemReport.objects.get().is_flagged)
+        self.assertFalse(Item.objects.get(id=self.item.id).is_banned)
+
+    def test_hide_score_bans_item(self):
+        # Act
+        self.report_item("illegal")
+        self.report_item("illegal")
+
+        # Assert
+        self.assertTrue(ItemReport.objects.get().is_flagged)
+        self.assertTrue(Item.objects.get(id=self.item.id).is_banned)
+
+    def test_evaluation_adds_no_queries_below_thresholds(self):
+        # Arrange
+        self.report_item("spam")
+
+        # Assert: savepoint, upsert and savepoint release only
+        with self.assertNumQueries(3):
+            # Act
+            self.report_item("spam")
+
+    def test_rejected_report_is_not_hidden_again(self):
+        # Arrange
+        self.report_item("spam")
+        ItemReport.objects.update(status=ReportStatus.REJECTED)
+
+        # Act
+        self.report_item("illegal", 2)
+
+        # Assert
+        self.assertFalse(Item.objects.get(id=self.item.id).is_banned)
+
+    def test_user_reports_are_only_flagged(self):
+        # Act
+        apply_reason_counts(UserReport, {self.user.pk: {"illegal": 3}})
+
+        # Assert
+        self.assertTrue(UserReport.objects.get().is_flagged)
+        self.assertFalse(User.objects.get(pk=self.user.pk).is_banned)
@@ -0,0 +1,178 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from report.models.item_report import ItemReport
+from report.models.user_report import UserReport
+from report.serializers.item_report_serializer import ItemReportSerializer
+from report.services.report_buffer import (
+    _get_lock_key,
+    buffer_reason,
+    fold_entries,
+    flush_report_buffer,
+)
+from user.tests.factories.user_factory import UserFactory
+
+
+@override_settings(
+    REPORT_WRITE_BEHIND=True,
+    REPORT_FLUSH_THRESHOLD=5,
+    REPORT_REVIEW_SCORE=1000,
+    REPORT_AUTO_HIDE_SCORE=1000,
+)
+class ReportBufferTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=self.user,
+            category=CategoryFactory(),
+            price=1,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_serializer_buffers_without_writing(self):
+        # Arrange
+        serializer = ItemReportSerializer(
+            data={"item": self.item.id, "reason_id": 8}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        # Act
+        serializer.save()
+
+        # Assert
+        self.assertFalse(ItemReport.objects.exists())
+
+    def test_flush_folds_buffered_counters(self):
+        # Arrange
+        buffer_reason(ItemReport, self.item.id, "spam")
+        buffer_reason(ItemReport, self.item.id, "spam")
+        buffer_reason(ItemReport, self.item.id, "fraud")
+        buffer_reason(UserReport, self.user.pk, "other")
+
+        # Act
+        folded = flush_report_buffer()
+
+        # Assert
+        self.assertEqual(folded, 3)
+        report = ItemReport.objects.get(item=self.item)
+        self.assertEqual(report.spam, 2)
+        self.assertEqual(report.fraud, 1)
+        self.assertEqual(UserReport.objects.get(user=self.user).other, 1)
+
+    def test_flush_twice_does_not_double_count(self):
+        # Arrange
+        buffer_reason(ItemReport, self.item.id, "spam")
+        flush_report_buffer()
+
+        # Act
+        folded = flush_report_buffer()
+        buffer_reason(ItemReport, self.item.id, "spam")
+        flush_report_buffer()
+
+        # Assert
+        self.assertEqual(folded, 0)
+        self.assertEqual(ItemReport.objects.get(item=self.item).spam, 2)
+
+    def test_threshold_folds_immediately(self):
+        # Act
+        for _ in range(5):
+            buffer_reason(ItemReport, self.item.id, "illegal")
+
+        # Assert
+        self.assertEqual(ItemReport.objects.get(item=self.item).illegal, 5)
+        self.assertEqual(flush_report_buffer(), 0)
+
+    def test_fold_skips_counters_claimed_by_another_fold(self):
+        # Arrange
+        entry = ("report.itemreport", self.item.id, "spam")
+        buffer_reason(ItemReport, self.item.id, "spam")
+        cache.add(_get_lock_key(entry), 1)
+
+        # Act
+        folded = fold_entries([entry])
+
+        # Assert
+        self.assertEqual(folded, 0)
+        self.assertFalse(ItemReport.objects.exists())
+
+    def test_threshold_and_flush_do_not_double_count(self):
+        # Arrange
+        for _ in range(4):
+            buffer_reason(ItemReport, self.item.id, "illegal")
+
+        # Act
+        for _ in range(3):
+            buffer_reason(ItemReport, self.item.id, "illegal")
+        flush_report_buffer()
+
+        # Assert
+        self.assertEqual(ItemReport.objects.get(item=self.item).illegal, 7)
+
+
+@override_settings(
+    REPORT_WRITE_BEHIND=True,
+    REPORT_FLUSH_THRESHOLD=20,
+    REPORT_REVIEW_SCORE=5,
+    REPORT_AUTO_HIDE_SCORE=15,
+)
+class ReportBufferScoreTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.item = ItemFactory(
+            title="Item",
+            seller_user=UserFactory(),
+            category=CategoryFactory(),
+            price=1,
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_buffers_below_review_score(self):
+        # Act
+        for _ in range(4):
+            buffer_reason(ItemReport, self.item.id, "spam")
+
+        # Assert
+        self.assertFalse(ItemReport.objects.exists())
+
+    def test_folds_when_weighted_score_reaches_review_score(self):
+        # Act
+        buffer_reason(ItemReport, self.item.id, "spam")
+        buffer_reason(ItemReport, self.item.id, "spam")
+        buffer_reason(ItemReport, self.item.id, "fraud")
+
+        # Assert
+        report = ItemReport.objects.get(item=self.item)
+        self.assertEqual((report.spam, report.fraud), (2, 1))
+        self.assertTrue(report.is_flagged)
+
+    def test_hides_item_once_weighted_score_reaches_hide_score(self):
+        # Act
+        for _ in range(3):
+            buffer_reason(ItemReport, self.item.id, "illegal")
+
+        # Assert
+        self.item.refresh_from_db()
+        self.assertTrue(self.item.is_banned)
+        self.assertEqual(ItemReport.objects.get(item=self.item).illegal, 3)
+
+    def test_buffers_again_between_thresholds(self):
+        # Arrange
+        buffer_reason(ItemReport, self.item.id, "illegal")
+
+        # Act
+        for _ in range(9):
+            buffer_reason(ItemReport, self.item.id, "spam")
+
+        # Assert
+        report = ItemReport.objects.get(item=self.item)
+        self.assertEqual((report.illegal, report.spam), (1, 0))
+        self.item.refresh_from_db()
+        self.assertFalse(self.item.is_banned)
@@ -0,0 +1,263 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_CACHE_KEY_PREFIX = "compressed"
+BREACH_MAX_RANDOM_BYTES = 100
+
+# Arguments in the order of the timing fields of `RequestTimingMiddleware`.
+TIMING_LOG_FORMAT = (
+    "request_timing url_name=%s method=%s status=%s queries=%s db_ms=%s "
+    "serializer_ms=%s render_ms=%s total_ms=%s"
+)
+
+
+def get_accepted_encodings(request) -> Set[str]:
+    """
+    Content codings the client accepts, ignoring those with `q=0`.
+    """
+    encodings = set()
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, *params = [value.strip() for value in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            encodings.add(coding.lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with Brotli, when installed and accepted, or gzip.
+
+    Only non-streaming responses of at least `COMPRESSION_MIN_SIZE` bytes
+    whose content type starts with one of `COMPRESSION_CONTENT_TYPES` are
+    compressed, so already compressed formats such as JPEG or WebP are
+    passed through untouched.
+
+    Views serving immutable content can set `compression_cache_key` on the
+    response. The compressed body is then cached under that key, so hot
+    responses are compressed once, with the highest Brotli quality.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.compress(request, response)
+
+    def compress(self, request, response):
+        if not self.is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        # HTML pages may embed secrets such as CSRF tokens. Like Django's
+        # GZipMiddleware, they are only gzipped with random padding to
+        # mitigate BREACH, and never compressed with Brotli.
+        is_html = (
+            response.get("Content-Type", "").lower().startswith("text/html")
+        )
+        encoding = self.choose_encoding(request, allow_brotli=not is_html)
+        if encoding is None:
+            return response
+
+        cache_key = getattr(response, "compression_cache_key", None)
+        if cache_key:
+            cache_key = f"{COMPRESSION_CACHE_KEY_PREFIX}_{encoding}_{cache_key}"
+            content = cache.get(cache_key)
+            if content is None:
+                content = self.encode(response.content, encoding, cached=True)
+                cache.set(
+                    cache_key,
+                    content,
+                    timeout=settings.COMPRESSION_CACHE_TIMEOUT,
+                )
+        else:
+            content = self.encode(response.content, encoding, padded=is_html)
+
+        # Keep the original body when compression doesn't pay off.
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response.headers["Content-Length"] = str(len(content))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def is_compressible(response) -> bool:
+        if response.streaming or response.has_header("Content-Encoding"):
+            return False
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return False
+        content_type = response.get("Content-Type", "").lower()
+        return content_type.startswith(settings.COMPRESSION_CONTENT_TYPES)
+
+    @staticmethod
+    def choose_encoding(request, allow_brotli: bool = True) -> Optional[str]:
+        accepted = get_accepted_encodings(request)
+        if (
+            allow_brotli
+            and brotli is not None
+            and settings.COMPRESSION_BROTLI
+            and "br" in accepted
+        ):
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    @staticmethod
+    def encode(
+        content: bytes,
+        encoding: str,
+        cached: bool = False,
+        padded: bool = False,
+    ) -> bytes:
+        if encoding == "br":
+            quality = 11 if cached else settings.COMPRESSION_BROTLI_QUALITY
+            return brotli.compress(content, quality=quality)
+        return compress_string(
+            content,
+            max_random_bytes=BREACH_MAX_RANDOM_BYTES if padded else None,
+        )
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper counting the queries of a request and the time
+    spent running them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+@contextmanager
+def record_serializer_time(request):
+    """
+    Add the time spent in the block to the serializer time of the request
+    reported by `RequestTimingMiddleware`.
+
+    Accepts Django and DRF requests, or None outside of a request.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        # DRF requests only proxy reads to the wrapped Django request.
+        request = getattr(request, "_request", request)
+        if request is not None:
+            request.serializer_duration = getattr(
+                request, "serializer_duration", 0.0
+            ) + (time.perf_counter() - start)
+
+
+class RequestTimingMiddleware:
+    """
+    Record the query count, database time, serializer time, render time and
+    total time of every request.
+
+    The measurements are added to the response as a `Server-Timing` header
+    when `REQUEST_TIMING_HEADER` is enabled, and logged as one structured
+    line keyed by the URL name of the request. Requests running more than
+    `REQUEST_QUERY_BUDGET` queries are logged as warnings, which surfaces
+    N+1 query patterns per endpoint.
+
+    The serializer time covers the blocks wrapped in
+    `record_serializer_time`, such as list serializers, including the
+    queries they run. The render time covers rendering the response body,
+    such as the JSON encoding of DRF responses.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        request.serializer_duration = 0.0
+        request.render_duration = 0.0
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        total = time.perf_counter() - start
+
+        self.report(request, response, recorder, total)
+        return response
+
+    def process_template_response(self, request, response):
+        render_start = time.perf_counter()
+
+        def record_render(_):
+            request.render_duration = time.perf_counter() - render_start
+
+        response.add_post_render_callback(record_render)
+        return response
+
+    def report(self, request, response, recorder: QueryRecorder, total: float):
+        resolver_match = getattr(request, "resolver_match", None)
+        url_name = (
+            resolver_match.view_name if resolver_match else None
+        ) or "unresolved"
+        timing = {
+            "url_name": url_name,
+            "method": request.method,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(recorder.duration * 1000, 2),
+            "serializer_ms": round(request.serializer_duration * 1000, 2),
+            "render_ms": round(request.render_duration * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+        }
+
+        if settings.REQUEST_TIMING_HEADER:
+            response.headers["Server-Timing"] = ", ".join(
+                [
+                    f'db;dur={timing["db_ms"]};desc="{recorder.count} queries"',
+                    f'serializer;dur={timing["serializer_ms"]}',
+                    f'render;dur={timing["render_ms"]}',
+                    f'total;dur={timing["total_ms"]}',
+                ]
+            )
+
+        # The fields are written into the message as well, since the log
+        # formatters only output the message.
+        if recorder.count > settings.REQUEST_QUERY_BUDGET:
+            logger.warning(
+                TIMING_LOG_FORMAT + " query_budget=%s over_budget=true",
+                *timing.values(),
+                settings.REQUEST_QUERY_BUDGET,
+                extra=timing,
+            )
+        else:
+            logger.info(TIMING_LOG_FORMAT, *timing.values(), extra=timing)
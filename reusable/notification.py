@@ -2,10 +2,10 @@ import random
 import string
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 from django.conf import settings
-from django.core.mail import EmailMessage
+from django.core.mail import EmailMessage, get_connection
 from django.utils import timezone
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -54,20 +54,42 @@ class EmailSender(metaclass=SingletonABCMeta):
         Template method for sending emails.
         It defines the common steps while allowing customization through hooks.
         """
-        subject = self.get_subject()
-        message = self.get_message(user, reason)
+        try:
+            self.send_with_retry(self.build_email(user, reason))
+
+        except Exception:
+            raise EmailCanNotBeSentException()
+
+    def send_bulk_emails(
+        self, recipients: Iterable[Tuple[User, Optional[str]]]
+    ) -> int:
+        """
+        Send one email per given user and reason over a single connection.
+
+        Unlike `send_email`, failed sends are not retried, so a slow mail
+        server can't stall the caller for each recipient.
+
+        Returns:
+            int: The number of emails sent.
+        """
+        emails = [self.build_email(user, reason) for user, reason in recipients]
+        if not emails:
+            return 0
 
         try:
-            email = self.prepare_email_message(
-                subject=subject,
-                message=message,
-                recipient_email=user.email,
-            )
-            self.send_with_retry(email)
+            with get_connection() as mail_connection:
+                return mail_connection.send_messages(emails) or 0
 
         except Exception:
             raise EmailCanNotBeSentException()
 
+    def build_email(self, user: User, reason: Optional[str]) -> EmailMessage:
+        return self.prepare_email_message(
+            subject=self.get_subject(),
+            message=self.get_message(user, reason),
+            recipient_email=user.email,
+        )
+
     @abstractmethod
     def get_subject(self) -> str:
         """
@@ -0,0 +1,81 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import parse_header_parameters
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _require_orjson() -> None:
+    if orjson is None:
+        raise ImproperlyConfigured(
+            "The orjson package is required when FAST_JSON is enabled."
+        )
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    """
+    JSON renderer backed by orjson, producing the same output as DRF's
+    compact `JSONRenderer` with `UNICODE_JSON`.
+
+    Text is written as UTF-8 without `\\u` escaping, so Persian messages stay
+    readable. Values orjson doesn't handle natively, such as Decimals, lazy
+    translation strings and datetimes, are converted by DRF's encoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    encoder = JSONEncoder()
+
+    def __init__(self):
+        _require_orjson()
+        # Datetimes are passed to DRF's encoder to keep its ISO 8601 format.
+        self.options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.encoder.default, option=options)
+
+        # Escape the JavaScript line terminators, as DRF's renderer does.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+    @staticmethod
+    def get_indent(accepted_media_type, renderer_context) -> bool:
+        if accepted_media_type:
+            _, params = parse_header_parameters(accepted_media_type)
+            if params.get("indent"):
+                return True
+        return bool((renderer_context or {}).get("indent"))
+
+
+class ORJSONParser(BaseParser):
+    """
+    JSON parser backed by orjson.
+    """
+
+    media_type = "application/json"
+    renderer_class = ORJSONRenderer
+
+    def __init__(self):
+        _require_orjson()
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,76 @@
+from typing import Dict, Optional, Set
+
+from rest_framework import serializers
+
+from reusable.middleware import record_serializer_time
+
+
+def parse_requested_fields(
+    request, views: Optional[Dict[str, Set[str]]] = None
+) -> Optional[Set[str]]:
+    """
+    Parse the sparse fieldset requested by a request.
+
+    The fieldset is the comma separated `fields` query parameter, plus the
+    fields of the named `view` query parameter when it is one of `views`.
+
+    Returns:
+        Optional[set[str]]: The requested field names, or None when all
+        fields should be returned.
+    """
+    if request is None:
+        return None
+    value = request.query_params.get("fields", "")
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+
+    view = request.query_params.get("view")
+    if views and view in views:
+        requested |= views[view]
+    return requested or None
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin limiting the output to a requested subset of fields.
+
+    The subset is read from the `fields` context key, or else from the
+    `fields` and `view` query parameters of the request in the context,
+    where `views` maps view names to predefined fieldsets. Unknown names
+    are ignored, and when no known field remains every field is returned.
+    Dropped fields are never evaluated, so their method fields cost nothing.
+    """
+
+    views: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def get_request_fields(cls, request) -> Optional[Set[str]]:
+        return parse_requested_fields(request, cls.views)
+
+    def get_requested_fields(self) -> Optional[Set[str]]:
+        if "fields" in self.context:
+            return self.context["fields"]
+        return self.get_request_fields(self.context.get("request"))
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.get_requested_fields()
+        if requested and requested & fields.keys():
+            fields = {
+                name: field
+                for name, field in fields.items()
+                if name in requested
+            }
+        return fields
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    """
+    List serializer reporting its serialization time to
+    `RequestTimingMiddleware`.
+
+    Use it as the `list_serializer_class` of serializers that render lists.
+    """
+
+    def to_representation(self, data):
+        with record_serializer_time(self.context.get("request")):
+            return super().to_representation(data)
@@ -0,0 +1,225 @@
+import gzip
+import json
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+from rest_framework.request import Request
+
+from product.tests.factories.category_factory import CategoryFactory
+from product.tests.factories.item_factory import ItemFactory
+from user.tests.factories.user_factory import UserFactory
+
+from reusable.middleware import (
+    CompressionMiddleware,
+    brotli,
+    get_accepted_encodings,
+    record_serializer_time,
+)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=100)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.body = json.dumps(
+            [{"title": "آیتم", "description": "x" * 20}] * 20
+        ).encode()
+
+    def tearDown(self):
+        cache.clear()
+
+    def process(self, response, accept_encoding="gzip"):
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda _: response)(request)
+
+    def test_compresses_json_with_gzip(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json")
+        )
+
+        # Assert
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertLess(len(response.content), len(self.body))
+
+    def test_skips_small_responses(self):
+        # Act
+        response = self.process(
+            HttpResponse(b"{}", content_type="application/json")
+        )
+
+        # Assert
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_skips_already_compressed_images(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="image/jpeg")
+        )
+
+        # Assert
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, self.body)
+
+    def test_skips_when_client_does_not_accept_encoding(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json"),
+            accept_encoding="gzip;q=0, identity",
+        )
+
+        # Assert
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @skipUnless(brotli, "brotli is not installed")
+    def test_prefers_brotli(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json"),
+            accept_encoding="gzip, br",
+        )
+
+        # Assert
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.body)
+
+    def test_pads_html_and_skips_brotli(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="text/html; charset=utf-8"),
+            accept_encoding="gzip, br",
+        )
+
+        # Assert
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        # The random padding is stored as the gzip file name.
+        self.assertTrue(response.content[3] & gzip.FNAME)
+
+    def test_does_not_pad_json(self):
+        # Act
+        response = self.process(
+            HttpResponse(self.body, content_type="application/json")
+        )
+
+        # Assert
+        self.assertFalse(response.content[3] & gzip.FNAME)
+
+    def test_caches_compressed_body_by_key(self):
+        # Arrange
+        first = HttpResponse(self.body, content_type="image/svg+xml")
+        first.compression_cache_key = "image_hash"
+        self.process(first)
+        second = HttpResponse(self.body, content_type="image/svg+xml")
+        second.compression_cache_key = "image_hash"
+
+        # Act
+        response = self.process(second)
+
+        # Assert
+        self.assertEqual(
+            response.content, cache.get("compressed_gzip_image_hash")
+        )
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+
+class GetAcceptedEncodingsTests(SimpleTestCase):
+    def test_parses_quality_values(self):
+        # Arrange
+        request = RequestFactory().get(
+            "/", HTTP_ACCEPT_ENCODING="gzip;q=0.5, br;q=0, deflate"
+        )
+
+        # Act & Assert
+        self.assertEqual(get_accepted_encodings(request), {"gzip", "deflate"})
+
+
+@override_settings(REQUEST_TIMING_HEADER=True, REQUEST_QUERY_BUDGET=20)
+class RequestTimingMiddlewareTests(TestCase):
+    def test_adds_server_timing_header(self):
+        # Act
+        with self.assertLogs("reusable.middleware", level="INFO") as logs:
+            response = self.client.get(reverse("item-list-all"), secure=True)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="[1-9]\d* queries", '
+            r"serializer;dur=[\d.]+, render;dur=[\d.]+, total;dur=[\d.]+$",
+        )
+        record = logs.records[0]
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.url_name, "item-list-all")
+        self.assertGreater(record.queries, 0)
+        self.assertGreater(record.render_ms, 0)
+        self.assertRegex(
+            record.getMessage(),
+            r"^request_timing url_name=item-list-all method=GET status=200 "
+            r"queries=\d+ db_ms=[\d.]+ serializer_ms=[\d.]+ render_ms=[\d.]+ "
+            r"total_ms=[\d.]+$",
+        )
+
+    def test_records_serializer_time(self):
+        # Arrange
+        ItemFactory(
+            seller_user=UserFactory(), category=CategoryFactory(), price=100
+        )
+
+        # Act
+        with self.assertLogs("reusable.middleware", level="INFO") as logs:
+            self.client.get(reverse("item-list-all"), secure=True)
+
+        # Assert
+        self.assertGreater(logs.records[0].serializer_ms, 0)
+
+    @override_settings(REQUEST_QUERY_BUDGET=0)
+    def test_warns_over_query_budget(self):
+        # Act
+        with self.assertLogs("reusable.middleware", level="WARNING") as logs:
+            self.client.get(reverse("item-list-all"), secure=True)
+
+        # Assert
+        self.assertIn(
+            "query_budget=0 over_budget=true", logs.records[0].getMessage()
+        )
+
+    @override_settings(REQUEST_TIMING_HEADER=False)
+    def test_header_disabled(self):
+        # Act
+        with self.assertLogs("reusable.middleware", level="INFO"):
+            response = self.client.get(reverse("item-list-all"), secure=True)
+
+        # Assert
+        self.assertFalse(response.has_header("Server-Timing"))
+
+
+class RecordSerializerTimeTests(SimpleTestCase):
+    def test_adds_time_to_wrapped_django_request(self):
+        # Arrange
+        http_request = RequestFactory().get("/")
+        http_request.serializer_duration = 0.0
+
+        # Act
+        with record_serializer_time(Request(http_request)):
+            pass
+        with record_serializer_time(http_request):
+            pass
+
+        # Assert
+        self.assertGreater(http_request.serializer_duration, 0)
+
+    def test_ignores_missing_request(self):
+        # Act & Assert
+        with record_serializer_time(None):
+            pass
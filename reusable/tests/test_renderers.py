@@ -0,0 +1,63 @@
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from product.exceptions import ItemNotFoundException
+from reusable.renderers import ORJSONParser, ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def setUp(self):
+        self.data = {
+            "detail": ItemNotFoundException.default_detail,
+            "lazy": gettext_lazy("This field is required."),
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            "price": Decimal("10.50"),
+            "results": {1: "ok", 2: "banned item."},
+            "separator": "a\u2028b",
+            "items": [{"id": 1, "is_banned": False, "image_ids": []}],
+        }
+
+    def test_same_output_as_json_renderer(self):
+        # Act
+        rendered = ORJSONRenderer().render(self.data)
+
+        # Assert
+        self.assertEqual(rendered, JSONRenderer().render(self.data))
+
+    def test_persian_text_is_not_escaped(self):
+        # Act
+        rendered = ORJSONRenderer().render(
+            {"detail": ItemNotFoundException.default_detail}
+        )
+
+        # Assert
+        self.assertIn(
+            ItemNotFoundException.default_detail.encode("utf-8"), rendered
+        )
+
+    def test_render_none(self):
+        # Act & Assert
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def test_parse(self):
+        # Arrange
+        stream = io.BytesIO('{"comment": "سلام", "item_id": 1}'.encode())
+
+        # Act
+        data = ORJSONParser().parse(stream)
+
+        # Assert
+        self.assertEqual(data, {"comment": "سلام", "item_id": 1})
+
+    def test_parse_invalid_json(self):
+        # Act & Assert
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{invalid"))